@@ -0,0 +1,63 @@
+"""
+benchmark allocation and time for one extraction pass over a game feed
+
+run from the repo root; to compare against an older tree, put that tree's
+crackerjack first on the path, e.g.
+`PYTHONPATH=/path/to/old/checkout python benchmarks/bench_extractors.py`
+"""
+
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+from crackerjack.extractors_boxscore import (
+    extract_boxscore_batter,
+    extract_boxscore_pitcher,
+    extract_info_box,
+    extract_info_team,
+)
+from crackerjack.tools_mlbapi import extract_linescore_innings
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "fixtures")
+_FIXTURE_DEFAULT = os.path.join(_FIXTURES_DIR, "123457.json")  # a 12-inning game
+
+
+def run_extractors(data_game: dict):
+    """extract everything do_box needs from a game feed, once"""
+    extract_linescore_innings(data_game)
+    extract_boxscore_batter(data_game)
+    extract_boxscore_pitcher(data_game)
+    extract_info_team(data_game, True)
+    extract_info_team(data_game, False)
+    extract_info_box(data_game)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("feed", nargs="?", default=_FIXTURE_DEFAULT)
+    parser.add_argument("-n", "--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(args.feed, "r") as feed_file:
+        data_game = json.load(feed_file)
+
+    run_extractors(data_game)  # warm up
+
+    tracemalloc.start()
+    run_extractors(data_game)
+    _, size_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    time_start = time.perf_counter()
+    for _ in range(args.repeat):
+        run_extractors(data_game)
+    time_per_pass = (time.perf_counter() - time_start) / args.repeat
+
+    print("peak allocation per pass: %.1f KiB" % (size_peak / 1024))
+    print("time per pass: %.0f us" % (time_per_pass * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+benchmark the memory a season's worth of box score records takes
+
+run from the repo root; to compare against an older tree, put that tree's
+crackerjack first on the path, e.g.
+`PYTHONPATH=/path/to/old/checkout python benchmarks/bench_records.py`
+"""
+
+import random
+import tracemalloc
+
+from crackerjack.tools_boxscore import BoxScoreBatter, BoxScorePitcher
+from crackerjack.tools_linescore import LineScoreInning
+from crackerjack.tools_mlbapi import Team
+
+try:  # the array containers don't exist in older trees
+    from crackerjack.tools_boxscore import BoxScoreBatterArray, BoxScorePitcherArray
+except ImportError:
+    BoxScoreBatterArray = BoxScorePitcherArray = None
+
+_GAMES_SEASON = 2430  # regular season games, league-wide
+_COUNT_BATTERS = _GAMES_SEASON * 2 * 13  # batter lines, roughly
+_COUNT_PITCHERS = _GAMES_SEASON * 2 * 4  # pitcher lines, roughly
+_COUNT_INNINGS = _GAMES_SEASON * 9
+_COUNT_TEAMS = _GAMES_SEASON * 2  # one pair per linescore
+
+_NAMES = ["Last%03d" % i for i in range(1500)]
+
+
+def measure(build, count: int, label: str):
+    """build something with tracemalloc on, print what it took per item"""
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        "%-14s %7d: %6.1f MiB (%3.0f B each)"
+        % (label, count, size / 2**20, size / count)
+    )
+    return built
+
+
+def main():
+    random.seed(0)
+
+    batters = measure(
+        lambda: [
+            BoxScoreBatter(
+                _NAMES[i % 1500],
+                "First",
+                "SS",
+                str(i % 99),
+                "%d00" % (i % 9 + 1),
+                random.randint(0, 5),
+                random.randint(0, 2),
+                1,
+                0,
+                1,
+                2,
+                3,
+                1,
+            )
+            for i in range(_COUNT_BATTERS)
+        ],
+        _COUNT_BATTERS,
+        "batters",
+    )
+    pitchers = measure(
+        lambda: [
+            BoxScorePitcher(_NAMES[i % 1500], "First", "40", "6.1", 1, 2, 3, 4, 5, 6)
+            for i in range(_COUNT_PITCHERS)
+        ],
+        _COUNT_PITCHERS,
+        "pitchers",
+    )
+    measure(
+        lambda: [
+            LineScoreInning(i % 9 + 1, [1, 2, 0, 1], [0, 1, 0, 2])
+            for i in range(_COUNT_INNINGS)
+        ],
+        _COUNT_INNINGS,
+        "innings",
+    )
+    measure(
+        lambda: [
+            Team("Baltimore", "Orioles", "Baltimore", "BAL", i % 2 == 0)
+            for i in range(_COUNT_TEAMS)
+        ],
+        _COUNT_TEAMS,
+        "teams",
+    )
+
+    if BoxScoreBatterArray is not None:
+        measure(lambda: BoxScoreBatterArray(batters), _COUNT_BATTERS, "batter array")
+        measure(
+            lambda: BoxScorePitcherArray(pitchers), _COUNT_PITCHERS, "pitcher array"
+        )
+
+
+if __name__ == "__main__":
+    main()
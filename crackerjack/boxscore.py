@@ -2,68 +2,117 @@
 
 import argparse
 
-from crackerjack.tools_mlbapi import *
-from crackerjack.tools_linescore import *
-from crackerjack.tools_boxscore import *
-from crackerjack.tools_boxscore import *
-from crackerjack.extractors_boxscore import *
-from crackerjack.formatters_linescore import *
-from crackerjack.formatters_boxscore import *
-
-
-def print_linescore(gamePk, debug=False, wide=False):
-    game_data = download_game_data(gamePk, debug=debug)
-    dense_lines, _ = format_linescore(
-        extract_linescore_innings(game_data),
-        extract_teams_data(game_data),
-        venue=extract_venue_name(game_data),
-        decision_dict=extract_decisions(game_data),
-        wide_display=wide,
-    )
-    print()
-    [print(line) for line in dense_lines]
-    print()
-
-
-def do_box(gamePk, debug=False, wide=False):
-    game_data = download_game_data(gamePk, debug=debug)
-    # print("\n")
-    print(extract_gamedate(game_data))
-    print(extract_venue_name(game_data))
-    print()
-    lines_dense, lines_sparse = format_linescore(
-        extract_linescore_innings(game_data),
-        extract_teams_data(game_data),
-        use_top_spacing_line=False,
-        use_bottom_spacing_line=False,
-        horz_char=" ",
-        vert_char=" ",
-        cross_char=" ",
-        wide_display=wide,
-    )
-    do_dense = True
-    if do_dense:
-        [print(line) for line in lines_dense]
-    else:
-        [print(line) for line in lines_sparse]
-    print()
-    batter_list = extract_boxscore_batter(game_data)
-    pitcher_list = extract_boxscore_pitcher(game_data)
-    line_batters_dict = format_batters(batter_list, wide_display=wide)
-    line_pitchers_dict = format_pitchers(pitcher_list, wide_display=wide)
-    for tmkey in ("away", "home"):
-        print("  ", extract_teams_data(game_data)[tmkey], sep="")
-        print()
-        [print(x) for x in line_batters_dict[tmkey]]
-        print()
-        [print(x) for x in line_pitchers_dict[tmkey]]
-        print()
-        info_line_tmkey = extract_info_team(game_data, home_team=(tmkey == "home"))
-        [print(x) for x in format_info_team(info_line_tmkey, wide_display=wide)]
-        print()
-    info_line_box = extract_info_box(game_data)
-    [print(x) for x in format_info_box(info_line_box, wide_display=wide)]
-    print()
+from crackerjack.tools_mlbapi import (
+    download_game_linescore_data,
+    extract_decisions_schedule,
+    extract_linescore_innings_schedule,
+    extract_teams_data_schedule,
+    extract_venue_name_schedule,
+    has_linescore_schedule,
+)
+from crackerjack.formatters_linescore import format_linescore
+from crackerjack.formatters_boxscore import (
+    format_batters,
+    format_info_box,
+    format_info_team,
+    format_pitchers,
+)
+from crackerjack.tools_game import get_game_summary
+from crackerjack.tools_output import get_use_color, open_screen, set_use_color
+
+
+def extract_linescore_parts_schedule(data_sched_game: dict) -> dict:
+    """
+    get the innings, teams, venue, and decisions from a hydrated schedule entry
+    """
+
+    return {
+        "innings": extract_linescore_innings_schedule(data_sched_game),
+        "teams": extract_teams_data_schedule(data_sched_game),
+        "venue": extract_venue_name_schedule(data_sched_game),
+        "decisions": extract_decisions_schedule(data_sched_game),
+    }
+
+
+def download_linescore_parts(gamePk, debug=False) -> dict:
+    """
+    get the innings, teams, venue, and decisions needed to print a linescore
+
+    uses the light per-game schedule entry when it has everything, and falls
+    back to the full live feed otherwise
+    """
+
+    if not debug:
+        data_sched_game = download_game_linescore_data(gamePk)
+        if (data_sched_game is not None) and has_linescore_schedule(data_sched_game):
+            return extract_linescore_parts_schedule(data_sched_game)
+
+    summary = get_game_summary(gamePk, debug=debug)
+    return summary.linescore_parts if summary is not None else None
+
+
+def print_linescore(gamePk, debug=False, wide=False, linescore_parts=None, sink=None):
+    if linescore_parts is None:
+        linescore_parts = download_linescore_parts(gamePk, debug=debug)
+    with open_screen(sink) as out:
+        if linescore_parts is None:
+            out.write_line("\nThe linescore for game %s isn't available.\n" % gamePk)
+            return
+        dense_lines, _ = format_linescore(
+            linescore_parts["innings"],
+            linescore_parts["teams"],
+            venue=linescore_parts["venue"],
+            decision_dict=linescore_parts["decisions"],
+            wide_display=wide,
+            use_color=get_use_color(out),
+        )
+        out.write_line()
+        out.write_lines(dense_lines)
+        out.write_line()
+
+
+def do_box(gamePk, debug=False, wide=False, sink=None, summary=None):
+    if summary is None:
+        summary = get_game_summary(gamePk, debug=debug)
+    with open_screen(sink) as out:
+        if summary is None:
+            out.write_line("The box score for game %s isn't available.\n" % gamePk)
+            return
+        # out.write_line("\n")
+        out.write_line(summary.date)
+        out.write_line(summary.venue)
+        out.write_line()
+        lines_dense, lines_sparse = format_linescore(
+            summary.innings,
+            summary.teams,
+            use_top_spacing_line=False,
+            use_bottom_spacing_line=False,
+            horz_char=" ",
+            vert_char=" ",
+            cross_char=" ",
+            wide_display=wide,
+            use_color=get_use_color(out),
+        )
+        do_dense = True
+        if do_dense:
+            out.write_lines(lines_dense)
+        else:
+            out.write_lines(lines_sparse)
+        out.write_line()
+        line_batters_dict = format_batters(summary.batters, wide_display=wide)
+        line_pitchers_dict = format_pitchers(summary.pitchers, wide_display=wide)
+        for tmkey in ("away", "home"):
+            out.write_line("  %s" % summary.teams[tmkey])
+            out.write_line()
+            out.write_lines(line_batters_dict[tmkey])
+            out.write_line()
+            out.write_lines(line_pitchers_dict[tmkey])
+            out.write_line()
+            info_line_tmkey = summary.info_teams[tmkey]
+            out.write_lines(format_info_team(info_line_tmkey, wide_display=wide))
+            out.write_line()
+        out.write_lines(format_info_box(summary.info_box, wide_display=wide))
+        out.write_line()
 
 
 def main():
@@ -79,8 +128,15 @@ def main():
     parser.add_argument("-g", "--game", action="store", default=None, type=int)
     parser.add_argument("-w", "--wide", action="store_true", default=False)
     parser.add_argument("--debug", action="store_true", default=False)
+    parser.add_argument(
+        "--color",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="color the output (default: only on a terminal)",
+    )
 
     args = parser.parse_args()
+    set_use_color(args.color)
 
     ### do functionality
 
@@ -88,8 +144,9 @@ def main():
         print_linescore(args.game, debug=args.debug, wide=args.wide)
 
     if args.box:
-        print()
-        do_box(args.game, args.debug)
+        with open_screen() as out:
+            out.write_line()
+            do_box(args.game, args.debug, sink=out)
 
     # if args.game and (not args.line) and (not args.box):  # exploration mode
     #     game_data = download_game_data(args.game, debug=args.debug)
@@ -1,17 +1,11 @@
+import argparse
 import sys
 
 from datetime import datetime
-import pprint
-
-from crackerjack.boxscore import do_box
-import inquirer
 import signal
 
-from crackerjack.fetch_schedule import get_daily_linescores
-from crackerjack.fetch_schedule import get_daily_games
-from crackerjack.fetch_standings import run_standings
-from crackerjack.fetch_standings import run_wildcard
-from crackerjack.sparkline import run_sparkline
+# each feature's module (and the numpy/pandas it pulls in) is imported the
+# first time that feature is picked, so the menu comes up without them
 
 
 def ctrlc_handler(sig, frame):
@@ -31,6 +25,8 @@ def is_valid_date(date_str):
 
 def get_date():
     """Prompt the user for a date until a valid date is provided."""
+    import inquirer
+
     while True:
         # ask the user for a date
         questions = [inquirer.Text("date", message="Please enter a date (YYYY-MM-DD)")]
@@ -51,9 +47,23 @@ signal.signal(signal.SIGINT, ctrlc_handler)
 print_wide = False
 
 
-def main():
+def refresh_standings_in_background():
+    """freshen standings in the background, if they've been shown already"""
+    fetch_standings = sys.modules.get("crackerjack.fetch_standings")
+    if fetch_standings is None:
+        return  # nothing shown yet, so nothing to freshen
+    fetch_standings.refresh_standings_in_background()
+
+
+def run_menu():
+    """run the interactive menu until the user exits"""
+    import inquirer
+
     print()
     while True:
+        # freshen standings we've already shown while the user picks from the menu
+        refresh_standings_in_background()
+
         mode = inquirer.list_input(
             message="Welcome to crackerjack. What would you like to view?",
             choices=[
@@ -68,6 +78,8 @@ def main():
         )
 
         if mode == "linescores":
+            from crackerjack.fetch_schedule import get_daily_linescores
+
             date = inquirer.list_input(
                 message="Which day do you want to retrive linescores for?",
                 choices=[
@@ -106,6 +118,14 @@ def main():
             raise NotImplementedError(f"mode {mode} has not been implemented yet!")
 
         elif mode == "boxscore":
+            from crackerjack.boxscore import do_box
+            from crackerjack.fetch_schedule import (
+                get_date_today,
+                get_date_yesterday,
+                get_schedule,
+                get_unavailable_message,
+            )
+
             date = inquirer.list_input(
                 message="Which day do you want to retrive a boxscore for?",
                 choices=[
@@ -116,27 +136,24 @@ def main():
             )
             if date == "date":
                 date = get_date()
-
-                games_to_do = get_daily_games(
-                    fetch_today=False,
-                    fetch_yesterday=False,
-                    fetch_target_date=date,
-                )
             elif date == "today":
-                games_to_do = get_daily_games(
-                    fetch_today=True,
-                    fetch_yesterday=False,
-                )
+                date = get_date_today()
             elif date == "yesterday":
-                games_to_do = get_daily_games(
-                    fetch_today=False,
-                    fetch_yesterday=True,
-                )
+                date = get_date_yesterday()
             else:
                 raise NotImplementedError(
                     f"boxscore date option {date} has not been implemented yet!"
                 )
 
+            schedule = get_schedule(date)
+            if schedule is None:
+                print("\n" + get_unavailable_message(date))
+                continue
+            games_to_do = schedule.get_games_completed(date, with_summary=True)
+            if games_to_do is None:
+                print(f"\nNo games completed on {date}.\n")
+                continue
+
             gamePk = inquirer.list_input(
                 message="Which game do you want to retrive a boxscore for?",
                 choices=games_to_do["completed"],
@@ -145,12 +162,18 @@ def main():
             do_box(gamePk)
 
         elif mode == "standings_div":
+            from crackerjack.fetch_standings import run_standings
+
             run_standings()
 
         elif mode == "standings_lg":
+            from crackerjack.fetch_standings import run_wildcard
+
             run_wildcard()
 
         elif mode == "sparklines":
+            from crackerjack.sparkline import run_sparkline
+
             print()
             run_sparkline()
             print()
@@ -163,5 +186,238 @@ def main():
             raise NotImplementedError(f"mode {mode} has not been implemented yet!")
 
 
+def get_requested_date(date_str):
+    """turn a --date value (a date, 'today', or 'yesterday') into a date"""
+    from crackerjack.fetch_schedule import get_date_today, get_date_yesterday
+
+    if date_str == "today":
+        return get_date_today()
+    if date_str == "yesterday":
+        return get_date_yesterday()
+    if not is_valid_date(date_str):
+        raise argparse.ArgumentTypeError(f"invalid date: {date_str} (use YYYY-MM-DD)")
+    return date_str
+
+
+def do_linescores(args, out):
+    """write the completed games' linescores for each requested date"""
+    from crackerjack.fetch_schedule import (
+        get_daily_linescores,
+        get_slate_linescore_parts,
+    )
+
+    dates = args.date  # already checked and resolved by main
+
+    if args.format == "json":
+        from crackerjack.formatters_json import dump_json, get_linescore_json
+
+        data_dates = []
+        is_available = True
+        for date in dates:
+            slate = get_slate_linescore_parts(date)
+            if slate is None:
+                data_dates.append({"date": date, "unavailable": True, "games": []})
+                is_available = False
+                continue
+            data_games = [
+                get_linescore_json(gamePk, linescore_parts)
+                for gamePk, linescore_parts in slate
+            ]
+            is_available &= not any(x.get("unavailable") for x in data_games)
+            data_dates.append({"date": date, "games": data_games})
+        out.write_line(dump_json({"dates": data_dates}))
+        return 0 if is_available else 1
+
+    is_available = True
+    for date in dates:
+        is_available &= get_daily_linescores(
+            fetch_today=False,
+            fetch_yesterday=False,
+            fetch_target_date=date,
+            print_wide=args.wide,
+            sink=out,
+        )
+    return 0 if is_available else 1
+
+
+def do_boxscore(args, out):
+    """write the box score for each requested game"""
+    from crackerjack.boxscore import do_box
+    from crackerjack.tools_game import get_game_summaries
+
+    summaries = get_game_summaries(args.game)
+
+    if args.format == "json":
+        from crackerjack.formatters_json import dump_json, get_boxscore_json
+
+        out.write_line(
+            dump_json(
+                {
+                    "games": [
+                        get_boxscore_json(x) if x is not None else None
+                        for x in summaries
+                    ]
+                }
+            )
+        )
+        return 1 if any(x is None for x in summaries) else 0
+
+    for gamePk, summary in zip(args.game, summaries):
+        out.write_line()
+        do_box(gamePk, wide=args.wide, sink=out, summary=summary)
+
+    return 1 if any(x is None for x in summaries) else 0
+
+
+def do_standings(args, out):
+    """write the divisional standings"""
+    from crackerjack.fetch_standings import get_standings_snapshot, run_standings
+
+    snapshot = get_standings_snapshot()
+    if args.format == "json":
+        from crackerjack.formatters_json import dump_json, get_standings_json
+
+        if snapshot is None:
+            return 1
+        out.write_line(dump_json({"standings": get_standings_json(snapshot.table)}))
+        return 0
+
+    run_standings(sink=out)
+    return 0 if snapshot is not None else 1
+
+
+def do_wildcard(args, out):
+    """write the league (wild card) standings"""
+    from crackerjack.fetch_standings import get_standings_snapshot, run_wildcard
+
+    snapshot = get_standings_snapshot()
+    if args.format == "json":
+        from crackerjack.formatters_json import dump_json, get_standings_json
+
+        if snapshot is None:
+            return 1
+        table = snapshot.table.sort_values("wpct", ascending=False)
+        out.write_line(dump_json({"standings": get_standings_json(table)}))
+        return 0
+
+    run_wildcard(sink=out)
+    return 0 if snapshot is not None else 1
+
+
+def do_sparklines(args, out):
+    """write every team's season sparkline"""
+    from crackerjack.sparkline import download_season_results, run_sparkline
+
+    if args.format == "json":
+        from crackerjack.formatters_json import dump_json, get_sparklines_json
+
+        season_results = download_season_results(args.season)
+        if season_results is None:
+            return 1
+        out.write_line(
+            dump_json(
+                {"season": args.season, "teams": get_sparklines_json(season_results)}
+            )
+        )
+        return 0
+
+    return 0 if run_sparkline(args.season, sink=out) else 1
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """get the parser for the non-interactive subcommands"""
+
+    # options every subcommand takes
+    parser_common = argparse.ArgumentParser(add_help=False)
+    parser_common.add_argument(
+        "-f", "--format", choices=["text", "json"], default="text"
+    )
+    parser_common.add_argument("-o", "--output", default=None, help="write to a file")
+    parser_common.add_argument("-w", "--wide", action="store_true", default=False)
+    parser_common.add_argument(
+        "--color",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="color the output (default: only on a terminal)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="crackerjack",
+        description="cfrontin's CLI boxscore and linescore printer; "
+        + "run without a command for the interactive menu",
+        epilog="strike three!\a\n",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_linescores = subparsers.add_parser(
+        "linescores", parents=[parser_common], help="completed games' linescores"
+    )
+    parser_linescores.add_argument(
+        "-d",
+        "--date",
+        action="append",
+        help="YYYY-MM-DD, today, or yesterday (repeatable; default: today)",
+    )
+    parser_linescores.set_defaults(func=do_linescores)
+
+    parser_boxscore = subparsers.add_parser(
+        "boxscore", parents=[parser_common], help="a game's box score"
+    )
+    parser_boxscore.add_argument(
+        "-g", "--game", action="append", type=int, required=True, help="(repeatable)"
+    )
+    parser_boxscore.set_defaults(func=do_boxscore)
+
+    parser_standings = subparsers.add_parser(
+        "standings", parents=[parser_common], help="divisional standings"
+    )
+    parser_standings.set_defaults(func=do_standings)
+
+    parser_wildcard = subparsers.add_parser(
+        "wildcard", parents=[parser_common], help="league (wild card) standings"
+    )
+    parser_wildcard.set_defaults(func=do_wildcard)
+
+    parser_sparklines = subparsers.add_parser(
+        "sparklines", parents=[parser_common], help="every team's season sparkline"
+    )
+    parser_sparklines.add_argument(
+        "-s", "--season", type=int, default=datetime.now().year
+    )
+    parser_sparklines.set_defaults(func=do_sparklines)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    run a subcommand if one is given, otherwise the interactive menu
+
+    subcommands never import inquirer, so they're cheap to run from scripts;
+    returns the exit status, nonzero if something couldn't be downloaded
+    """
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        run_menu()
+        return
+
+    from crackerjack.tools_output import FileSink, StdoutSink, set_use_color
+
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "linescores":
+            args.date = [get_requested_date(x) for x in (args.date or ["today"])]
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    # json is for machines, so it's never colored
+    set_use_color(False if args.format == "json" else args.color)
+
+    with FileSink(args.output) if args.output else StdoutSink() as out:
+        return args.func(args, out)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
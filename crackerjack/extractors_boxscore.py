@@ -1,4 +1,3 @@
-import copy
 import re
 from collections import OrderedDict
 
@@ -23,24 +22,36 @@ def extract_info_box(
     assert "boxscore" in data_game["liveData"]
     assert "info" in data_game["liveData"]["boxscore"]
 
+    return build_info_box(
+        data_game["liveData"]["boxscore"]["info"][:-1],  # scrape off date
+        labels_to_skip=labels_to_skip,
+    )
+
+
+def build_info_box(
+    info_field_list: list,
+    labels_to_skip: list = [
+        "Venue",
+    ],
+) -> OrderedDict[str:list]:
+    """
+    turn a boxscore's list of info fields (less the date) into box info lines
+    """
+
     lines = OrderedDict()
-    info_field_list = copy.deepcopy(
-        data_game["liveData"]["boxscore"]["info"][:-1]
-    )  # scrape off date, copy for mods
     for info_field in info_field_list:
-        assert info_field["label"] in tools_mlbapi._MLBAM_GAME_LABELS, (
-            "%s must be in game labels" % info_field["label"]
+        label = info_field["label"]
+        assert label in tools_mlbapi._MLBAM_GAME_LABELS, (
+            "%s must be in game labels" % label
         )
-        if info_field["label"] in labels_to_skip:
+        if label in labels_to_skip:
             continue  # skip stuff that should be skipped
-        if info_field["value"].endswith("."):
-            info_field["value"] = info_field["value"][:-1]  # trim trailing period
-        info_field["value"] = [
-            x.strip() for x in re.split(";|\.", info_field["value"]) if not x.isspace()
-        ]
-        # print("%s:" % info_field["label"])
-        # [print("\t%s" % x) for x in info_field["value"]]
-        lines[info_field["label"]] = info_field["value"]
+        value = info_field["value"]
+        if value.endswith("."):
+            value = value[:-1]  # trim trailing period
+        # print("%s:" % label)
+        # [print("\t%s" % x) for x in lines[label]]
+        lines[label] = [x.strip() for x in re.split(r";|\.", value) if not x.isspace()]
 
     return lines
 
@@ -61,9 +72,20 @@ def extract_info_team(
     assert "teams" in data_game["liveData"]["boxscore"]
     assert team_key in data_game["liveData"]["boxscore"]["teams"]
 
-    team_data = copy.deepcopy(data_game["liveData"]["boxscore"]["teams"][team_key])
+    team_data = data_game["liveData"]["boxscore"]["teams"][team_key]  # read only
     assert "info" in team_data
 
+    return build_info_team(team_data, labels_to_skip=labels_to_skip)
+
+
+def build_info_team(
+    team_data: dict,
+    labels_to_skip: list = [],
+) -> dict[OrderedDict[str:list]]:
+    """
+    turn one team's boxscore node into its bottom-lines team info
+    """
+
     lines = {}
 
     for title_sec in team_data["info"]:
@@ -73,12 +95,12 @@ def extract_info_team(
         for info_field in title_sec["fieldList"]:
             if info_field in labels_to_skip:
                 continue  # skip stuff that should be skipped
-            if info_field["value"].endswith("."):
-                info_field["value"] = info_field["value"][:-1]  # trim trailing period
-            info_field["value"] = [x.strip() for x in info_field["value"].split(";")]
+            value = info_field["value"]
+            if value.endswith("."):
+                value = value[:-1]  # trim trailing period
             # print(info_field["label"])
-            # [print("\t%s" % x) for x in info_field["value"]]
-            dict_entry[info_field["label"]] = info_field["value"]
+            # [print("\t%s" % x) for x in dict_entry[info_field["label"]]]
+            dict_entry[info_field["label"]] = [x.strip() for x in value.split(";")]
         lines[info_title] = dict_entry
 
     return lines
@@ -91,33 +113,52 @@ def extract_boxscore_pitcher(data_game: dict) -> dict[str : list[BoxScorePitcher
 
     data_box = extract_boxscore_data(data_game)
 
-    lines_dict = {"away": [], "home": []}
+    assert "gameData" in data_game
+    assert "players" in data_game["gameData"]
+    data_players = data_game["gameData"]["players"]
 
-    for tm_key in ("away", "home"):
-        for player_key in data_box["teams"][tm_key]["pitchers"]:
-            player_key_mod = get_prefixed_player_id(player_key)
-            assert player_key_mod in data_box["teams"][tm_key]["players"]
+    return {
+        tm_key: build_boxscore_pitchers(data_box["teams"][tm_key], data_players)
+        for tm_key in ("away", "home")
+    }
 
-            player_data = extract_player_detailed(data_game, player_key)
-            player_game_data = data_box["teams"][tm_key]["players"][player_key_mod]
-            player_pitching_data = player_game_data["stats"]["pitching"]
 
-            player_bsp = BoxScorePitcher(
-                player_data.get("useLastName"),
-                player_data.get("useName"),
-                player_game_data.get("jerseyNumber"),
-                player_pitching_data.get("inningsPitched"),
-                player_pitching_data.get("hits"),
-                player_pitching_data.get("runs"),
-                player_pitching_data.get("earnedRuns"),
-                player_pitching_data.get("baseOnBalls"),
-                player_pitching_data.get("strikeOuts"),
-                player_pitching_data.get("homeRuns"),
-            )
+def build_boxscore_pitchers(
+    data_box_team: dict, data_players: dict
+) -> list[BoxScorePitcher]:
+    """
+    turn one team's boxscore node into its pitchers' lines
 
-            lines_dict[tm_key].append(player_bsp)
+    `data_players` is the game's bio data for every player, keyed by prefixed id
+    """
+
+    lines = []
+
+    for player_key in data_box_team["pitchers"]:
+        player_key_mod = get_prefixed_player_id(player_key)
+        assert player_key_mod in data_box_team["players"]
+        assert player_key_mod in data_players
+
+        player_data = data_players[player_key_mod]
+        player_game_data = data_box_team["players"][player_key_mod]
+        player_pitching_data = player_game_data["stats"]["pitching"]
+
+        player_bsp = BoxScorePitcher(
+            player_data.get("useLastName"),
+            player_data.get("useName"),
+            player_game_data.get("jerseyNumber"),
+            player_pitching_data.get("inningsPitched"),
+            player_pitching_data.get("hits"),
+            player_pitching_data.get("runs"),
+            player_pitching_data.get("earnedRuns"),
+            player_pitching_data.get("baseOnBalls"),
+            player_pitching_data.get("strikeOuts"),
+            player_pitching_data.get("homeRuns"),
+        )
+
+        lines.append(player_bsp)
 
-    return lines_dict
+    return lines
 
 
 def extract_boxscore_batter(data_game: dict) -> dict[str : list[BoxScoreBatter]]:
@@ -127,39 +168,55 @@ def extract_boxscore_batter(data_game: dict) -> dict[str : list[BoxScoreBatter]]
 
     data_box = extract_boxscore_data(data_game)
 
-    lines_dict = {"away": [], "home": []}
-
-    for tm_key in ("away", "home"):
-        for player_key in data_box["teams"][tm_key]["batters"]:
-            player_key_mod = get_prefixed_player_id(player_key)
-            assert player_key_mod in data_box["teams"][tm_key]["players"]
-
-            player_data = extract_player_detailed(data_game, player_key)
-            player_game_data = data_box["teams"][tm_key]["players"][player_key_mod]
-            player_batting_data = player_game_data["stats"]["batting"]
-            player_fielding_data = player_game_data["stats"]["fielding"]
-
-            player_bsb = BoxScoreBatter(
-                player_data.get("useLastName"),
-                player_data.get("useName"),
-                "-".join(
-                    [
-                        posi.get("abbreviation")
-                        for posi in player_game_data["allPositions"]
-                    ]
-                ),
-                player_game_data.get("jerseyNumber"),
-                player_game_data.get("battingOrder"),
-                player_batting_data.get("atBats"),
-                player_batting_data.get("runs"),
-                player_batting_data.get("hits"),
-                player_batting_data.get("rbi"),
-                player_batting_data.get("baseOnBalls"),
-                player_batting_data.get("strikeOuts"),
-                player_fielding_data.get("putOuts"),
-                player_fielding_data.get("assists"),
-            )
-
-            lines_dict[tm_key].append(player_bsb)
-
-    return lines_dict
+    assert "gameData" in data_game
+    assert "players" in data_game["gameData"]
+    data_players = data_game["gameData"]["players"]
+
+    return {
+        tm_key: build_boxscore_batters(data_box["teams"][tm_key], data_players)
+        for tm_key in ("away", "home")
+    }
+
+
+def build_boxscore_batters(
+    data_box_team: dict, data_players: dict
+) -> list[BoxScoreBatter]:
+    """
+    turn one team's boxscore node into its batters' lines
+
+    `data_players` is the game's bio data for every player, keyed by prefixed id
+    """
+
+    lines = []
+
+    for player_key in data_box_team["batters"]:
+        player_key_mod = get_prefixed_player_id(player_key)
+        assert player_key_mod in data_box_team["players"]
+        assert player_key_mod in data_players
+
+        player_data = data_players[player_key_mod]
+        player_game_data = data_box_team["players"][player_key_mod]
+        player_batting_data = player_game_data["stats"]["batting"]
+        player_fielding_data = player_game_data["stats"]["fielding"]
+
+        player_bsb = BoxScoreBatter(
+            player_data.get("useLastName"),
+            player_data.get("useName"),
+            "-".join(
+                [posi.get("abbreviation") for posi in player_game_data["allPositions"]]
+            ),
+            player_game_data.get("jerseyNumber"),
+            player_game_data.get("battingOrder"),
+            player_batting_data.get("atBats"),
+            player_batting_data.get("runs"),
+            player_batting_data.get("hits"),
+            player_batting_data.get("rbi"),
+            player_batting_data.get("baseOnBalls"),
+            player_batting_data.get("strikeOuts"),
+            player_fielding_data.get("putOuts"),
+            player_fielding_data.get("assists"),
+        )
+
+        lines.append(player_bsb)
+
+    return lines
@@ -1,320 +1,337 @@
 import os.path
+import time
 from datetime import datetime, timedelta
 
 import argparse
 from pprint import pprint
 
-import crackerjack.team_lookup
 import crackerjack.boxscore as boxscore
 import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_schedule import Schedule, is_completed
+from crackerjack.tools_output import open_screen, set_use_color
 
+_schedule_session = []  # (time fetched, Schedule) parsed so far this session
 
-def get_daily_games(
-    season=datetime.today().year,
-    fetch_today=True,
-    fetch_yesterday=False,
-    fetch_target_date=False,
-    # print_wide=False,
-):
 
-    # override season if user requests a specific date
-    if fetch_target_date:
-        assert not fetch_today and not fetch_yesterday
-        season = datetime.strptime(fetch_target_date, "%Y-%m-%d").year
+def print_linescores(gamePk_list, print_wide=False, engine=None, sink=None) -> list:
+    """
+    download a list of games' linescores concurrently, print them in order
 
-    mlbam_schedule_url = tools_mlbapi._MLB_SCHEDULE_FORMAT_STRING % (
-        f"{season}-01-01",
-        f"{season}-12-31",
-    )
-    sched_data = tools_mlbapi.download_json_url(
-        mlbam_schedule_url,
-        # debug_file_loader=os.path.join(tools_mlbapi._PKG_DIR, "schedule.json"),
+    the linescores make up one screen, written out in one go once they're in;
+    returns the linescore parts printed, None for any game that's unavailable
+    """
+
+    if len(gamePk_list) == 0:
+        return []
+
+    linescore_parts_list = tools_mlbapi.get_fetch_engine(engine).run_all_sync(
+        [(boxscore.download_linescore_parts, gamePk) for gamePk in gamePk_list]
     )
+    with open_screen(sink) as out:
+        for gamePk, linescore_parts in zip(gamePk_list, linescore_parts_list):
+            boxscore.print_linescore(
+                gamePk, wide=print_wide, linescore_parts=linescore_parts, sink=out
+            )
 
-    gamecount_by_date = {}
-    games_by_date = {}
+    return linescore_parts_list
 
-    today = None
-    yesterday = None
-    tgt_day = None
 
-    for date in sched_data["dates"]:
-        date_of_games = date["date"]
-        is_today = (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == datetime.today().date()
-        )
-        is_yesterday = (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == (datetime.today() - timedelta(days=1)).date()
-        )
-        is_tgt_day = fetch_target_date and (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == (datetime.strptime(fetch_target_date, "%Y-%m-%d").date())
-        )
+def get_slate_linescore_parts(date_str) -> list:
+    """
+    get every completed game's linescore parts on a date from one schedule request
+
+    returns (game pk, linescore parts) in schedule order, with None parts for a
+    game that couldn't be downloaded, or None if the schedule itself couldn't be
+    """
 
-        total_games = 0
-        scheduled_games = 0
-        cancelled_games = 0
-        imminent_games = 0
-        completed_games = 0
-        inprogress_games = 0
-        postponed_games = 0
-
-        games_thisday = {
-            "scheduled": [],
-            "imminent": [],
-            "cancelled": [],
-            "postponed": [],
-            "inprogress": [],
-            "completed": [],
-        }
+    sched_data = tools_mlbapi.download_schedule_linescores(date_str)
+    if sched_data is None:
+        return None
 
+    slate = []
+    idx_fallback = []  # games the schedule has no linescore for
+    for date in sched_data["dates"]:
         for game in date["games"]:
-            gamePk = game.get("gamePk")
-            gameType = game.get("gameType")
             status = game.get("status")
-            statusCode = status.get("statusCode") if status is not None else None
             codedGameState = (
                 status.get("codedGameState") if status is not None else None
             )
+            if not is_completed(codedGameState):
+                continue
 
-            # get a quick description of the game
-            teamID_away = int(game["teams"]["away"]["team"]["id"])
-            teamID_home = int(game["teams"]["home"]["team"]["id"])
-            if teamID_away in crackerjack.team_lookup.team_list.keys():
-                threeletter_away = crackerjack.team_lookup.team_list[
-                    int(game["teams"]["away"]["team"]["id"])
-                ].get("abbreviation")
-            else:
-                threeletter_away = "XXX"  # DEBUG!!!!!
-            if teamID_home in crackerjack.team_lookup.team_list.keys():
-                threeletter_home = crackerjack.team_lookup.team_list[
-                    int(game["teams"]["home"]["team"]["id"])
-                ].get("abbreviation")
+            gamePk = game.get("gamePk")
+            if tools_mlbapi.has_linescore_schedule(game):
+                linescore_parts = boxscore.extract_linescore_parts_schedule(game)
             else:
-                threeletter_home = "XXX"  # DEBUG!!!!!
-            game_summary_string = f"{threeletter_away} @ {threeletter_home}"
-
-            total_games += 1
-            if codedGameState == "F":
-                completed_games += 1
-                games_thisday["completed"].append((game_summary_string, gamePk))
-            elif codedGameState == "O":
-                completed_games += 1
-                games_thisday["completed"].append((game_summary_string, gamePk))
-            elif codedGameState == "C":
-                cancelled_games += 1
-                games_thisday["cancelled"].append((game_summary_string, gamePk))
-            elif codedGameState == "D":
-                postponed_games += 1
-                games_thisday["postponed"].append((game_summary_string, gamePk))
-            elif codedGameState == "P":
-                imminent_games += 1
-                games_thisday["imminent"].append((game_summary_string, gamePk))
-            elif codedGameState == "S":
-                scheduled_games += 1
-                games_thisday["scheduled"].append((game_summary_string, gamePk))
-            elif codedGameState == "I":
-                inprogress_games += 1
-                games_thisday["inprogress"].append((game_summary_string, gamePk))
-            elif codedGameState == "U":
-                inprogress_games += 1
-                games_thisday["inprogress"].append((game_summary_string, gamePk))
-            elif codedGameState is not None:
-                raise NotImplementedError(
-                    f"codedGameState: {codedGameState} not yet handled."
-                )
+                linescore_parts = None
+                idx_fallback.append(len(slate))
+            slate.append((gamePk, linescore_parts))
+
+    # download the rest game by game, all at once
+    if len(idx_fallback) > 0:
+        linescore_parts_list = tools_mlbapi.get_fetch_engine().run_all_sync(
+            [(boxscore.download_linescore_parts, slate[idx][0]) for idx in idx_fallback]
+        )
+        for idx, linescore_parts in zip(idx_fallback, linescore_parts_list):
+            slate[idx] = (slate[idx][0], linescore_parts)
 
-        gamecount_by_date[date_of_games] = {
-            "total": total_games,
-            "scheduled": scheduled_games,
-            "cancelled": cancelled_games,
-            "imminent": imminent_games,
-            "completed": completed_games,
-            "inprogress": inprogress_games,
-            "postponed": postponed_games,
-        }
-
-        games_by_date[date_of_games] = games_thisday
-
-        if is_today and completed_games > 0:
-            today = games_thisday
-        if is_yesterday and completed_games > 0:
-            yesterday = games_thisday
-        if is_tgt_day and completed_games > 0:
-            tgt_day = games_thisday
-
-    gamecount_by_date = dict(sorted(gamecount_by_date.items()))
-    days_with_completed = [
-        key for key, value in gamecount_by_date.items() if value["completed"]
-    ]
-    last_day_completed = days_with_completed[-1]
+    return slate
 
-    if fetch_yesterday:
-        return yesterday
 
-    if fetch_today:
-        return today
+def print_slate_linescores(date_str, print_wide=False, sink=None) -> list:
+    """
+    print every completed game's linescore on a date from one schedule request
+
+    returns what `get_slate_linescore_parts` does: the slate that was printed,
+    or None if the schedule couldn't be downloaded
+    """
+
+    slate = get_slate_linescore_parts(date_str)
+    if slate is None:
+        return None
+
+    with open_screen(sink) as out:
+        for gamePk, linescore_parts in slate:
+            boxscore.print_linescore(
+                gamePk,
+                wide=print_wide,
+                linescore_parts=linescore_parts,
+                sink=out,
+            )
+
+    return slate
+
+
+def get_unavailable_message(date_str) -> str:
+    """get the line shown in place of a day's games that couldn't be downloaded"""
+    return f"Games on {date_str} aren't available right now; try again soon.\n"
+
+
+def get_date_today() -> str:
+    return datetime.today().strftime("%Y-%m-%d")
+
+
+def get_date_yesterday() -> str:
+    return (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def get_requested_dates(
+    fetch_today=False, fetch_yesterday=False, fetch_target_date=False
+) -> list[str]:
+    """
+    get the dates (as '2023-01-01' strings) asked for by the fetch flags
+    """
 
+    dates_requested = []
+    if fetch_yesterday:
+        dates_requested.append(get_date_yesterday())
+    if fetch_today:
+        dates_requested.append(get_date_today())
     if fetch_target_date:
-        return tgt_day
+        dates_requested.append(
+            datetime.strptime(fetch_target_date, "%Y-%m-%d").strftime("%Y-%m-%d")
+        )
 
-    return None
+    return dates_requested
 
 
-def get_daily_linescores(
+def get_schedule(
+    start_date: str, end_date=None, max_age=tools_mlbapi._CACHE_TTL_SCHEDULE
+) -> Schedule:
+    """
+    get a parsed schedule covering a date range
+
+    a schedule already parsed this session is reused if it covers the range
+    and is younger than `max_age` seconds; otherwise one is downloaded.
+    returns None if the schedule couldn't be downloaded
+    """
+
+    if end_date is None:
+        end_date = start_date
+
+    time_now = time.monotonic()
+    for time_fetched, schedule in reversed(_schedule_session):
+        if (time_now - time_fetched <= max_age) and schedule.covers(
+            start_date, end_date
+        ):
+            return schedule
+
+    sched_data = tools_mlbapi.download_schedule(start_date, end_date)
+    if sched_data is None:
+        return None  # the download failed, and said why
+
+    schedule = Schedule(sched_data, start_date=start_date, end_date=end_date)
+    _schedule_session[:] = [
+        (time_fetched, v)
+        for time_fetched, v in _schedule_session
+        if time_now - time_fetched <= max_age
+    ]
+    _schedule_session.append((time_now, schedule))
+
+    return schedule
+
+
+def get_schedule_requested(
     season=datetime.today().year,
     fetch_today=True,
     fetch_yesterday=False,
     fetch_target_date=False,
-    print_wide=False,
+) -> Schedule:
+    """
+    get the parsed schedule for the days asked for by the fetch flags
+
+    only the span of the requested days is fetched; the whole season is only
+    fetched when no day is requested
+    """
+
+    dates_requested = get_requested_dates(
+        fetch_today, fetch_yesterday, fetch_target_date
+    )
+    if dates_requested:
+        return get_schedule(min(dates_requested), max(dates_requested))
+    return get_schedule(f"{season}-01-01", f"{season}-12-31")
+
+
+def get_daily_games(
+    season=datetime.today().year,
+    fetch_today=True,
+    fetch_yesterday=False,
+    fetch_target_date=False,
+    # print_wide=False,
 ):
+    """
+    get the games on the requested day, if any are completed
+
+    returns None if no games are completed, or if the schedule couldn't be
+    downloaded
+    """
 
     # override season if user requests a specific date
     if fetch_target_date:
         assert not fetch_today and not fetch_yesterday
         season = datetime.strptime(fetch_target_date, "%Y-%m-%d").year
 
-    mlbam_schedule_url = tools_mlbapi._MLB_SCHEDULE_FORMAT_STRING % (
-        f"{season}-01-01",
-        f"{season}-12-31",
-    )
-    sched_data = tools_mlbapi.download_json_url(
-        mlbam_schedule_url,
-        # debug_file_loader=os.path.join(tools_mlbapi._PKG_DIR, "schedule.json"),
+    schedule = get_schedule_requested(
+        season, fetch_today, fetch_yesterday, fetch_target_date
     )
+    if schedule is None:
+        return None
 
-    gamecount_by_date = {}
-    games_by_date = {}
+    if fetch_yesterday:
+        return schedule.get_games_completed(get_date_yesterday(), with_summary=True)
 
-    today = None
-    yesterday = None
-    tgt_day = None
+    if fetch_today:
+        return schedule.get_games_completed(get_date_today(), with_summary=True)
 
-    for date in sched_data["dates"]:
-        date_of_games = date["date"]
-        is_today = (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == datetime.today().date()
-        )
-        is_yesterday = (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == (datetime.today() - timedelta(days=1)).date()
-        )
-        is_tgt_day = fetch_target_date and (
-            datetime.strptime(date_of_games, "%Y-%m-%d").date()
-            == (datetime.strptime(fetch_target_date, "%Y-%m-%d").date())
-        )
+    if fetch_target_date:
+        return schedule.get_games_completed(fetch_target_date, with_summary=True)
 
-        total_games = 0
-        scheduled_games = 0
-        cancelled_games = 0
-        imminent_games = 0
-        completed_games = 0
-        inprogress_games = 0
-        postponed_games = 0
-
-        games_thisday = {
-            "scheduled": [],
-            "imminent": [],
-            "cancelled": [],
-            "postponed": [],
-            "inprogress": [],
-            "completed": [],
-        }
+    return None
 
-        for game in date["games"]:
-            gamePk = game.get("gamePk")
-            gameType = game.get("gameType")
-            status = game.get("status")
-            statusCode = status.get("statusCode") if status is not None else None
-            codedGameState = (
-                status.get("codedGameState") if status is not None else None
+
+def get_daily_linescores(
+    season=datetime.today().year,
+    fetch_today=True,
+    fetch_yesterday=False,
+    fetch_target_date=False,
+    print_wide=False,
+    single_request=True,
+    sink=None,
+) -> bool:
+    """
+    print the completed games' linescores on the requested days
+
+    returns False if a day's games, or any game's linescore, couldn't be
+    downloaded
+    """
+
+    if fetch_target_date:
+        assert not fetch_today and not fetch_yesterday
+
+    # (heading, date, what to say if there's nothing to show) for each day
+    days_requested = []
+    if fetch_yesterday:
+        days_requested.append(
+            (
+                "YESTERDAY'S GAMES:\n",
+                get_date_yesterday(),
+                "No games completed yesterday.\n",
             )
+        )
+    if fetch_today:
+        days_requested.append(
+            ("TODAY'S GAMES:\n", get_date_today(), "No games completed yet today.\n")
+        )
+    if fetch_target_date:
+        days_requested.append(
+            (
+                f"GAMES ON {fetch_target_date}:\n",
+                fetch_target_date,
+                f"No games completed on {fetch_target_date}.\n",
+            )
+        )
 
-            total_games += 1
-            if codedGameState == "F":
-                completed_games += 1
-                games_thisday["completed"].append(gamePk)
-            elif codedGameState == "O":
-                completed_games += 1
-                games_thisday["completed"].append(gamePk)
-            elif codedGameState == "C":
-                cancelled_games += 1
-                games_thisday["cancelled"].append(gamePk)
-            elif codedGameState == "D":
-                postponed_games += 1
-                games_thisday["postponed"].append(gamePk)
-            elif codedGameState == "P":
-                imminent_games += 1
-                games_thisday["imminent"].append(gamePk)
-            elif codedGameState == "S":
-                scheduled_games += 1
-                games_thisday["scheduled"].append(gamePk)
-            elif codedGameState == "I":
-                inprogress_games += 1
-                games_thisday["inprogress"].append(gamePk)
-            elif codedGameState == "U":
-                inprogress_games += 1
-                games_thisday["inprogress"].append(gamePk)
-            elif codedGameState is not None:
-                raise NotImplementedError(
-                    f"codedGameState: {codedGameState} not yet handled."
+    is_available = True
+    with open_screen(sink) as out:
+        # one hydrated schedule request per requested day renders the whole slate
+        if single_request and days_requested:
+            for heading, date_str, message_no_games in days_requested:
+                out.write_line(heading)
+                slate = print_slate_linescores(
+                    date_str, print_wide=print_wide, sink=out
                 )
+                if slate is None:
+                    out.write_line(get_unavailable_message(date_str))
+                    is_available = False
+                elif not slate:
+                    out.write_line(message_no_games)
+                else:
+                    is_available &= all(parts is not None for _, parts in slate)
+
+            return is_available
+
+        # override season if user requests a specific date
+        if fetch_target_date:
+            season = datetime.strptime(fetch_target_date, "%Y-%m-%d").year
+
+        schedule = get_schedule_requested(
+            season, fetch_today, fetch_yesterday, fetch_target_date
+        )
 
-        gamecount_by_date[date_of_games] = {
-            "total": total_games,
-            "scheduled": scheduled_games,
-            "cancelled": cancelled_games,
-            "imminent": imminent_games,
-            "completed": completed_games,
-            "inprogress": inprogress_games,
-            "postponed": postponed_games,
-        }
-
-        games_by_date[date_of_games] = games_thisday
-
-        if is_today and completed_games > 0:
-            today = games_thisday
-        if is_yesterday and completed_games > 0:
-            yesterday = games_thisday
-        if is_tgt_day and completed_games > 0:
-            tgt_day = games_thisday
-
-    gamecount_by_date = dict(sorted(gamecount_by_date.items()))
-    days_with_completed = [
-        key for key, value in gamecount_by_date.items() if value["completed"]
-    ]
-    last_day_completed = days_with_completed[-1]
+        for heading, date_str, message_no_games in days_requested:
+            out.write_line(heading)
+            if schedule is None:
+                out.write_line(get_unavailable_message(date_str))
+                is_available = False
+                continue
 
-    if fetch_yesterday:
-        print("YESTERDAY'S GAMES:\n")
-        if yesterday is None:
-            print("No games completed yesterday.\n")
-        else:
-            for gamePk in yesterday["completed"]:
-                boxscore.print_linescore(gamePk, debug=False, wide=print_wide)
+            games_thisday = schedule.get_games_completed(date_str)
+            if games_thisday is None:
+                out.write_line(message_no_games)
+                continue
 
-    if fetch_today:
-        print("TODAY'S GAMES:\n")
-        if today is None:
-            print("No games completed yet today.\n")
-        else:
-            for gamePk in today["completed"]:
-                boxscore.print_linescore(gamePk, debug=False, wide=print_wide)
+            linescore_parts_list = print_linescores(
+                games_thisday["completed"], print_wide=print_wide, sink=out
+            )
+            is_available &= all(parts is not None for parts in linescore_parts_list)
 
-    if fetch_target_date:
-        print(f"GAMES ON {fetch_target_date}:\n")
-        if tgt_day is None:
-            print(f"No games completed on {fetch_target_date}.\n")
-        else:
-            for gamePk in tgt_day["completed"]:
-                boxscore.print_linescore(gamePk, debug=False, wide=print_wide)
+        if not days_requested:
+            if schedule is None:
+                out.write_line(
+                    f"The {season} schedule isn't available right now; try again soon.\n"
+                )
+                return False
+
+            last_day_completed = schedule.get_last_day_completed()
+            if last_day_completed is not None:
+                linescore_parts_list = print_linescores(
+                    schedule.get_games(last_day_completed)["completed"],
+                    print_wide=print_wide,
+                    sink=out,
+                )
+                is_available &= all(x is not None for x in linescore_parts_list)
 
-    if (not fetch_today) and (not fetch_yesterday) and (not fetch_target_date):
-        for gamePk in games_by_date[last_day_completed]["completed"]:
-            boxscore.print_linescore(gamePk, debug=False, wide=print_wide)
+    return is_available
 
 
 def main():
@@ -329,8 +346,15 @@ def main():
     parser.add_argument("-y", "--yesterday", action="store_true", default=False)
     parser.add_argument("-w", "--wide", action="store_true", default=False)
     parser.add_argument("--debug", action="store_true", default=False)
+    parser.add_argument(
+        "--color",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="color the output (default: only on a terminal)",
+    )
 
     args = parser.parse_args()
+    set_use_color(args.color)
 
     get_daily_linescores(fetch_today=args.today, fetch_yesterday=args.yesterday)
 
@@ -1,4 +1,6 @@
 import os.path
+import threading
+import time
 from datetime import datetime, timedelta
 
 import argparse
@@ -12,6 +14,7 @@ from colorama import Fore, Back, Style
 
 # import crackerjack.boxscore as boxscore
 import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_output import open_screen
 
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_DEFAULT
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_WIDE_DEFAULT
@@ -31,87 +34,231 @@ league_map = {
 
 division_map = {
     tools_mlbapi._MLBAM_DIVISIONID_AL_WEST: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_AL,
         "shortname": "AL West",
         "fullname": "American League West",
     },
     tools_mlbapi._MLBAM_DIVISIONID_AL_EAST: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_AL,
         "shortname": "AL East",
         "fullname": "American League East",
     },
     tools_mlbapi._MLBAM_DIVISIONID_AL_CENTRAL: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_AL,
         "shortname": "AL Central",
         "fullname": "American League Central",
     },
     tools_mlbapi._MLBAM_DIVISIONID_NL_WEST: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_NL,
         "shortname": "NL West",
         "fullname": "National League West",
     },
     tools_mlbapi._MLBAM_DIVISIONID_NL_EAST: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_NL,
         "shortname": "NL East",
         "fullname": "National League East",
     },
     tools_mlbapi._MLBAM_DIVISIONID_NL_CENTRAL: {
+        "lg_id": tools_mlbapi._MLBAM_LEAGUEID_NL,
         "shortname": "NL Central",
         "fullname": "National League Central",
     },
 }
 
 
-def run_standings():
+_STANDINGS_SNAPSHOT_TTL = 60  # seconds a standings snapshot stays fresh
+_STANDINGS_UNAVAILABLE_MESSAGE = (
+    "\nStandings aren't available right now; try again soon.\n"
+)
+
+# column name to dtype for the standings table
+_STANDINGS_TABLE_DTYPES = {
+    "name": "string",
+    "id": "int64",
+    "wins": "int64",
+    "losses": "int64",
+    "wpct": "float64",
+    "gb": "string",
+    "wcgb": "string",
+    "streak": "string",
+    "lg_id": "int64",
+    "div_id": "int64",
+    "lg_name": "string",
+    "div_name": "string",
+    "div_rank": "int64",
+    "rs_team": "int64",
+    "ra_team": "int64",
+    "rd_team": "int64",
+}
+
+
+def build_standings_table(standings_data: dict) -> pd.DataFrame:
+    """
+    parse a standings payload (either or both leagues) into a typed table
 
-    # create a list of the teams for a wildcard printout
-    wc_list = []
+    rows come out league by league (in `league_map` order), then in the order
+    the payload lists divisions and teams
+    """
+
+    columns = {key: [] for key in _STANDINGS_TABLE_DTYPES}
     for lg_id, league_data in league_map.items():
         lg_name = league_data["abbrev"]
 
-        mlbam_standings_url = (
-            tools_mlbapi._MLB_STANDINGS_FORMAT_STRING % league_data["id"]
-        )
-        standings_data = tools_mlbapi.download_json_url(
-            mlbam_standings_url,
-        )
-
         for record_div in standings_data["records"]:
 
             id_div = record_div["division"]["id"]
+            if division_map[id_div]["lg_id"] != lg_id:
+                continue
 
             for rank_tm, record_tm in enumerate(record_div["teamRecords"]):
 
-                name_team = record_tm["team"]["name"]
-                id_team = record_tm["team"]["id"]
-
                 wins_team = record_tm["wins"]
                 losses_team = record_tm["losses"]
-                wpct_team = wins_team / (wins_team + losses_team)
-                gb_team = record_tm["gamesBack"]
-                wcgb_team = record_tm["wildCardGamesBack"]
                 rs_team = record_tm["runsScored"]
                 ra_team = record_tm["runsAllowed"]
-                streak_team = record_tm["streak"]["streakCode"]
-
-                wc_list.append(
-                    {
-                        "name": name_team,
-                        "id": id_team,
-                        "wins": wins_team,
-                        "losses": losses_team,
-                        "wpct": wpct_team,
-                        "gb": gb_team,
-                        "wcgb": wcgb_team,
-                        "streak": streak_team,
-                        "lg_id": lg_id,
-                        "div_id": id_div,
-                        "lg_name": lg_name,
-                        "div_name": division_map[id_div]["shortname"],
-                        "div_rank": rank_tm + 1,
-                        "rs_team": rs_team,
-                        "ra_team": ra_team,
-                        "rd_team": rs_team - ra_team,
-                    }
-                )
-
-    # create and sort standings dataframe
-    df_standings = pd.DataFrame(wc_list)
+
+                columns["name"].append(record_tm["team"]["name"])
+                columns["id"].append(record_tm["team"]["id"])
+                columns["wins"].append(wins_team)
+                columns["losses"].append(losses_team)
+                columns["wpct"].append(wins_team / (wins_team + losses_team))
+                columns["gb"].append(record_tm["gamesBack"])
+                columns["wcgb"].append(record_tm["wildCardGamesBack"])
+                columns["streak"].append(record_tm["streak"]["streakCode"])
+                columns["lg_id"].append(lg_id)
+                columns["div_id"].append(id_div)
+                columns["lg_name"].append(lg_name)
+                columns["div_name"].append(division_map[id_div]["shortname"])
+                columns["div_rank"].append(rank_tm + 1)
+                columns["rs_team"].append(rs_team)
+                columns["ra_team"].append(ra_team)
+                columns["rd_team"].append(rs_team - ra_team)
+
+    return pd.DataFrame(
+        {
+            key: pd.Series(values, dtype=_STANDINGS_TABLE_DTYPES[key])
+            for key, values in columns.items()
+        }
+    )
+
+
+class StandingsSnapshot(object):
+    """
+    store both leagues' standings at one moment, as a typed columnar table
+    """
+
+    _table: pd.DataFrame
+    _time_fetched: float
+
+    def __init__(self, standings_data: dict, time_fetched=None):
+        self._table = build_standings_table(standings_data)
+        self._time_fetched = (
+            time_fetched if time_fetched is not None else time.monotonic()
+        )
+
+    @classmethod
+    def download(cls):
+        """
+        get a fresh snapshot: one request covers both leagues (None if it fails)
+
+        this skips the response cache, whose lifetime for standings is longer
+        than a snapshot's: a cached body would make `age` look younger than
+        the data is, and a refresh wouldn't fetch anything new
+        """
+        time_fetched = time.monotonic()
+        mlbam_standings_url = tools_mlbapi._MLB_STANDINGS_FORMAT_STRING % ",".join(
+            str(lg_id) for lg_id in league_map
+        )
+        standings_data = tools_mlbapi.download_json_url(
+            mlbam_standings_url, use_cache=False
+        )
+        if standings_data is None:
+            return None
+        return cls(standings_data, time_fetched=time_fetched)
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """the standings table; copy it before modifying"""
+        return self._table
+
+    @property
+    def age(self) -> float:
+        """seconds since this snapshot was fetched"""
+        return time.monotonic() - self._time_fetched
+
+
+_standings_snapshot = None
+_standings_snapshot_lock = threading.Lock()
+
+
+def get_standings_snapshot(max_age=_STANDINGS_SNAPSHOT_TTL) -> StandingsSnapshot:
+    """
+    get the shared standings snapshot, refreshing it if it's older than max_age
+
+    if a refresh fails, the old snapshot is kept; returns None if there's none
+    """
+
+    global _standings_snapshot
+    with _standings_snapshot_lock:
+        if (_standings_snapshot is None) or (_standings_snapshot.age > max_age):
+            _standings_snapshot = StandingsSnapshot.download() or _standings_snapshot
+        return _standings_snapshot
+
+
+def refresh_standings_in_background(max_age=_STANDINGS_SNAPSHOT_TTL):
+    """
+    refresh a stale standings snapshot on a background thread
+
+    nothing happens until standings have been viewed once, so idle menus don't
+    download standings nobody asked for; returns the thread, or None
+    """
+
+    snapshot = _standings_snapshot
+    if (snapshot is None) or (snapshot.age <= max_age):
+        return None
+
+    thread = threading.Thread(
+        target=get_standings_snapshot, kwargs={"max_age": max_age}, daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def format_pct_column(pct: pd.Series) -> np.ndarray:
+    """format a column of winning percentages like .500 (well, 0.500)"""
+    return np.char.mod("%5.03f", np.round(pct.to_numpy(dtype=float), 3))
+
+
+def format_standings_lines(df_standings: pd.DataFrame, char_dict: dict) -> pd.Series:
+    """
+    format every row of a standings table a whole column at a time
+
+    each field is right-justified to its width from `char_dict`, and set off
+    by a space and a bullet on either side
+    """
+
+    lines = pd.Series("•", index=df_standings.index, dtype=object)
+    for k, v in char_dict.items():
+        lines = lines + " " + df_standings[k].astype(str).str.rjust(v) + " •"
+    return lines
+
+
+def pad_standings_lines(lines: list[str], count_lines: int) -> list[str]:
+    """pad a block of team lines out to a fixed count with bare borders"""
+    return list(lines) + ["•"] * (count_lines - len(lines))
+
+
+def run_standings(sink=None):
+
+    # get both leagues' standings from the shared snapshot
+    snapshot = get_standings_snapshot()
+    if snapshot is None:
+        with open_screen(sink) as out:
+            out.write_line(_STANDINGS_UNAVAILABLE_MESSAGE)
+        return
+    df_standings = snapshot.table.copy()
+
+    # sort standings dataframe
     df_standings.sort_values("wpct", ascending=False, inplace=True)
     df_standings.drop(
         columns=[
@@ -163,22 +310,22 @@ def run_standings():
     lg_lines = {
         "AL": {
             "head": "•",
-            "EAST": {"head": "•", "team_lines": ["•"] * 5},
-            "CENTRAL": {"head": "•", "team_lines": ["•"] * 5},
-            "WEST": {"head": "•", "team_lines": ["•"] * 5},
+            "EAST": {"head": "•"},
+            "CENTRAL": {"head": "•"},
+            "WEST": {"head": "•"},
         },
         "NL": {
             "head": "•",
-            "EAST": {"head": "•", "team_lines": ["•"] * 5},
-            "CENTRAL": {"head": "•", "team_lines": ["•"] * 5},
-            "WEST": {"head": "•", "team_lines": ["•"] * 5},
+            "EAST": {"head": "•"},
+            "CENTRAL": {"head": "•"},
+            "WEST": {"head": "•"},
         },
     }
 
     # make the pct pretty
-    df_standings.PCT = [f"{np.round(v,3):5.03f}" for v in df_standings.PCT]
+    df_standings.PCT = format_pct_column(df_standings.PCT)
 
-    # loop over the dictionary of columns
+    # loop over the dictionary of columns for the header lines
     for k, v in char_dict.items():
         head_line += " "
         sep_line += "•"
@@ -186,12 +333,6 @@ def run_standings():
             lg_lines[lg]["head"] += " "  # if k == "TEAM" else "•"
             for div in ["EAST", "CENTRAL", "WEST"]:
                 lg_lines[lg][div]["head"] += " "  # if k == "TEAM" else "•"
-                for idx, row in (
-                    df_standings[df_standings["div_name"].str.upper() == f"{lg} {div}"]
-                    .reset_index()
-                    .iterrows()
-                ):
-                    lg_lines[lg][div]["team_lines"][idx] += " "
 
         head_line += f"{k:>{v}s}"
         sep_line += "•" * v
@@ -207,12 +348,6 @@ def run_standings():
                     lg_lines[lg][div]["head"] += f"{' '*2 + lg + ' ' + div:<{v}s}"
                 else:
                     lg_lines[lg][div]["head"] += f"{k:>{v}s}"
-                for idx, row in (
-                    df_standings[df_standings["div_name"].str.upper() == f"{lg} {div}"]
-                    .reset_index()
-                    .iterrows()
-                ):
-                    lg_lines[lg][div]["team_lines"][idx] += f"{row[k]:>{v}}"
 
         head_line += " •"
         sep_line += "••"
@@ -220,107 +355,65 @@ def run_standings():
             lg_lines[lg]["head"] += " •" if k == "TEAM" else " •"
             for div in ["EAST", "CENTRAL", "WEST"]:
                 lg_lines[lg][div]["head"] += " •" if k == "TEAM" else " •"
-                for idx, row in (
-                    df_standings[df_standings["div_name"].str.upper() == f"{lg} {div}"]
-                    .reset_index()
-                    .iterrows()
-                ):
-                    lg_lines[lg][div]["team_lines"][idx] += " •"
-
-    # make a standard standings printout
-
-    print()
-    print(sep_line)
-    print(lg_lines["AL"]["head"])
-    print(lg_lines["AL"]["EAST"]["head"])
-    print(sep_line)
-    for line in lg_lines["AL"]["EAST"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print(lg_lines["AL"]["CENTRAL"]["head"])
-    print(sep_line)
-    for line in lg_lines["AL"]["CENTRAL"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print(lg_lines["AL"]["WEST"]["head"])
-    print(sep_line)
-    for line in lg_lines["AL"]["WEST"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print()
-    print(sep_line)
-    print(lg_lines["NL"]["head"])
-    print(lg_lines["NL"]["EAST"]["head"])
-    print(sep_line)
-    for line in lg_lines["NL"]["EAST"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print(lg_lines["NL"]["CENTRAL"]["head"])
-    print(sep_line)
-    for line in lg_lines["NL"]["CENTRAL"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print(lg_lines["NL"]["WEST"]["head"])
-    print(sep_line)
-    for line in lg_lines["NL"]["WEST"]["team_lines"]:
-        print(line)
-    print(sep_line)
-    print()
-
-
-def run_wildcard():
-    # create a list of the teams for a wildcard printout
-    wc_list = []
-    for lg_id, league_data in league_map.items():
-        lg_name = league_data["abbrev"]
-
-        mlbam_standings_url = (
-            tools_mlbapi._MLB_STANDINGS_FORMAT_STRING % league_data["id"]
-        )
-        standings_data = tools_mlbapi.download_json_url(
-            mlbam_standings_url,
-        )
-
-        for record_div in standings_data["records"]:
 
-            id_div = record_div["division"]["id"]
-
-            for rank_tm, record_tm in enumerate(record_div["teamRecords"]):
+    # format every team line at once, then split them up by division
+    team_lines = format_standings_lines(df_standings, char_dict)
+    team_lines_by_div = team_lines.groupby(
+        df_standings["div_name"].str.upper(), sort=False
+    ).agg(list)
+    for lg in ["AL", "NL"]:
+        for div in ["EAST", "CENTRAL", "WEST"]:
+            lg_lines[lg][div]["team_lines"] = pad_standings_lines(
+                team_lines_by_div.get(f"{lg} {div}", []), 5
+            )
 
-                name_team = record_tm["team"]["name"]
-                id_team = record_tm["team"]["id"]
+    # make a standard standings printout
 
-                wins_team = record_tm["wins"]
-                losses_team = record_tm["losses"]
-                wpct_team = wins_team / (wins_team + losses_team)
-                gb_team = record_tm["gamesBack"]
-                wcgb_team = record_tm["wildCardGamesBack"]
-                rs_team = record_tm["runsScored"]
-                ra_team = record_tm["runsAllowed"]
-                streak_team = record_tm["streak"]["streakCode"]
-
-                wc_list.append(
-                    {
-                        "name": name_team,
-                        "id": id_team,
-                        "wins": wins_team,
-                        "losses": losses_team,
-                        "wpct": wpct_team,
-                        "wcgb": wcgb_team,
-                        "streak": streak_team,
-                        "lg_id": lg_id,
-                        "div_id": id_div,
-                        "lg_name": lg_name,
-                        "div_name": division_map[id_div]["shortname"],
-                        "div_rank": rank_tm + 1,
-                        "rs_team": rs_team,
-                        "ra_team": ra_team,
-                        "rd_team": rs_team - ra_team,
-                    }
-                )
-
-    # create and sort standings dataframe
-    df_standings = pd.DataFrame(wc_list)
+    with open_screen(sink) as out:
+        out.write_line()
+        out.write_line(sep_line)
+        out.write_line(lg_lines["AL"]["head"])
+        out.write_line(lg_lines["AL"]["EAST"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["AL"]["EAST"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line(lg_lines["AL"]["CENTRAL"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["AL"]["CENTRAL"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line(lg_lines["AL"]["WEST"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["AL"]["WEST"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line()
+        out.write_line(sep_line)
+        out.write_line(lg_lines["NL"]["head"])
+        out.write_line(lg_lines["NL"]["EAST"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["NL"]["EAST"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line(lg_lines["NL"]["CENTRAL"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["NL"]["CENTRAL"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line(lg_lines["NL"]["WEST"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["NL"]["WEST"]["team_lines"])
+        out.write_line(sep_line)
+        out.write_line()
+
+
+def run_wildcard(sink=None):
+
+    # get both leagues' standings from the shared snapshot
+    snapshot = get_standings_snapshot()
+    if snapshot is None:
+        with open_screen(sink) as out:
+            out.write_line(_STANDINGS_UNAVAILABLE_MESSAGE)
+        return
+    df_standings = snapshot.table.copy()
+
+    # sort standings dataframe
     df_standings.sort_values("wpct", ascending=False, inplace=True)
     df_standings.drop(
         columns=[
@@ -368,46 +461,24 @@ def run_wildcard():
     lg_lines = {
         "AL": {
             "head": "•",
-            "leader_lines": ["•"] * 3,
-            "wc_lines": ["•"] * 12,
         },
         "NL": {
             "head": "•",
-            "leader_lines": ["•"] * 3,
-            "wc_lines": ["•"] * 12,
         },
     }
 
     # make the pct pretty
-    df_standings.PCT = [f"{np.round(v,3):5.03f}" for v in df_standings.PCT]
+    df_standings.PCT = format_pct_column(df_standings.PCT)
     df_standings.DIV = (
         df_standings.DIV.str[3:].str[0].str.cat(df_standings.RK.astype(str))
     )
 
-    # loop over the dictionary of columns
+    # loop over the dictionary of columns for the header lines
     for k, v in char_dict.items():
         head_line += " "
         sep_line += "•"
         for lg in ["AL", "NL"]:
             lg_lines[lg]["head"] += " "  # if k == "TEAM" else "•"
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] == 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["leader_lines"][idx] += " "
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] != 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["wc_lines"][idx] += " "
 
         head_line += f"{k:>{v}s}"
         sep_line += "•" * v
@@ -418,71 +489,45 @@ def run_wildcard():
                 ] += f"{'AMERICAN LEAGUE' if lg == 'AL' else 'NATIONAL LEAGUE':<{v}s}"
             else:
                 lg_lines[lg]["head"] += f"{k:>{v}s}"  # " "*v
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] == 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["leader_lines"][idx] += f"{row[k]:>{v}}"
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] != 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["wc_lines"][idx] += f"{row[k]:>{v}}"
 
         head_line += " •"
         sep_line += "••"
         for lg in ["AL", "NL"]:
             lg_lines[lg]["head"] += " •" if k == "TEAM" else " •"
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] == 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["leader_lines"][idx] += " •"
-            for idx, row in (
-                df_standings[
-                    (df_standings["lg_name"].str.upper() == lg)
-                    & (df_standings["RK"] != 1)
-                ]
-                .reset_index()
-                .iterrows()
-            ):
-                lg_lines[lg]["wc_lines"][idx] += " •"
+
+    # format every team line at once, then split into leaders and the rest
+    team_lines = format_standings_lines(df_standings, char_dict)
+    team_lines_by_group = team_lines.groupby(
+        [df_standings["lg_name"].str.upper(), df_standings["RK"] == 1], sort=False
+    ).agg(list)
+    for lg in ["AL", "NL"]:
+        lg_lines[lg]["leader_lines"] = pad_standings_lines(
+            team_lines_by_group.get((lg, True), []), 3
+        )
+        lg_lines[lg]["wc_lines"] = pad_standings_lines(
+            team_lines_by_group.get((lg, False), []), 12
+        )
 
     # make a wildcard standings printout
 
-    print()
-    print(sep_line)
-    print(lg_lines["AL"]["head"])
-    print(sep_line)
-    for line in lg_lines["AL"]["leader_lines"]:
-        print(line)
-    print(sep_line)
-    for line in lg_lines["AL"]["wc_lines"]:
-        print(line)
-    print(sep_line)
-    print()
-    print(sep_line)
-    print(lg_lines["NL"]["head"])
-    print(sep_line)
-    for line in lg_lines["NL"]["leader_lines"]:
-        print(line)
-    print(sep_line)
-    for line in lg_lines["NL"]["wc_lines"]:
-        print(line)
-    print(sep_line)
-    print()
+    with open_screen(sink) as out:
+        out.write_line()
+        out.write_line(sep_line)
+        out.write_line(lg_lines["AL"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["AL"]["leader_lines"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["AL"]["wc_lines"])
+        out.write_line(sep_line)
+        out.write_line()
+        out.write_line(sep_line)
+        out.write_line(lg_lines["NL"]["head"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["NL"]["leader_lines"])
+        out.write_line(sep_line)
+        out.write_lines(lg_lines["NL"]["wc_lines"])
+        out.write_line(sep_line)
+        out.write_line()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,11 @@ _CLI_LINE_LENGTH_DEFAULT = 80
 _CLI_LINE_LENGTH_WIDE_DEFAULT = 120
 
 
+def get_stat_line_format(stats_appetite: list[int], vert_char="|") -> str:
+    """get the format string for a line of stats, given each column's width"""
+    return (" %s " % vert_char).join(["%" + str(x) + "s" for x in stats_appetite])
+
+
 def format_pitchers(
     pitcher_list: dict[str : list[BoxScorePitcher]],
     indent_size=2,
@@ -20,48 +25,14 @@ def format_pitchers(
     format one or both teams' pitchers
     """
 
-    stats_appetite = [-1 for x in pitcher_list["away"][0].get_appetite_stats()]
-    for tmkey in ("away", "home"):
-        for bsr in pitcher_list[tmkey]:
-            for idx_stat in range(len(stats_appetite)):
-                stats_appetite[idx_stat] = max(
-                    [stats_appetite[idx_stat], bsr.get_appetite_stats()[idx_stat]]
-                )
+    # size every column once, across both teams
+    stats_appetite = get_appetite_columns(
+        [pitcher_list["away"], pitcher_list["home"]], BoxScorePitcher
+    )
     stats_appetite_total = sum(stats_appetite) + (len(stats_appetite) - 1) * len(
         " %s " % vert_char
     )
 
-    staff_to_stats = {
-        "away": [],
-        "home": [],
-    }
-    staff_to_bsp = {
-        "away": [],
-        "home": [],
-    }
-    lines_out = {
-        "away": [],
-        "home": [],
-    }
-
-    line_output_fmt = ""
-    for x in ["%" + str(x) + "s " + vert_char + " " for x in stats_appetite]:
-        line_output_fmt += x
-    line_output_fmt = line_output_fmt[:-3]
-    for tmkey in ("away", "home"):
-        for bsp in pitcher_list[tmkey]:
-            line_output = line_output_fmt % (
-                bsp.innings_pitched,
-                bsp.hits,
-                bsp.runs,
-                bsp.runs_earned,
-                bsp.bb,
-                bsp.strikeouts,
-                bsp.hr,
-            )
-            staff_to_stats[tmkey].append(line_output)
-            staff_to_bsp[tmkey].append(bsp)
-
     resid_char = (
         (_CLI_LINE_LENGTH_WIDE_DEFAULT if wide_display else _CLI_LINE_LENGTH_DEFAULT)
         - indent_size * init_indent
@@ -69,32 +40,36 @@ def format_pitchers(
         - 4
     )
 
+    # prepare the templates and the header, which are shared by both teams
+    indent_line = " " * indent_size * init_indent
+    line_output_fmt = get_stat_line_format(stats_appetite, vert_char)
+    name_sector_fmt = "%-" + str(resid_char) + "s"
+    header_line = (
+        indent_line
+        + " " * resid_char
+        + " %s  " % vert_char
+        + (" %s " % vert_char).join(BoxScorePitcher.get_header_stats())
+    )
+
+    lines_out = {
+        "away": [],
+        "home": [],
+    }
+
     for tmkey in ("away", "home"):
-        header_line = (
-            " " * indent_size * init_indent
-            + " " * resid_char
-            + " %s  " % vert_char
-            + "".join(
-                [(x + " %s " % vert_char) for x in BoxScorePitcher.get_header_stats()]
-            )[:-3]
-        )
         lines_out[tmkey].append(header_line)
-        for pitcher_index in range(len(staff_to_stats[tmkey])):
-            statline = staff_to_stats[tmkey][pitcher_index]
-            prefix_line = " %1d: " % (pitcher_index + 1)
-            bsp = staff_to_bsp[tmkey][pitcher_index]
-            name_sector = "%s%s, %s (#%s)" % (
-                prefix_line,
+        for pitcher_index, bsp in enumerate(pitcher_list[tmkey]):
+            name_sector = " %1d: %s, %s (#%s)" % (
+                pitcher_index + 1,
                 bsp.lastname_player,
                 bsp.firstname_player,
                 bsp.jersey_player,
             )
-            name_sector_fmt = "%-" + str(resid_char) + "s"
             line = (
-                " " * indent_size * init_indent
+                indent_line
                 + (name_sector_fmt % name_sector)
                 + " %s " % vert_char
-                + statline
+                + line_output_fmt % bsp.get_stats()
             )
             lines_out[tmkey].append(line)
 
@@ -113,21 +88,32 @@ def format_batters(
     format one or both teams' batters
     """
 
-    stats_appetite = [-1 for x in batter_list["away"][0].get_appetite_stats()]
-    for tmkey in ("away", "home"):
-        for bsr in batter_list[tmkey]:
-            for idx_stat in range(len(stats_appetite)):
-                stats_appetite[idx_stat] = max(
-                    [stats_appetite[idx_stat], bsr.get_appetite_stats()[idx_stat]]
-                )
+    # size every column once, across both teams
+    stats_appetite = get_appetite_columns(
+        [batter_list["away"], batter_list["home"]], BoxScoreBatter
+    )
     stats_appetite_total = sum(stats_appetite) + (len(stats_appetite) - 1) * len(
         " %s " % vert_char
     )
 
-    lineups_to_stats = {
-        "away": {x: [] for x in range(1, 9 + 1)},
-        "home": {x: [] for x in range(1, 9 + 1)},
-    }
+    resid_char = (
+        (_CLI_LINE_LENGTH_WIDE_DEFAULT if wide_display else _CLI_LINE_LENGTH_DEFAULT)
+        - indent_size * init_indent
+        - stats_appetite_total
+        - 4
+    )
+
+    # prepare the templates and the header, which are shared by both teams
+    indent_line = " " * indent_size * init_indent
+    line_output_fmt = get_stat_line_format(stats_appetite, vert_char)
+    name_sector_fmt = "%-" + str(resid_char) + "s"
+    header_line = (
+        indent_line
+        + " " * resid_char
+        + " %s " % vert_char
+        + (" %s " % vert_char).join(BoxScoreBatter.get_header_stats())
+    )
+
     lineups_to_bsb = {
         "away": {x: [] for x in range(1, 9 + 1)},
         "home": {x: [] for x in range(1, 9 + 1)},
@@ -137,53 +123,22 @@ def format_batters(
         "home": [],
     }
 
-    line_output_fmt = ""
-    for x in ["%" + str(x) + "s " + vert_char + " " for x in stats_appetite]:
-        line_output_fmt += x
-    line_output_fmt = line_output_fmt[:-3]
     for tmkey in ("away", "home"):
         for bsb in batter_list[tmkey]:
-            line_output = line_output_fmt % (
-                bsb.ab,
-                bsb.runs,
-                bsb.hits,
-                bsb.rbi,
-                bsb.bb,
-                bsb.so,
-                bsb.po,
-                bsb.asst,
-            )
             if bsb.batting_order is None:
                 continue  # TODO: debug this case (718360)
             lineup_pos = int(bsb.batting_order[0])
             lineup_count = int(str(bsb.batting_order[1:]))
-            assert lineup_pos in lineups_to_stats[tmkey]
+            assert lineup_pos in lineups_to_bsb[tmkey]
             if lineup_count > 0:
-                assert len(lineups_to_stats[tmkey][lineup_pos]) == lineup_count
-            lineups_to_stats[tmkey][lineup_pos].append(line_output)
+                assert len(lineups_to_bsb[tmkey][lineup_pos]) == lineup_count
             lineups_to_bsb[tmkey][lineup_pos].append(bsb)
 
-    resid_char = (
-        (_CLI_LINE_LENGTH_WIDE_DEFAULT if wide_display else _CLI_LINE_LENGTH_DEFAULT)
-        - indent_size * init_indent
-        - stats_appetite_total
-        - 4
-    )
-
     for tmkey in ("away", "home"):
-        header_line = (
-            " " * indent_size * init_indent
-            + " " * resid_char
-            + " %s " % vert_char
-            + "".join(
-                [(x + " %s " % vert_char) for x in BoxScoreBatter.get_header_stats()]
-            )[:-3]
-        )
         lines_out[tmkey].append(header_line)
-        for poskey in lineups_to_stats[tmkey]:
-            for subno, statline in enumerate(lineups_to_stats[tmkey][poskey]):
+        for poskey in lineups_to_bsb[tmkey]:
+            for subno, bsb in enumerate(lineups_to_bsb[tmkey][poskey]):
                 prefix_line = " %1d: " % poskey if subno == 0 else "      "
-                bsb = lineups_to_bsb[tmkey][poskey][subno]
                 name_sector = "%s%s, %s (#%s), %s" % (
                     prefix_line,
                     bsb.lastname_player,
@@ -191,12 +146,11 @@ def format_batters(
                     bsb.jersey_player,
                     bsb.pos,
                 )
-                name_sector_fmt = "%-" + str(resid_char) + "s"
                 line = (
-                    " " * indent_size * init_indent
+                    indent_line
                     + (name_sector_fmt % name_sector)
                     + " %s " % vert_char
-                    + statline
+                    + line_output_fmt % bsb.get_stats()
                 )
                 lines_out[tmkey].append(line)
 
@@ -0,0 +1,124 @@
+import json
+
+from crackerjack.tools_mlbapi import Team
+from crackerjack.tools_linescore import LineScoreInning, LineScoreTable
+from crackerjack.tools_boxscore import BoxScoreBatterArray, BoxScorePitcherArray
+from crackerjack.tools_schedule import get_team_abbrev
+
+# the per-side fields of a linescore inning, and what they're called in json
+_LINESCORE_JSON_CODES = ("R", "H", "E", "LOB")
+
+
+def dump_json(data) -> str:
+    """turn json-ready data into text, the same way for every command"""
+    return json.dumps(data, indent=2)
+
+
+def get_team_json(team: Team) -> dict:
+    """get a team's names as json-ready data"""
+    return {
+        "abbrev": team.abbrev,
+        "location_name": team.location_name,
+        "team_name": team.team_name,
+        "short_name": team.short_name,
+        "full_name": team.full_name,
+    }
+
+
+def get_inning_json(lsi: LineScoreInning) -> dict:
+    """get one linescore inning as json-ready data"""
+    return {
+        "inning": lsi.inn_no,
+        "away": {code: getattr(lsi, code + "_away") for code in _LINESCORE_JSON_CODES},
+        "home": {code: getattr(lsi, code + "_home") for code in _LINESCORE_JSON_CODES},
+    }
+
+
+def get_linescore_json(gamePk, linescore_parts: dict) -> dict:
+    """
+    get a game's linescore as json-ready data
+
+    `linescore_parts` is the innings, teams, venue, and decisions dict that the
+    linescore printers take; if it's None (the game couldn't be downloaded),
+    the game is marked as unavailable
+    """
+
+    if linescore_parts is None:
+        return {"gamePk": gamePk, "unavailable": True}
+
+    totals = LineScoreTable(linescore_parts["innings"]).get_totals()
+    decisions = linescore_parts.get("decisions")
+
+    return {
+        "gamePk": gamePk,
+        "venue": linescore_parts.get("venue"),
+        "teams": {
+            key: get_team_json(linescore_parts["teams"][key])
+            for key in ("away", "home")
+        },
+        "innings": [get_inning_json(lsi) for lsi in linescore_parts["innings"]],
+        "totals": {
+            key: {code: totals[code + "_" + key] for code in _LINESCORE_JSON_CODES}
+            for key in ("away", "home")
+        },
+        "decisions": decisions if type(decisions) == dict else None,
+    }
+
+
+def get_record_json(record, record_array_class) -> dict:
+    """get a box score line as json-ready data, field by field"""
+    return {name: getattr(record, name) for name, _ in record_array_class._fields}
+
+
+def get_boxscore_json(summary) -> dict:
+    """get a game's box score, from its GameSummary, as json-ready data"""
+
+    data_box = get_linescore_json(summary.gamePk, summary.linescore_parts)
+    data_box["date"] = summary.date
+    data_box["batters"] = {
+        key: [get_record_json(x, BoxScoreBatterArray) for x in summary.batters[key]]
+        for key in ("away", "home")
+    }
+    data_box["pitchers"] = {
+        key: [get_record_json(x, BoxScorePitcherArray) for x in summary.pitchers[key]]
+        for key in ("away", "home")
+    }
+    data_box["info_teams"] = {
+        key: {title: dict(fields) for title, fields in summary.info_teams[key].items()}
+        for key in ("away", "home")
+    }
+    data_box["info_box"] = dict(summary.info_box)
+    return data_box
+
+
+def get_standings_json(df_standings) -> list[dict]:
+    """get a standings table as json-ready data, one dict per team"""
+    return json.loads(df_standings.to_json(orient="records"))
+
+
+def get_sparklines_json(season_results) -> list[dict]:
+    """
+    get every team's season results as json-ready data, best record first
+
+    results are a string with a W or L for each game, in order
+    """
+
+    wins_all = season_results.wins.tolist()
+    losses_all = season_results.losses.tolist()
+    wpct_all = season_results.wpct.tolist()
+
+    lines = []
+    for idx_team, id_team in enumerate(season_results.team_ids):
+        lines.append(
+            {
+                "id": id_team,
+                "abbrev": get_team_abbrev(id_team),
+                "wins": wins_all[idx_team],
+                "losses": losses_all[idx_team],
+                "wpct": wpct_all[idx_team],
+                "results": "".join(
+                    ["W" if v else "L" for v in season_results.get_wins_vec(id_team)]
+                ),
+            }
+        )
+    return list(sorted(lines, key=lambda v: v["wpct"], reverse=True))
@@ -1,4 +1,7 @@
-from colorama import Fore, Back, Style
+from collections import namedtuple
+from functools import lru_cache
+
+from crackerjack.tools_output import get_palette, get_use_color
 
 
 from crackerjack.tools_mlbapi import *
@@ -8,12 +11,28 @@ from crackerjack.tools_linescore import *
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_DEFAULT
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_WIDE_DEFAULT
 
+_LINESCORE_LAYOUT_CACHE_SIZE = 128  # compiled linescore layouts kept around
 
-def format_linescore(
-    linescoreinning_list: list[LineScoreInning],
-    teams: dict[Team],
-    decision_dict=None,
-    venue=None,
+LineScoreLayout = namedtuple(
+    "LineScoreLayout",
+    [
+        "format_name_dense",  # name column, up to the team name
+        "format_name_sparse",
+        "format_line_dense",  # innings and RHE columns
+        "format_line_sparse",
+        "line_top_dense",  # innings and RHE header, filled in
+        "line_bot_dense",  # innings and RHE spacing line, filled in
+        "residual_spaces_dense",  # what's left on the line for the team name
+        "residual_spaces_sparse",
+    ],
+)
+
+
+@lru_cache(maxsize=_LINESCORE_LAYOUT_CACHE_SIZE)
+def get_linescore_layout(
+    inn_nos: tuple[int],
+    appetites: tuple[int],
+    RHE_spaces: tuple[int],
     cross_char="+",
     vert_char="|",
     horz_char="-",
@@ -21,36 +40,29 @@ def format_linescore(
     min_spaces_sparse=1,
     indent_dense=0,
     indent_sparse=2,
-    force_uppercase_team=True,
-    use_top_spacing_line=False,
-    use_bottom_spacing_line=False,
     wide_display=False,
-) -> list[str]:
+    use_color=True,
+) -> LineScoreLayout:
     """
-    TODO: create this documentation
+    compile the format strings and static rows for a linescore layout
+
+    everything here depends only on the layout signature (the innings, the
+    width of each column, the border characters, and the display width), not
+    on the game, so it's built once per signature and reused for every game
+    that shares it; only the away and home values are filled in per game
     """
 
+    palette = get_palette(use_color)
+
     # craete the format string
     format_name_dense = ""
     format_name_sparse = ""
     format_line_dense = ""
     format_line_sparse = ""
 
-    # create substitution sets for each line permutation
-    substitution_set_name_top_dense = []
-    substitution_set_name_away_dense = []
-    substitution_set_name_home_dense = []
-    substitution_set_name_bot_dense = []
-    substitution_set_name_top_sparse = []
-    substitution_set_name_away_sparse = []
-    substitution_set_name_home_sparse = []
+    # create substitution sets for the static lines
     substitution_set_line_top_dense = []
-    substitution_set_line_away_dense = []
-    substitution_set_line_home_dense = []
     substitution_set_line_bot_dense = []
-    substitution_set_line_top_sparse = []
-    substitution_set_line_away_sparse = []
-    substitution_set_line_home_sparse = []
 
     # start a count of the spaces
     spaces_linescore_dense = 0
@@ -65,103 +77,68 @@ def format_linescore(
     # add the stuff before the innings
     spaces_linescore_dense += 2  # border char and one space before name
     format_name_dense += "%1s "
-    substitution_set_name_top_dense.append(cross_char)
-    substitution_set_name_away_dense.append(vert_char)
-    substitution_set_name_home_dense.append(vert_char)
-    substitution_set_name_bot_dense.append(cross_char)
     spaces_linescore_dense += 3  # border char and one space (at least) after name
     format_line_dense += " %1s "
     substitution_set_line_top_dense.append(cross_char)
-    substitution_set_line_away_dense.append(cross_char)
-    substitution_set_line_home_dense.append(cross_char)
     substitution_set_line_bot_dense.append(cross_char)
     spaces_linescore_sparse += 2  # border char and one space before name
     format_name_sparse += ""
     spaces_linescore_sparse += 1  # border char and one space (at least) after name
     format_line_sparse += " "
 
-    # loop through the innings, formatting on the fly
-    for idx_lsi, lsi in enumerate(linescoreinning_list):
+    # loop through the innings
+    for idx_lsi, (inn_no, appetite) in enumerate(zip(inn_nos, appetites)):
         # spaces_linescore_dense += 1 # border char before
         spaces_linescore_dense += 1  # buffer space before
         spaces_linescore_dense += max(
-            lsi.get_appetite(), min_spaces_dense
+            appetite, min_spaces_dense
         )  # spaces needed for this lsi element
         spaces_linescore_dense += 1  # buffer space after
         spaces_linescore_dense += 1  # border char after
         format_line_dense += (
             " "
-            + Fore.CYAN
+            + palette.CYAN
             + "%"
-            + str(max(lsi.get_appetite(), min_spaces_dense))
+            + str(max(appetite, min_spaces_dense))
             + "s"
-            + Fore.RESET
+            + palette.RESET
             + " %1s"
         )
-        substitution_set_line_top_dense.append(lsi.inn_no)
-        substitution_set_line_away_dense.append(
-            lsi.R_away if lsi.R_away is not None else " " * lsi.get_appetite()
-        )
-        substitution_set_line_home_dense.append(
-            lsi.R_home if lsi.R_home is not None else " " * lsi.get_appetite()
-        )
-        substitution_set_line_bot_dense.append(horz_char * lsi.get_appetite())
+        substitution_set_line_top_dense.append(inn_no)
+        substitution_set_line_bot_dense.append(horz_char * appetite)
         substitution_set_line_top_dense.append(cross_char)
-        substitution_set_line_away_dense.append(cross_char)
-        substitution_set_line_home_dense.append(cross_char)
         substitution_set_line_bot_dense.append(cross_char)
 
         if (idx_lsi % 3 == 0) and (idx_lsi != 0):
             spaces_linescore_sparse += 2  # every three innings, add extra spaces before
             format_line_sparse += "  "
         spaces_linescore_sparse += max(
-            lsi.get_appetite(), min_spaces_sparse
+            appetite, min_spaces_sparse
         )  # space needed for this lsi element
         spaces_linescore_sparse += 1  # buffer space after
-        format_line_sparse += (
-            "%" + str(max(lsi.get_appetite(), min_spaces_sparse)) + "s "
-        )
-        substitution_set_line_top_sparse.append(lsi.inn_no)
-        substitution_set_line_away_sparse.append(lsi.R_away)
-        substitution_set_line_home_sparse.append(
-            lsi.R_home if lsi.R_home is not None else " " * lsi.get_appetite()
-        )
+        format_line_sparse += "%" + str(max(appetite, min_spaces_sparse)) + "s "
 
     # work on RHE ending
     spaces_linescore_sparse += 2  # buffer spaces before summary
     format_line_sparse += " -"
     spaces_linescore_dense += 1
     format_line_dense += "\b" + 2 * cross_char
-    RHE_dict = extract_RHE(linescoreinning_list)  # get the RHE stuff
-    for RHEcode in ["R", "H", "E"]:
+    for RHEcode, RHE_space in zip(["R", "H", "E"], RHE_spaces):
         spaces_linescore_dense += 1  # buffer space before summary term
-        spaces_linescore_dense += RHE_dict[RHEcode]["spaces"]
+        spaces_linescore_dense += RHE_space
         spaces_linescore_dense += 1  # buffer space after summary term
         spaces_linescore_dense += 1  # border char after summary term
         format_line_dense += (
-            " "
-            + Fore.WHITE
-            + "%"
-            + str(RHE_dict[RHEcode]["spaces"])
-            + "s"
-            + Fore.RESET
-            + " %1s"
+            " " + palette.WHITE + "%" + str(RHE_space) + "s" + palette.RESET + " %1s"
         )
         substitution_set_line_top_dense.append(RHEcode)
-        substitution_set_line_away_dense.append(RHE_dict[RHEcode]["away"])
-        substitution_set_line_home_dense.append(RHE_dict[RHEcode]["home"])
-        substitution_set_line_bot_dense.append(horz_char * RHE_dict[RHEcode]["spaces"])
+        substitution_set_line_bot_dense.append(horz_char * RHE_space)
         substitution_set_line_top_dense.append(cross_char)
-        substitution_set_line_away_dense.append(cross_char)
-        substitution_set_line_home_dense.append(cross_char)
         substitution_set_line_bot_dense.append(cross_char)
 
         spaces_linescore_sparse += 1  # buffer spaces before summary term
-        spaces_linescore_sparse += RHE_dict[RHEcode]["spaces"]
-        format_line_sparse += " %" + str(RHE_dict[RHEcode]["spaces"]) + "s"
-        substitution_set_line_top_sparse.append(RHEcode)
-        substitution_set_line_away_sparse.append(RHE_dict[RHEcode]["away"])
-        substitution_set_line_home_sparse.append(RHE_dict[RHEcode]["home"])
+        spaces_linescore_sparse += RHE_space
+        format_line_sparse += " %" + str(RHE_space) + "s"
 
     residual_spaces_dense = (
         _CLI_LINE_LENGTH_WIDE_DEFAULT if wide_display else _CLI_LINE_LENGTH_DEFAULT
@@ -170,6 +147,118 @@ def format_linescore(
         _CLI_LINE_LENGTH_WIDE_DEFAULT if wide_display else _CLI_LINE_LENGTH_DEFAULT
     ) - spaces_linescore_sparse
 
+    return LineScoreLayout(
+        format_name_dense,
+        format_name_sparse,
+        format_line_dense,
+        format_line_sparse,
+        format_line_dense % tuple(substitution_set_line_top_dense),
+        format_line_dense % tuple(substitution_set_line_bot_dense),
+        residual_spaces_dense,
+        residual_spaces_sparse,
+    )
+
+
+def format_linescore(
+    linescoreinning_list: list[LineScoreInning] | LineScoreTable,
+    teams: dict[Team],
+    decision_dict=None,
+    venue=None,
+    cross_char="+",
+    vert_char="|",
+    horz_char="-",
+    min_spaces_dense=2,
+    min_spaces_sparse=1,
+    indent_dense=0,
+    indent_sparse=2,
+    force_uppercase_team=True,
+    use_top_spacing_line=False,
+    use_bottom_spacing_line=False,
+    wide_display=False,
+    use_color=None,
+) -> list[str]:
+    """
+    TODO: create this documentation
+    """
+
+    # without a say either way, color only if stdout is a terminal
+    if use_color is None:
+        use_color = get_use_color()
+    palette = get_palette(use_color)
+
+    # pull the linescore into columns, and size every inning in one pass
+    linescore_table = (
+        linescoreinning_list
+        if isinstance(linescoreinning_list, LineScoreTable)
+        else LineScoreTable(linescoreinning_list)
+    )
+    appetites = linescore_table.get_appetites().tolist()
+    RHE_dict = linescore_table.get_RHE()  # get the RHE stuff
+
+    # get the format strings and static rows for this layout, compiled once
+    layout = get_linescore_layout(
+        tuple(linescore_table.inn_no.tolist()),
+        tuple(appetites),
+        tuple(RHE_dict[RHEcode]["spaces"] for RHEcode in ["R", "H", "E"]),
+        cross_char=cross_char,
+        vert_char=vert_char,
+        horz_char=horz_char,
+        min_spaces_dense=min_spaces_dense,
+        min_spaces_sparse=min_spaces_sparse,
+        indent_dense=indent_dense,
+        indent_sparse=indent_sparse,
+        wide_display=wide_display,
+        use_color=use_color,
+    )
+    format_name_dense = layout.format_name_dense
+    format_name_sparse = layout.format_name_sparse
+    format_line_dense = layout.format_line_dense
+    format_line_sparse = layout.format_line_sparse
+    residual_spaces_dense = layout.residual_spaces_dense
+
+    # create substitution sets for each line permutation
+    substitution_set_name_top_dense = [cross_char]
+    substitution_set_name_away_dense = [vert_char]
+    substitution_set_name_home_dense = [vert_char]
+    substitution_set_name_bot_dense = [cross_char]
+    substitution_set_name_top_sparse = []
+    substitution_set_name_away_sparse = []
+    substitution_set_name_home_sparse = []
+    substitution_set_line_away_dense = [cross_char]
+    substitution_set_line_home_dense = [cross_char]
+    substitution_set_line_away_sparse = []
+    substitution_set_line_home_sparse = []
+
+    # fill in the per-game values: runs by inning...
+    for R_away, R_home, appetite in zip(
+        linescore_table.get_column("R_away"),
+        linescore_table.get_column("R_home"),
+        appetites,
+    ):
+        substitution_set_line_away_dense.append(
+            R_away if R_away is not None else " " * appetite
+        )
+        substitution_set_line_home_dense.append(
+            R_home if R_home is not None else " " * appetite
+        )
+        substitution_set_line_away_dense.append(cross_char)
+        substitution_set_line_home_dense.append(cross_char)
+
+        substitution_set_line_away_sparse.append(R_away)
+        substitution_set_line_home_sparse.append(
+            R_home if R_home is not None else " " * appetite
+        )
+
+    # ...and the RHE ending
+    for RHEcode in ["R", "H", "E"]:
+        substitution_set_line_away_dense.append(RHE_dict[RHEcode]["away"])
+        substitution_set_line_home_dense.append(RHE_dict[RHEcode]["home"])
+        substitution_set_line_away_dense.append(cross_char)
+        substitution_set_line_home_dense.append(cross_char)
+
+        substitution_set_line_away_sparse.append(RHE_dict[RHEcode]["away"])
+        substitution_set_line_home_sparse.append(RHE_dict[RHEcode]["home"])
+
     spaces_team_fullname = max([len(team.full_name) for team in teams.values()])
     spaces_team_cityname = max([len(team.location_name) for team in teams.values()])
     spaces_team_shortname = max([len(team.short_name) for team in teams.values()])
@@ -221,12 +310,12 @@ def format_linescore(
     # print the results (DEBUG!!!!!)
     lines_dense.append(
         (format_name_dense % tuple(substitution_set_name_top_dense))
-        + (format_line_dense % tuple(substitution_set_line_top_dense))
+        + layout.line_top_dense
     )
     if use_top_spacing_line:
         lines_dense.append(
             (format_name_dense % tuple(substitution_set_name_bot_dense))
-            + (format_line_dense % tuple(substitution_set_line_bot_dense))
+            + layout.line_bot_dense
         )
     lines_dense.append(
         (format_name_dense % tuple(substitution_set_name_away_dense))
@@ -239,7 +328,7 @@ def format_linescore(
     if use_bottom_spacing_line:
         lines_dense.append(
             (format_name_dense % tuple(substitution_set_name_bot_dense))
-            + (format_line_dense % tuple(substitution_set_line_bot_dense))
+            + layout.line_bot_dense
         )
 
     lines_sparse.append(
@@ -270,9 +359,9 @@ def format_linescore(
         venue_line += (
             horz_char * fill_horz_char_venue
             + cross_char
-            + Fore.GREEN
+            + palette.GREEN
             + dtf(venue)
-            + Fore.RESET
+            + palette.RESET
             + venue_line_ending
         )
         lines_dense.append(venue_line)
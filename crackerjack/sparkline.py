@@ -1,106 +1,193 @@
 import os.path
 from datetime import datetime, timedelta
+from itertools import groupby
 
 import argparse
 from pprint import pprint
 from re import S
 
-from colorama import Fore, Back, Style
+import numpy as np
 
 # import crackerjack.boxscore as boxscore
 import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_output import get_palette, get_use_color, open_screen
 
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_DEFAULT
 from crackerjack.formatters_boxscore import _CLI_LINE_LENGTH_WIDE_DEFAULT
-from crackerjack.tools_mlbapi import _MLB_TEAM_GAMES_FORMAT_STRING
 
 from crackerjack.team_lookup import team_list
 
 
-def run_sparkline(season=datetime.now().year):
+class SeasonResults(object):
+    """
+    store a season's final regular-season results as a team x game matrix
 
-    team_output = []
+    one league-wide schedule is walked once; `played[i, j]` marks that team
+    `i` played in game `j`, and `won[i, j]` that it won, with games in
+    schedule order, so every team's record and sparkline comes out of a row.
+    """
 
-    print("gathering sparklines...", end="", flush=True)
-    for id_team, team_data in team_list.items():
+    _team_ids: list[int]
+    _team_index: dict[int:int]
+    _played: np.ndarray
+    _won: np.ndarray
 
-        team_games_data = tools_mlbapi.download_json_url(
-            _MLB_TEAM_GAMES_FORMAT_STRING % (id_team, season),
-        )
+    def __init__(self, sched_data: dict, team_ids=None):
+        self._team_ids = list(team_ids if team_ids is not None else team_list.keys())
+        self._team_index = {id_team: idx for idx, id_team in enumerate(self._team_ids)}
 
+        idx_rows = []
+        idx_cols = []
+        is_winner = []
         game_count = 0
-        wins_vec = []
-        for date_data in team_games_data["dates"]:
+        for date_data in sched_data["dates"]:
             for game_data in date_data["games"]:
                 if game_data["gameType"] != "R":
-                    # print("DEBUG!!!!! skipping non-regular game")
                     continue
                 if game_data["status"]["statusCode"] != "F":
-                    # print("DEBUG!!!!! skipping non-final game")
                     continue
+                for tm_key in ("away", "home"):
+                    id_team = game_data["teams"][tm_key]["team"]["id"]
+                    if id_team not in self._team_index:
+                        continue
+                    idx_rows.append(self._team_index[id_team])
+                    idx_cols.append(game_count)
+                    is_winner.append(bool(game_data["teams"][tm_key].get("isWinner")))
                 game_count += 1
 
-                if game_data["teams"]["home"]["team"]["id"] == id_team:
-                    wins_vec.append(game_data["teams"]["home"]["isWinner"])
-                    # print("DEBUG!!!!! home game")
-                elif game_data["teams"]["away"]["team"]["id"] == id_team:
-                    wins_vec.append(game_data["teams"]["away"]["isWinner"])
-                    # print("DEBUG!!!!! away game")
-                else:
-                    assert False
-
-        wins = sum(wins_vec)
-        losses = sum([not v for v in wins_vec])
-        wpct = wins / (wins + losses)
-
-        # char_available = _CLI_LINE_LENGTH_DEFAULT - 2
-        char_available = _CLI_LINE_LENGTH_WIDE_DEFAULT - 2
-
-        if char_available > len(wins_vec):
-            output_lines = (
-                f"{team_data["abbreviation"]:>3s} "
-                + f"{sum(wins_vec)}-{sum([not v for v in wins_vec])}:\n"
-            )
+        self._played = np.zeros((len(self._team_ids), game_count), dtype=bool)
+        self._won = np.zeros((len(self._team_ids), game_count), dtype=bool)
+        self._played[idx_rows, idx_cols] = True
+        self._won[idx_rows, idx_cols] = is_winner
+
+    @property
+    def team_ids(self) -> list[int]:
+        return list(self._team_ids)
+
+    @property
+    def wins(self) -> np.ndarray:
+        """wins for every team, in `team_ids` order"""
+        return self._won.sum(axis=1)
+
+    @property
+    def losses(self) -> np.ndarray:
+        """losses for every team, in `team_ids` order"""
+        return (self._played & ~self._won).sum(axis=1)
+
+    @property
+    def wpct(self) -> np.ndarray:
+        """winning percentage for every team, in `team_ids` order"""
+        games = self._played.sum(axis=1)
+        return np.divide(
+            self.wins, games, out=np.zeros(len(games), dtype=float), where=games > 0
+        )
 
-            sparkline = (
-                "".join([Fore.GREEN + "^" if v else Fore.RED + "v" for v in wins_vec])
-                + Fore.RESET
+    def get_wins_vec(self, id_team: int) -> np.ndarray:
+        """get a team's results in order, True for a win"""
+        idx_team = self._team_index[id_team]
+        return self._won[idx_team, self._played[idx_team]]
+
+
+def download_season_results(season=datetime.now().year) -> SeasonResults:
+    """
+    get a season's results matrix from one league-wide schedule request
+
+    returns None if the schedule couldn't be downloaded
+    """
+    sched_data = tools_mlbapi.download_season_games(season)
+    if sched_data is None:
+        return None
+    return SeasonResults(sched_data)
+
+
+def format_sparkline(wins_vec: list[bool], use_color=True) -> str:
+    """
+    draw a string of wins and losses as ^ and v
+
+    with color, each streak gets one escape code rather than every game
+    """
+
+    if not use_color:
+        return "".join(["^" if v else "v" for v in wins_vec])
+
+    palette = get_palette(use_color)
+    sparkline = ""
+    for won, streak in groupby(wins_vec):
+        mark = "^" if won else "v"
+        sparkline += (palette.GREEN if won else palette.RED) + mark * len(list(streak))
+    return sparkline + palette.RESET
+
+
+def run_sparkline(season=datetime.now().year, sink=None) -> bool:
+    """write every team's sparkline, returning False if the season's unavailable"""
+    with open_screen(sink) as out:
+        use_color = get_use_color(out)
+        team_output = []
+
+        # let the user know we're working on it, but keep that out of files/pipes
+        show_progress = out.isatty()
+        if show_progress:
+            out.write("gathering sparklines...")
+            out.flush()
+        season_results = download_season_results(season)
+        if season_results is None:
+            out.write_line(
+                " unavailable right now; try again soon.\n"
+                if show_progress
+                else "Sparklines aren't available right now; try again soon.\n"
             )
-            output_lines += f"  {sparkline:>{char_available}s}"
-        else:
-            wins_vec_working = wins_vec.copy()
+            return False
+        wins_all = season_results.wins
+        losses_all = season_results.losses
+        wpct_all = season_results.wpct
 
-            output_lines = (
-                f"{team_data["abbreviation"]:>4s} "
-                + f"{sum(wins_vec)}-{sum([not v for v in wins_vec])}:\n"
-            )
+        for idx_team, id_team in enumerate(season_results.team_ids):
+            team_data = team_list[id_team]
+
+            wins_vec = season_results.get_wins_vec(id_team).tolist()
+            wins = int(wins_all[idx_team])
+            losses = int(losses_all[idx_team])
+            wpct = float(wpct_all[idx_team])
+
+            # char_available = _CLI_LINE_LENGTH_DEFAULT - 2
+            char_available = _CLI_LINE_LENGTH_WIDE_DEFAULT - 2
 
-            char_available -= 3
-            sparkline = (
-                "..."
-                + "".join(
-                    [
-                        Fore.GREEN + "^" if v else Fore.RED + "v"
-                        for v in wins_vec[-char_available:]
-                    ]
+            if char_available > len(wins_vec):
+                output_lines = (
+                    f"{team_data['abbreviation']:>3s} " + f"{wins}-{losses}:\n"
                 )
-                + Fore.RESET
+                # padded as when every game got its own 5-byte escape code,
+                # plus the reset, and that was right-justified as if visible
+                padding = max(0, char_available - (6 * len(wins_vec) + 5))
+                sparkline = " " * padding + format_sparkline(
+                    wins_vec, use_color=use_color
+                )
+            else:
+                output_lines = (
+                    f"{team_data['abbreviation']:>4s} " + f"{wins}-{losses}:\n"
+                )
+
+                char_available -= 3
+                sparkline = "..." + format_sparkline(
+                    wins_vec[-char_available:], use_color=use_color
+                )
+            output_lines += f"  {sparkline}"
+
+            team_output.append(
+                {
+                    "abbrev": team_data["abbreviation"],
+                    "wpct": wpct,
+                    "output": output_lines,
+                }
             )
-            output_lines += f"  {sparkline:>{char_available}s}"
-
-        team_output.append(
-            {
-                "abbrev": team_data["abbreviation"],
-                "wpct": wpct,
-                "output": output_lines,
-            }
-        )
-    print(" done!\n", flush=True)
+        if show_progress:
+            out.write_line(" done!\n")
+            out.flush()
 
-    team_output = list(sorted(team_output, key=lambda v: v["wpct"], reverse=True))
+        team_output = list(sorted(team_output, key=lambda v: v["wpct"], reverse=True))
 
-    for v in team_output:
-        print(v["output"])
+        out.write_lines([v["output"] for v in team_output])
+    return True
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
-import copy
+from types import MappingProxyType
+
+import numpy as np
+
+_RECORD_INT_NONE = -1  # stands in for a missing stat in a record array
 
 
 class BoxScorePitcher(object):
@@ -6,6 +10,19 @@ class BoxScorePitcher(object):
     store one line with pitcher results from a linescore
     """
 
+    __slots__ = (
+        "_lastname_player",
+        "_firstname_player",
+        "_jersey_player",
+        "_innings_pitched",
+        "_hits",
+        "_runs",
+        "_runs_earned",
+        "_bb",
+        "_strikeouts",
+        "_hr",
+    )
+
     _lastname_player: str
     _firstname_player: str
     _jersey_player: int
@@ -17,6 +34,16 @@ class BoxScorePitcher(object):
     _strikeouts: int
     _hr: int
 
+    _stat_names = (
+        "innings_pitched",
+        "hits",
+        "runs",
+        "runs_earned",
+        "bb",
+        "strikeouts",
+        "hr",
+    )  # the stats on a line, in header order
+
     def __init__(
         self,
         lastname_player,
@@ -47,17 +74,13 @@ class BoxScorePitcher(object):
         header_list = ["IP", "H", "R", "ER", "BB", "K", "HR"]
         return header_list
 
+    def get_stats(self) -> tuple:
+        """get the value of each stat, in header order"""
+        return tuple(getattr(self, name) for name in self._stat_names)
+
     def get_appetite_stats(self, incl_header=True):
         """get the appetite for spaces of each stat"""
-        stat_list = [
-            self.innings_pitched,
-            self.hits,
-            self.runs,
-            self.runs_earned,
-            self.bb,
-            self.strikeouts,
-            self.hr,
-        ]
+        stat_list = self.get_stats()
         len_list = [len(str(x)) if x is not None else 0 for x in stat_list]
         if not incl_header:
             return len_list
@@ -113,6 +136,22 @@ class BoxScoreBatter(object):
     store one line with player results from a linescore
     """
 
+    __slots__ = (
+        "_lastname_player",
+        "_firstname_player",
+        "_pos",
+        "_jersey_player",
+        "_batting_order",
+        "_ab",
+        "_runs",
+        "_hits",
+        "_rbi",
+        "_bb",
+        "_so",
+        "_po",
+        "_asst",
+    )
+
     _lastname_player: str
     _firstname_player: str
     _pos: str
@@ -127,6 +166,17 @@ class BoxScoreBatter(object):
     _po: int
     _asst: int
 
+    _stat_names = (
+        "ab",
+        "runs",
+        "hits",
+        "rbi",
+        "bb",
+        "so",
+        "po",
+        "asst",
+    )  # the stats on a line, in header order
+
     def __init__(
         self,
         lastname_player,
@@ -175,18 +225,13 @@ class BoxScoreBatter(object):
         header_list = ["AB", "R", "H", "RBI", "BB", "SO", "PO", "A"]
         return header_list
 
+    def get_stats(self) -> tuple:
+        """get the value of each stat, in header order"""
+        return tuple(getattr(self, name) for name in self._stat_names)
+
     def get_appetite_stats(self, incl_header=True):
         """get the appetite for spaces of each stat"""
-        stat_list = [
-            self.ab,
-            self.runs,
-            self.hits,
-            self.rbi,
-            self.bb,
-            self.so,
-            self.po,
-            self.asst,
-        ]
+        stat_list = self.get_stats()
         len_list = [len(str(x)) if x is not None else 0 for x in stat_list]
         if not incl_header:
             return len_list
@@ -253,15 +298,157 @@ class BoxScoreBatter(object):
         return self._firstname_player[0]
 
 
-def extract_boxscore_data(data_game: dict) -> dict:
+class BoxScoreRecordArray(object):
+    """
+    store many box score lines as one NumPy structured array
+
+    string fields are fixed-width unicode (as wide as the longest value, with
+    None stored as empty), stat fields are int32 (with None stored as -1);
+    indexing or iterating builds the record object back, so the usual
+    property API keeps working for single lines.
+    """
+
+    __slots__ = ("_data",)
+
+    _record_class = None  # the single-line class this array holds
+    _fields = ()  # (name, is_string), in the record class's constructor order
+
+    _data: np.ndarray
+
+    def __init__(self, records=()):
+        records = list(records)
+
+        columns = {
+            name: [getattr(record, name) for record in records]
+            for name, _ in self._fields
+        }
+        dtype = []
+        for name, is_string in self._fields:
+            if is_string:
+                columns[name] = ["" if v is None else str(v) for v in columns[name]]
+                width = max([len(v) for v in columns[name]], default=0)
+                dtype.append((name, "U%d" % max(width, 1)))
+            else:
+                columns[name] = [
+                    _RECORD_INT_NONE if v is None else v for v in columns[name]
+                ]
+                dtype.append((name, np.int32))
+
+        self._data = np.empty(len(records), dtype=dtype)
+        for name, _ in self._fields:
+            self._data[name] = columns[name]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        row = self._data[index]
+        values = []
+        for name, is_string in self._fields:
+            v = row[name].item()
+            if is_string:
+                values.append(v if v != "" else None)
+            else:
+                values.append(v if v != _RECORD_INT_NONE else None)
+        return self._record_class(*values)
+
+    def __iter__(self):
+        for index in range(len(self._data)):
+            yield self[index]
+
+    @property
+    def data(self) -> np.ndarray:
+        """the underlying structured array"""
+        return self._data
+
+    def column(self, name: str) -> np.ndarray:
+        """get one field for every line, e.g. `column("hits")`"""
+        return self._data[name]
+
+
+class BoxScorePitcherArray(BoxScoreRecordArray):
+    """
+    store many pitcher lines compactly, e.g. a season's worth
+    """
+
+    __slots__ = ()
+
+    _record_class = BoxScorePitcher
+    _fields = (
+        ("lastname_player", True),
+        ("firstname_player", True),
+        ("jersey_player", True),
+        ("innings_pitched", True),
+        ("hits", False),
+        ("runs", False),
+        ("runs_earned", False),
+        ("bb", False),
+        ("strikeouts", False),
+        ("hr", False),
+    )
+
+
+class BoxScoreBatterArray(BoxScoreRecordArray):
+    """
+    store many batter lines compactly, e.g. a season's worth
+    """
+
+    __slots__ = ()
+
+    _record_class = BoxScoreBatter
+    _fields = (
+        ("lastname_player", True),
+        ("firstname_player", True),
+        ("pos", True),
+        ("jersey_player", True),
+        ("batting_order", True),
+        ("ab", False),
+        ("runs", False),
+        ("hits", False),
+        ("rbi", False),
+        ("bb", False),
+        ("so", False),
+        ("po", False),
+        ("asst", False),
+    )
+
+
+def get_appetite_columns(record_lists, record_class) -> list[int]:
+    """
+    get the appetite for spaces of each stat column, across every line given
+
+    the width of every stat on every line goes into one array, and the widest
+    in each column (or the header, if wider) is taken once, rather than asking
+    each line for its appetite stat by stat
+    """
+
+    header_list = record_class.get_header_stats()
+    stat_names = record_class._stat_names
+    widths = np.array(
+        [
+            [len(str(v)) if v is not None else 0 for v in record.get_stats()]
+            for records in record_lists
+            for record in records
+        ],
+        dtype=np.int64,
+    ).reshape(-1, len(stat_names))
+    return np.maximum(
+        widths.max(axis=0, initial=0), [len(x) for x in header_list]
+    ).tolist()
+
+
+def extract_boxscore_data(data_game: dict) -> MappingProxyType:
     """
     give a game_pk and get the boxscore data
+
+    this is a read-only view into the game data, not a copy: build new values
+    from it rather than changing it
     """
 
     assert "liveData" in data_game
     data_liveData = data_game["liveData"]
 
     assert "boxscore" in data_liveData
-    boxscore = copy.deepcopy(data_liveData["boxscore"])
+    boxscore = MappingProxyType(data_liveData["boxscore"])
 
     return boxscore
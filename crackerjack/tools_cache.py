@@ -0,0 +1,315 @@
+import hashlib
+import json
+import lzma
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
+from functools import partial
+
+_CACHE_DIR_DEFAULT = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "crackerjack",
+)  # where cached responses live unless CRACKERJACK_CACHE_DIR says otherwise
+_CACHE_SIZE_LIMIT_DEFAULT = 512 * 1024 * 1024  # bytes on disk before LRU eviction
+_CACHE_ENTRY_SUFFIX = ".entry"
+_PARSED_CACHE_SIZE_DEFAULT = 32  # parsed responses kept in memory
+
+# how cached bodies can be compressed on disk: name to (compress, decompress)
+_CACHE_CODECS = {
+    "none": (bytes, bytes),
+    "zlib": (partial(zlib.compress, level=6), zlib.decompress),
+    "lzma": (partial(lzma.compress, preset=6), lzma.decompress),
+}
+_CACHE_CODEC_DEFAULT = "zlib"  # unless CRACKERJACK_CACHE_CODEC says otherwise
+
+# a cached response: its body, when it was stored, how long it's good for,
+# the body's sha256 hex digest, the HTTP validators (ETag, Last-Modified) it
+# came with, and whether its time-to-live has run out
+CacheEntry = namedtuple(
+    "CacheEntry", ["url", "body", "stored", "ttl", "digest", "validators", "is_stale"]
+)
+
+
+def get_digest(body: bytes) -> str:
+    """get the content hash used to tell if a body has changed"""
+    return hashlib.sha256(body).hexdigest()
+
+
+class ResponseCache(object):
+    """
+    store raw responses on disk, keyed by URL
+
+    each entry is one file: a single line of json metadata (url, time stored,
+    time-to-live in seconds or None for forever, content hash, HTTP
+    validators, and codec) followed by the response body, compressed with the
+    codec ("zlib", "lzma", or "none"). entries are written atomically, and the
+    least-recently-used entries are evicted once the total size on disk goes
+    past the size limit.
+    """
+
+    _cache_dir: str
+    _size_limit: int
+    _size_total: int
+    _codec: str
+
+    def __init__(
+        self, cache_dir=None, size_limit=_CACHE_SIZE_LIMIT_DEFAULT, codec=None
+    ):
+        self._cache_dir = (
+            cache_dir
+            if cache_dir is not None
+            else os.environ.get("CRACKERJACK_CACHE_DIR", _CACHE_DIR_DEFAULT)
+        )
+        self._size_limit = size_limit
+        self._codec = (
+            codec
+            if codec is not None
+            else os.environ.get("CRACKERJACK_CACHE_CODEC", _CACHE_CODEC_DEFAULT)
+        )
+        assert self._codec in _CACHE_CODECS, "cache codec must be one of %s, not %s" % (
+            list(_CACHE_CODECS),
+            self._codec,
+        )
+        self._size_total = None  # lazily scanned on first write
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def size_limit(self):
+        return self._size_limit
+
+    @property
+    def codec(self):
+        """what new entries are compressed with"""
+        return self._codec
+
+    def get_entry_path(self, url_str: str) -> str:
+        """get the on-disk location for the entry for a URL"""
+        key = hashlib.sha256(url_str.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, key + _CACHE_ENTRY_SUFFIX)
+
+    def get(self, url_str: str):
+        """
+        get the cached body for a URL, or None if it is missing or expired
+        """
+
+        entry = self.get_entry(url_str)
+        return entry.body if entry is not None else None
+
+    def get_entry(self, url_str: str, allow_stale=False) -> CacheEntry:
+        """
+        get the cached entry for a URL, or None if it is missing
+
+        expired entries are only returned with `allow_stale`, e.g. to be
+        revalidated with the server instead of downloaded again
+        """
+
+        path_entry = self.get_entry_path(url_str)
+        try:
+            with open(path_entry, "rb") as entry_file:
+                meta = json.loads(entry_file.readline())
+                body = entry_file.read()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url_str:
+            return None  # hash collision or stale format: treat as a miss
+        codec = meta.get("codec", "none")  # entries from before codecs are raw
+        if codec not in _CACHE_CODECS:
+            return None
+        ttl = meta.get("ttl")
+        is_stale = (ttl is not None) and (time.time() - meta["stored"] > ttl)
+        if is_stale and not allow_stale:
+            return None
+
+        try:
+            body = _CACHE_CODECS[codec][1](body)
+        except (zlib.error, lzma.LZMAError):
+            return None  # a damaged entry is just a miss
+
+        try:
+            os.utime(path_entry)  # bump for LRU
+        except OSError:
+            pass
+
+        return CacheEntry(
+            url_str,
+            body,
+            meta["stored"],
+            ttl,
+            meta.get("digest") or get_digest(body),
+            meta.get("validators") or {},
+            is_stale,
+        )
+
+    def put(self, url_str: str, body: bytes, ttl=None, digest=None, validators=None):
+        """
+        store a body for a URL, with a time-to-live in seconds (None: forever)
+
+        `validators` are the HTTP validators (ETag, Last-Modified) to send when
+        the entry is revalidated; `digest` saves hashing a body again
+        """
+
+        meta = {
+            "url": url_str,
+            "stored": time.time(),
+            "ttl": ttl,
+            "digest": digest if digest is not None else get_digest(body),
+            "validators": validators or {},
+            "codec": self._codec,
+        }
+        header = (json.dumps(meta) + "\n").encode("utf-8")
+        body_stored = _CACHE_CODECS[self._codec][0](body)
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            path_entry = self.get_entry_path(url_str)
+            size_old = os.path.getsize(path_entry) if os.path.exists(path_entry) else 0
+
+            # write to a temporary file and move it into place atomically
+            fd_tmp, path_tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd_tmp, "wb") as tmp_file:
+                    tmp_file.write(header)
+                    tmp_file.write(body_stored)
+                os.replace(path_tmp, path_entry)
+            except BaseException:
+                os.unlink(path_tmp)
+                raise
+        except OSError:
+            return  # a cache that can't be written is just a slow cache
+
+        with self._lock:
+            if self._size_total is None:
+                self._size_total = self._scan_size()
+            else:
+                self._size_total += len(header) + len(body_stored) - size_old
+            if self._size_total > self._size_limit:
+                self._evict()
+
+    def clear(self):
+        """remove every entry from the cache"""
+        with self._lock:
+            for path_entry, _, _ in self._list_entries():
+                try:
+                    os.unlink(path_entry)
+                except OSError:
+                    pass
+            self._size_total = 0
+
+    def _list_entries(self):
+        """get (path, size, mtime) for every entry on disk"""
+        entries = []
+        try:
+            filenames = os.listdir(self._cache_dir)
+        except OSError:
+            return entries
+        for filename in filenames:
+            if not filename.endswith(_CACHE_ENTRY_SUFFIX):
+                continue
+            path_entry = os.path.join(self._cache_dir, filename)
+            try:
+                stat_entry = os.stat(path_entry)
+            except OSError:
+                continue
+            entries.append((path_entry, stat_entry.st_size, stat_entry.st_mtime))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _evict(self):
+        """drop least-recently-used entries until we're back under the limit"""
+        entries = sorted(self._list_entries(), key=lambda v: v[2])
+        self._size_total = sum(size for _, size, _ in entries)
+        for path_entry, size, _ in entries:
+            if self._size_total <= self._size_limit:
+                break
+            try:
+                os.unlink(path_entry)
+            except OSError:
+                continue
+            self._size_total -= size
+
+
+class ParsedCache(object):
+    """
+    keep recently parsed responses in memory, keyed by URL and content hash
+
+    a body whose hash matches the one parsed last time for its URL is the same
+    json, so the parsed object from last time is handed back instead of parsing
+    it again; parsed objects are shared, so they must be treated as read-only
+    """
+
+    _size_limit: int
+
+    def __init__(self, size_limit=_PARSED_CACHE_SIZE_DEFAULT):
+        self._size_limit = size_limit
+        self._parsed = OrderedDict()
+        self._lock = threading.Lock()
+        self._count_parsed = 0
+        self._count_reused = 0
+
+    @property
+    def stats(self) -> dict:
+        """counters for bodies parsed and parsed objects reused"""
+        with self._lock:
+            return {"parsed": self._count_parsed, "reused": self._count_reused}
+
+    def get_parsed(self, url_str: str, body: bytes, digest=None):
+        """get the parsed json of a body, only parsing it if it's changed"""
+
+        if digest is None:
+            digest = get_digest(body)
+
+        with self._lock:
+            digest_last, data = self._parsed.get(url_str, (None, None))
+            if digest_last == digest:
+                self._parsed.move_to_end(url_str)
+                self._count_reused += 1
+                return data
+
+        data = json.loads(body)
+
+        with self._lock:
+            self._count_parsed += 1
+            self._parsed[url_str] = (digest, data)
+            self._parsed.move_to_end(url_str)
+            while len(self._parsed) > self._size_limit:
+                self._parsed.popitem(last=False)
+        return data
+
+    def clear(self):
+        """forget every parsed response"""
+        with self._lock:
+            self._parsed.clear()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+_default_parsed_cache = None
+_default_parsed_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """get the response cache shared by the whole package"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+def get_default_parsed_cache() -> ParsedCache:
+    """get the parsed-response cache shared by the whole package"""
+    global _default_parsed_cache
+    with _default_parsed_cache_lock:
+        if _default_parsed_cache is None:
+            _default_parsed_cache = ParsedCache()
+        return _default_parsed_cache
@@ -0,0 +1,173 @@
+import asyncio
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+_FETCH_CONCURRENCY_DEFAULT = 16  # downloads in flight at once
+_FETCH_TIMEOUT_DEFAULT = 60.0  # seconds a single download may take, queueing aside
+
+
+class FetchEngine(object):
+    """
+    run downloads concurrently from asyncio, a bounded number at a time
+
+    each download is a blocking call (e.g. `download_json_url`, which already
+    pools connections and caches responses) run on the engine's own worker
+    threads; a semaphore bounds how many are in flight, each one gets a
+    timeout, and cancelling the awaiting task stops anything not yet started.
+    a download that times out or is cancelled once running is abandoned: its
+    thread finishes on its own, bounded by the HTTP client's socket timeout,
+    and keeps its slot until it does.
+
+    an engine can be shared by event loops on different threads: each loop
+    gets its own semaphore, and they all share the worker threads.
+    """
+
+    _max_concurrency: int
+    _timeout: float
+
+    def __init__(
+        self,
+        max_concurrency=_FETCH_CONCURRENCY_DEFAULT,
+        timeout=_FETCH_TIMEOUT_DEFAULT,
+    ):
+        assert max_concurrency > 0
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+        self._executor = None
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop: semaphore
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrency(self):
+        return self._max_concurrency
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """get the semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                    self._max_concurrency
+                )
+            return semaphore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix="crackerjack"
+                )
+            return self._executor
+
+    async def run(self, func, *args, **kwargs):
+        """
+        run one blocking download, waiting for a free slot first
+
+        returns what `func` returns, or None if it timed out; the timeout
+        starts once a worker thread picks the call up, and the slot is held
+        until the worker is done with it, even if it's been abandoned
+        """
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        started = loop.create_future()
+        try:
+            job = self._get_executor().submit(
+                _run_started, loop, started, func, args, kwargs
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+        job.add_done_callback(lambda _: _call_soon(loop, semaphore.release))
+
+        future = asyncio.wrap_future(job)
+        try:
+            await asyncio.wait((started, future), return_when=asyncio.FIRST_COMPLETED)
+            return await asyncio.wait_for(asyncio.shield(future), self._timeout)
+        except asyncio.TimeoutError:
+            _report_failure(func, args, "timed out after %g s" % self._timeout)
+            return
+        finally:
+            started.cancel()
+            future.cancel()  # drops the call if no worker has picked it up yet
+
+    async def run_all(self, calls) -> list:
+        """
+        run many blocking downloads concurrently, given as (func, *args) tuples
+
+        results come back in the order the calls were given, with None for a
+        call that timed out or raised; if this is cancelled, every download
+        that hasn't started yet is dropped
+        """
+
+        tasks = [asyncio.ensure_future(self.run(*call)) for call in calls]
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for index, (call, result) in enumerate(zip(calls, results)):
+            if isinstance(result, BaseException):
+                _report_failure(call[0], tuple(call[1:]), "failed: %r" % result)
+                results[index] = None
+        return results
+
+    def run_all_sync(self, calls) -> list:
+        """run_all, for callers that aren't in an event loop"""
+        return asyncio.run(self.run_all(calls))
+
+    def close(self):
+        """stop the worker threads, dropping queued downloads"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _call_soon(loop, callback, *args):
+    """schedule a callback on a loop from another thread, unless it's closed"""
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        pass  # the loop is closed, and everything waiting on it went with it
+
+
+def _set_started(started):
+    if not started.done():
+        started.set_result(None)
+
+
+def _run_started(loop, started, func, args, kwargs):
+    """run a call on a worker thread, first telling its loop that it started"""
+    _call_soon(loop, _set_started, started)
+    return func(*args, **kwargs)
+
+
+def _report_failure(func, args, reason):
+    print(
+        "\nrequest %s: %s%s\n" % (reason, getattr(func, "__name__", func), args),
+        file=sys.stderr,
+    )
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> FetchEngine:
+    """get the fetch engine shared by the whole package"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = FetchEngine()
+        return _default_engine
@@ -0,0 +1,196 @@
+import threading
+from collections import OrderedDict
+
+from crackerjack.tools_mlbapi import (
+    Team,
+    build_decisions,
+    build_linescore_innings,
+    build_team,
+    download_game_data,
+    get_fetch_engine,
+)
+from crackerjack.tools_linescore import LineScoreInning
+from crackerjack.tools_boxscore import BoxScoreBatter, BoxScorePitcher
+from crackerjack.extractors_boxscore import (
+    build_boxscore_batters,
+    build_boxscore_pitchers,
+    build_info_box,
+    build_info_team,
+)
+
+_GAME_SUMMARY_CACHE_SIZE = 64  # parsed final games kept in memory
+
+
+class GameSummary(object):
+    """
+    store everything the renderers need from one game's live feed
+
+    the feed is walked once, when the summary is built; after that, linescores
+    and boxscores are rendered from the summary without touching the raw json
+    """
+
+    _gamePk: int
+    _is_final: bool
+    _teams: dict[str:Team]
+    _innings: list[LineScoreInning]
+    _decisions: dict
+    _venue: str
+    _date: str
+    _batters: dict[str : list[BoxScoreBatter]]
+    _pitchers: dict[str : list[BoxScorePitcher]]
+    _info_teams: dict[str:dict]
+    _info_box: OrderedDict
+
+    def __init__(self, data_game: dict):
+        assert "gameData" in data_game
+        assert "liveData" in data_game
+        data_gameData = data_game["gameData"]
+        data_liveData = data_game["liveData"]
+
+        self._gamePk = data_game.get("gamePk")
+        self._is_final = (
+            data_gameData.get("status", {}).get("abstractGameState") == "Final"
+        )
+
+        # game metadata
+        assert "teams" in data_gameData
+        self._teams = {
+            key: build_team(data_gameData["teams"][key], key == "home")
+            for key in ("away", "home")
+        }
+        assert "name" in data_gameData["venue"]
+        self._venue = data_gameData["venue"]["name"]
+        data_players = data_gameData["players"]
+
+        # linescore and decisions
+        assert "linescore" in data_liveData
+        self._innings = build_linescore_innings(data_liveData["linescore"])
+        self._decisions = (
+            build_decisions(data_liveData["decisions"])
+            if "decisions" in data_liveData
+            else (None, None, None)
+        )
+
+        # boxscore
+        assert "boxscore" in data_liveData
+        data_box = data_liveData["boxscore"]
+        assert "info" in data_box
+        assert "value" not in data_box["info"][-1]
+        self._date = data_box["info"][-1]["label"]
+        self._info_box = build_info_box(data_box["info"][:-1])
+        self._batters = {}
+        self._pitchers = {}
+        self._info_teams = {}
+        for key in ("away", "home"):
+            data_box_team = data_box["teams"][key]
+            self._batters[key] = build_boxscore_batters(data_box_team, data_players)
+            self._pitchers[key] = build_boxscore_pitchers(data_box_team, data_players)
+            self._info_teams[key] = build_info_team(data_box_team)
+
+    @property
+    def gamePk(self):
+        return self._gamePk
+
+    @property
+    def is_final(self):
+        """flag for if the game is over, so its summary won't change"""
+        return self._is_final
+
+    @property
+    def teams(self):
+        """the away and home Team, keyed by 'away' and 'home'"""
+        return self._teams
+
+    @property
+    def innings(self):
+        """the linescore, as a list of LineScoreInning"""
+        return self._innings
+
+    @property
+    def decisions(self):
+        """the pitching decision dict (or all Nones if none are posted)"""
+        return self._decisions
+
+    @property
+    def venue(self):
+        return self._venue
+
+    @property
+    def date(self):
+        """the game date, as the boxscore labels it"""
+        return self._date
+
+    @property
+    def batters(self):
+        """each team's BoxScoreBatter lines, keyed by 'away' and 'home'"""
+        return self._batters
+
+    @property
+    def pitchers(self):
+        """each team's BoxScorePitcher lines, keyed by 'away' and 'home'"""
+        return self._pitchers
+
+    @property
+    def info_teams(self):
+        """each team's bottom-lines info, keyed by 'away' and 'home'"""
+        return self._info_teams
+
+    @property
+    def info_box(self):
+        """the bottom-lines box score info"""
+        return self._info_box
+
+    @property
+    def linescore_parts(self) -> dict:
+        """the innings, teams, venue, and decisions needed for a linescore"""
+        return {
+            "innings": self._innings,
+            "teams": self._teams,
+            "venue": self._venue,
+            "decisions": self._decisions,
+        }
+
+
+_game_summary_cache = OrderedDict()
+_game_summary_cache_lock = threading.Lock()
+
+
+def get_game_summary(gamePk, debug=False) -> GameSummary:
+    """
+    get a game's summary, reusing one parsed earlier if the game is final
+
+    final games are kept in a small in-memory LRU so re-rendering them never
+    touches raw json again; games that aren't over are always re-fetched.
+    returns None if the game couldn't be downloaded
+    """
+
+    with _game_summary_cache_lock:
+        summary = _game_summary_cache.get((gamePk, debug))
+        if summary is not None:
+            _game_summary_cache.move_to_end((gamePk, debug))
+            return summary
+
+    data_game = download_game_data(gamePk, debug=debug)
+    if data_game is None:
+        return None  # the download failed, and said why
+    summary = GameSummary(data_game)
+
+    if summary.is_final:
+        with _game_summary_cache_lock:
+            _game_summary_cache[(gamePk, debug)] = summary
+            while len(_game_summary_cache) > _GAME_SUMMARY_CACHE_SIZE:
+                _game_summary_cache.popitem(last=False)
+
+    return summary
+
+
+def get_game_summaries(gamePk_list, debug=False, engine=None) -> list[GameSummary]:
+    """
+    get many games' summaries, downloading them concurrently
+
+    summaries come back in the order given (None for a game that timed out)
+    """
+
+    return get_fetch_engine(engine).run_all_sync(
+        [(get_game_summary, gamePk, debug) for gamePk in gamePk_list]
+    )
@@ -0,0 +1,268 @@
+import http.client
+import threading
+import urllib.error
+import urllib.parse
+import zlib
+from collections import namedtuple
+
+_HTTP_TIMEOUT_DEFAULT = 30.0  # seconds
+_HTTP_MAX_IDLE_PER_HOST = 8  # idle keep-alive connections kept around per host
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_USER_AGENT = "crackerjack"
+_HTTP_ACCEPT_ENCODING = "gzip, deflate"
+_HTTP_READ_CHUNK_SIZE = 64 * 1024  # bytes read at a time from compressed bodies
+
+HTTPResult = namedtuple("HTTPResult", ["url", "status", "headers", "body"])
+
+# response headers that identify a version of a resource, and the request
+# headers that ask for it only if it's changed since
+_HTTP_VALIDATORS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+
+
+def get_validators(headers: dict) -> dict:
+    """get the validators (ETag, Last-Modified) from a response's headers"""
+    return {k.lower(): v for k, v in headers.items() if k.lower() in _HTTP_VALIDATORS}
+
+
+class _Decoder(object):
+    """
+    decompress a gzip or deflate body a chunk at a time
+
+    "deflate" is meant to be zlib-wrapped, but some servers send it raw, so
+    that's tried if the zlib header isn't there
+    """
+
+    def __init__(self, content_encoding: str):
+        self._is_deflate = content_encoding == "deflate"
+        # 32 + MAX_WBITS: take a gzip or zlib header, whichever it is
+        self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._started = False
+
+    def decode(self, chunk: bytes) -> bytes:
+        if self._started or not self._is_deflate:
+            return self._decompressor.decompress(chunk)
+        self._started = True
+        try:
+            return self._decompressor.decompress(chunk)
+        except zlib.error:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(chunk)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+
+def read_body(response: http.client.HTTPResponse) -> tuple[bytes, int]:
+    """
+    read a response's body, decompressing it as it comes in if it's encoded
+
+    returns the body and how many bytes came over the wire for it
+    """
+
+    content_encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+    if content_encoding not in ("gzip", "x-gzip", "deflate"):
+        body = response.read()
+        return body, len(body)
+
+    decoder = _Decoder(content_encoding)
+    chunks = []
+    size_wire = 0
+    try:
+        while True:
+            chunk = response.read(_HTTP_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            size_wire += len(chunk)
+            chunks.append(decoder.decode(chunk))
+        chunks.append(decoder.flush())
+    except zlib.error as e:
+        raise http.client.HTTPException(
+            "couldn't decompress %s body: %s" % (content_encoding, e)
+        ) from e
+    return b"".join(chunks), size_wire
+
+
+def get_conditional_headers(validators: dict) -> dict:
+    """get the request headers that revalidate a response with its validators"""
+    return {
+        _HTTP_VALIDATORS[k]: v for k, v in validators.items() if k in _HTTP_VALIDATORS
+    }
+
+
+class HTTPClient(object):
+    """
+    make GET requests over persistent, per-host keep-alive connections
+
+    idle connections are pooled by (scheme, host, port) so that a run of
+    requests against the same host only pays for one handshake; the client is
+    safe to share between threads.
+    """
+
+    _timeout: float
+    _max_idle_per_host: int
+
+    def __init__(
+        self,
+        timeout=_HTTP_TIMEOUT_DEFAULT,
+        max_idle_per_host=_HTTP_MAX_IDLE_PER_HOST,
+    ):
+        self._timeout = timeout
+        self._max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._count_requests = 0
+        self._count_connections_opened = 0
+        self._count_connections_reused = 0
+        self._count_bytes_wire = 0
+        self._count_bytes_body = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        counters for requests made, connections opened/reused, and body bytes
+        received over the wire and after decompression
+        """
+        with self._lock:
+            return {
+                "requests": self._count_requests,
+                "connections_opened": self._count_connections_opened,
+                "connections_reused": self._count_connections_reused,
+                "connections_idle": sum(len(v) for v in self._idle.values()),
+                "bytes_wire": self._count_bytes_wire,
+                "bytes_body": self._count_bytes_body,
+            }
+
+    def _acquire(self, key, fresh=False):
+        """get a connection for a host: reuse an idle one if we can"""
+        with self._lock:
+            idle_list = self._idle.get(key)
+            if idle_list and not fresh:
+                self._count_connections_reused += 1
+                return idle_list.pop(), True
+            self._count_connections_opened += 1
+
+        scheme, host, port = key
+        conn_class = (
+            http.client.HTTPSConnection
+            if scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return conn_class(host, port, timeout=self._timeout), False
+
+    def _release(self, key, conn):
+        """put a connection back in the idle pool, or close it if we're full"""
+        with self._lock:
+            idle_list = self._idle.setdefault(key, [])
+            if len(idle_list) < self._max_idle_per_host:
+                idle_list.append(conn)
+                return
+        conn.close()
+
+    def _request_once(self, url_str: str, headers: dict) -> HTTPResult:
+        url_parsed = urllib.parse.urlsplit(url_str)
+        scheme = url_parsed.scheme or "http"
+        port = url_parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, url_parsed.hostname, port)
+        target = url_parsed.path or "/"
+        if url_parsed.query:
+            target += "?" + url_parsed.query
+
+        with self._lock:
+            self._count_requests += 1
+
+        conn, reused = self._acquire(key)
+        try:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+            # the server dropped an idle keep-alive connection: try a fresh one
+            conn, _ = self._acquire(key, fresh=True)
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        try:
+            body, size_wire = read_body(response)
+        except BaseException:
+            conn.close()
+            raise
+
+        with self._lock:
+            self._count_bytes_wire += size_wire
+            self._count_bytes_body += len(body)
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        return HTTPResult(url_str, response.status, dict(response.getheaders()), body)
+
+    def get(self, url_str: str, headers=None) -> HTTPResult:
+        """
+        GET a URL, following redirects, and raise `HTTPError` on error statuses
+
+        a 304 (not modified) for a conditional request is returned as-is; bodies
+        are asked for compressed, and come back decompressed
+        """
+
+        headers_request = {
+            "User-Agent": _HTTP_USER_AGENT,
+            "Connection": "keep-alive",
+            "Accept-Encoding": _HTTP_ACCEPT_ENCODING,
+        }
+        if headers is not None:
+            headers_request.update(headers)
+
+        for _ in range(_HTTP_MAX_REDIRECTS + 1):
+            result = self._request_once(url_str, headers_request)
+            if result.status in (301, 302, 303, 307, 308):
+                location = {k.lower(): v for k, v in result.headers.items()}.get(
+                    "location"
+                )
+                if location is None:
+                    break
+                url_str = urllib.parse.urljoin(url_str, location)
+                continue
+            break
+
+        if result.status >= 400:
+            raise urllib.error.HTTPError(
+                url_str,
+                result.status,
+                http.client.responses.get(result.status, ""),
+                result.headers,
+                None,
+            )
+
+        return result
+
+    def close(self):
+        """close every idle connection"""
+        with self._lock:
+            idle_all = [conn for v in self._idle.values() for conn in v]
+            self._idle = {}
+        for conn in idle_all:
+            conn.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """get the HTTP client shared by the whole package"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
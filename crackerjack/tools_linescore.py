@@ -1,8 +1,36 @@
+import numpy as np
+
+# the per-inning stats a linescore keeps for each team, in table row order
+_LINESCORE_FIELDS = (
+    "R_away",
+    "H_away",
+    "E_away",
+    "LOB_away",
+    "R_home",
+    "H_home",
+    "E_home",
+    "LOB_home",
+)
+
+
 class LineScoreInning(object):
     """
     store a linescore inning
     """
 
+    __slots__ = (
+        "_inn_no",
+        "_R_away",
+        "_H_away",
+        "_E_away",
+        "_LOB_away",
+        "_R_home",
+        "_H_home",
+        "_E_home",
+        "_LOB_home",
+        "_ordinal",
+    )
+
     _inn_no: int
     _R_away: int
     _H_away: int
@@ -130,46 +158,93 @@ class LineScoreInning(object):
         return max([len(str(var)) for var in vars if var is not None])
 
 
+def get_digit_count(values: np.ndarray) -> np.ndarray:
+    """get len(str(x)) for every entry of an integer array, all at once"""
+    return np.char.str_len(values.astype(str))
+
+
+class LineScoreTable(object):
+    """
+    store a linescore as columns, one entry per inning
+
+    runs, hits, errors, and runners left on base for both teams live in one
+    integer array (one row per field in _LINESCORE_FIELDS), with a matching
+    mask of which entries are actually there, so unplayed half-innings (None)
+    don't count toward totals or column widths
+    """
+
+    __slots__ = ("_inn_no", "_values", "_present")
+
+    _inn_no: np.ndarray
+    _values: np.ndarray
+    _present: np.ndarray
+
+    def __init__(self, linescoreinning_list: list[LineScoreInning]):
+        raw = [
+            [getattr(lsi, field) for lsi in linescoreinning_list]
+            for field in _LINESCORE_FIELDS
+        ]
+        count_innings = len(linescoreinning_list)
+
+        self._inn_no = np.array(
+            [lsi.inn_no for lsi in linescoreinning_list], dtype=np.int64
+        )
+        self._present = np.array(
+            [[v is not None for v in row] for row in raw], dtype=bool
+        ).reshape(len(_LINESCORE_FIELDS), count_innings)
+        self._values = np.array(
+            [[v if v is not None else 0 for v in row] for row in raw], dtype=np.int64
+        ).reshape(len(_LINESCORE_FIELDS), count_innings)
+
+    def __len__(self):
+        return len(self._inn_no)
+
+    @property
+    def inn_no(self) -> np.ndarray:
+        return self._inn_no
+
+    def get_column(self, field: str) -> list:
+        """get one stat for every inning, with None where it wasn't played"""
+        idx_field = _LINESCORE_FIELDS.index(field)
+        return [
+            v if p else None
+            for v, p in zip(
+                self._values[idx_field].tolist(), self._present[idx_field].tolist()
+            )
+        ]
+
+    def get_appetites(self) -> np.ndarray:
+        """
+        figure out how many characters each inning needs to print
+
+        the vectorized equivalent of LineScoreInning.get_appetite for every
+        inning at once
+        """
+
+        if len(self._inn_no) == 0:
+            return np.zeros(0, dtype=np.int64)
+        digits = np.where(self._present, get_digit_count(self._values), 0)
+        return np.maximum(get_digit_count(self._inn_no), digits.max(axis=0))
+
+    def get_totals(self) -> dict[str:int]:
+        """get the game total for each field, skipping unplayed half-innings"""
+        totals = np.where(self._present, self._values, 0).sum(axis=1)
+        return dict(zip(_LINESCORE_FIELDS, totals.tolist()))
+
+    def get_RHE(self) -> dict:
+        """get the RHE (and LOB) totals and widths, as extract_RHE does"""
+        totals = self.get_totals()
+        RHE_dict = {}
+        for code in ("R", "H", "E", "LOB"):
+            total_away = totals[code + "_away"]
+            total_home = totals[code + "_home"]
+            RHE_dict[code] = {
+                "spaces": max([len(str(x)) for x in [total_away, total_home]]),
+                "away": total_away,
+                "home": total_home,
+            }
+        return RHE_dict
+
+
 def extract_RHE(linescoreinning_list: list[LineScoreInning]):
-    R_away = 0
-    R_home = 0
-    H_away = 0
-    H_home = 0
-    E_away = 0
-    E_home = 0
-    LOB_away = 0
-    LOB_home = 0
-
-    for lsi in linescoreinning_list:
-        R_away += lsi.R_away if lsi.R_away is not None else 0
-        R_home += lsi.R_home if lsi.R_home is not None else 0
-        H_away += lsi.H_away if lsi.H_away is not None else 0
-        H_home += lsi.H_home if lsi.H_home is not None else 0
-        E_away += lsi.E_away if lsi.E_away is not None else 0
-        E_home += lsi.E_home if lsi.E_home is not None else 0
-        LOB_away += lsi.LOB_away if lsi.LOB_away is not None else 0
-        LOB_home += lsi.LOB_home if lsi.LOB_home is not None else 0
-
-    RHE_dict = {}
-    RHE_dict["R"] = {
-        "spaces": max([len(str(x)) for x in [R_away, R_home]]),
-        "away": R_away,
-        "home": R_home,
-    }
-    RHE_dict["H"] = {
-        "spaces": max([len(str(x)) for x in [H_away, H_home]]),
-        "away": H_away,
-        "home": H_home,
-    }
-    RHE_dict["E"] = {
-        "spaces": max([len(str(x)) for x in [E_away, E_home]]),
-        "away": E_away,
-        "home": E_home,
-    }
-    RHE_dict["LOB"] = {
-        "spaces": max([len(str(x)) for x in [LOB_away, LOB_home]]),
-        "away": LOB_away,
-        "home": LOB_home,
-    }
-
-    return RHE_dict
+    return LineScoreTable(linescoreinning_list).get_RHE()
@@ -1,9 +1,22 @@
-import copy
 import json
 import os
-import urllib.request
+import sys
+import http.client
+import threading
+from types import MappingProxyType
 
 from crackerjack.tools_linescore import LineScoreInning
+from crackerjack.tools_cache import (
+    get_default_cache,
+    get_default_parsed_cache,
+    get_digest,
+)
+from crackerjack.tools_http import (
+    get_conditional_headers,
+    get_default_client,
+    get_validators,
+)
+from crackerjack.tools_policy import CircuitOpenError, get_default_policy
 
 _APP_DIR = os.path.split(__file__)[0]  # where this file is installed
 _PKG_DIR = os.path.join(_APP_DIR, os.pardir)  # where this package is installed
@@ -11,6 +24,16 @@ _MLB_GAME_FORMAT_STRING = "http://statsapi.mlb.com/api/v1.1/game/%s/feed/live?hy
 _MLB_SCHEDULE_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/schedule?sportId=1&startDate=%s&endDate=%s"  # dates as string: '2023-01-01'
 _MLB_STANDINGS_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/standings?leagueId=%s"  # 3 digit numeric leagueId as string
 _MLB_TEAM_GAMES_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/schedule?teamId=%s&sportId=1&season=%s"  # numeric team id, season as string
+_MLB_SEASON_GAMES_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/schedule?sportId=1&season=%s&gameType=%s"  # season, game type ('R': regular) as string
+_MLB_GAME_LINESCORE_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/schedule?sportId=1&gamePk=%s&hydrate=linescore,decisions,team,venue"  # 6 digit numeric gamepk as string
+_MLB_SCHEDULE_LINESCORE_FORMAT_STRING = "http://statsapi.mlb.com/api/v1/schedule?sportId=1&startDate=%s&endDate=%s&hydrate=linescore,decisions,team,venue"  # dates as string: '2023-01-01'
+
+# how long (seconds) a cached response stays good; None means forever
+_CACHE_TTL_GAME_FINAL = None  # a final game doesn't change
+_CACHE_TTL_GAME_LIVE = 30
+_CACHE_TTL_SCHEDULE = 5 * 60
+_CACHE_TTL_STANDINGS = 5 * 60
+_CACHE_TTL_DEFAULT = 60
 
 # things known to the mlbapi
 _MLBAM_GAME_LABELS = [
@@ -111,6 +134,14 @@ _MLBAM_DIVISIONID_NL_CENTRAL = 205
 class Team(object):
     """store a team"""
 
+    __slots__ = (
+        "_location_name",
+        "_team_name",
+        "_short_name",
+        "_abbrev",
+        "_is_home",
+    )
+
     _location_name: str
     _team_name: str
     _short_name: str
@@ -187,9 +218,119 @@ def get_prefixed_player_id(player_id: int):
     return "ID%d" % player_id
 
 
-def download_json_url(url_str: str, debug_file_loader=None):
+def get_cache_ttl(url_str: str, data) -> int:
+    """
+    get the time-to-live for a cached response based on its endpoint and data
+    """
+
+    if url_str.startswith(_MLB_GAME_FORMAT_STRING.split("%s")[0]):
+        status = data.get("gameData", {}).get("status", {})
+        if status.get("abstractGameState") == "Final":
+            return _CACHE_TTL_GAME_FINAL
+        return _CACHE_TTL_GAME_LIVE
+    if url_str.startswith(_MLB_GAME_LINESCORE_FORMAT_STRING.split("%s")[0]):
+        games = [game for date in data.get("dates", []) for game in date["games"]]
+        if games and all(
+            game.get("status", {}).get("abstractGameState") == "Final" for game in games
+        ):
+            return _CACHE_TTL_GAME_FINAL
+        return _CACHE_TTL_GAME_LIVE
+    if url_str.startswith(_MLB_SCHEDULE_FORMAT_STRING.split("?")[0]):
+        return _CACHE_TTL_SCHEDULE  # includes team games
+    if url_str.startswith(_MLB_STANDINGS_FORMAT_STRING.split("?")[0]):
+        return _CACHE_TTL_STANDINGS
+    return _CACHE_TTL_DEFAULT
+
+
+class _Flight(object):
+    """one call in progress, and what it came back with"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    make concurrent calls for the same key only once, and share the result
+
+    the first caller for a key makes the call; anyone asking for the same key
+    while it's in progress waits for it and gets the same result (or error)
+    instead of making their own. once a call is done, the next one for its key
+    is made afresh.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._count_calls = 0
+        self._count_coalesced = 0
+
+    @property
+    def stats(self) -> dict:
+        """counters for calls asked for, and how many were coalesced into others"""
+        with self._lock:
+            return {
+                "calls": self._count_calls,
+                "coalesced": self._count_coalesced,
+                "in_flight": len(self._flights),
+            }
+
+    def do(self, key, func, *args, **kwargs):
+        """call `func(*args, **kwargs)`, unless a call for `key` is in progress"""
+
+        with self._lock:
+            self._count_calls += 1
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                is_leader = True
+            else:
+                self._count_coalesced += 1
+                is_leader = False
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+_download_flight = SingleFlight()
+
+
+def get_singleflight_stats() -> dict:
+    """counters for downloads asked for, and how many shared another's request"""
+    return _download_flight.stats
+
+
+def download_json_url(url_str: str, debug_file_loader=None, use_cache=True):
     """
     take a URL string, attempt to get the json hosted there, handle response errors
+
+    requests go through the package's shared keep-alive HTTP client, and
+    responses are kept in the on-disk response cache, with a lifetime set by
+    `get_cache_ttl`; pass `use_cache=False` to always go to the network
+
+    requests are rate limited and retried by the shared request policy; if they
+    still fail (or the API looks down), this prints why and returns None
+
+    concurrent downloads of the same URL share one request and one parsed
+    result, so the json that comes back must be treated as read-only
     """
 
     if debug_file_loader is not None:
@@ -200,16 +341,64 @@ def download_json_url(url_str: str, debug_file_loader=None):
             data = json.load(debug_file)
         return data
 
+    return _download_flight.do(
+        (url_str, use_cache), _download_json_url_once, url_str, use_cache
+    )
+
+
+def _download_json_url_once(url_str: str, use_cache: bool):
+    """
+    get the json at a URL from the cache or the network: one caller at a time
+
+    an expired cache entry is revalidated with the validators it was stored
+    with, so a feed that hasn't changed comes back as a bodiless 304; either
+    way, a body that hashes the same as the last one parsed isn't parsed again
+    """
+
+    cache = get_default_cache() if use_cache else None
+    parsed_cache = get_default_parsed_cache()
+
+    entry = cache.get_entry(url_str, allow_stale=True) if cache is not None else None
+    if (entry is not None) and not entry.is_stale:
+        return parsed_cache.get_parsed(url_str, entry.body, entry.digest)
+
+    headers = get_conditional_headers(entry.validators) if entry is not None else None
+
     try:
-        with urllib.request.urlopen(url_str) as url:
-            data = json.load(url)
+        result = get_default_policy().call(
+            get_default_client().get, url_str, headers=headers
+        )
+    except (OSError, http.client.HTTPException, CircuitOpenError) as e:
+        # report on stderr, so a failed request can't garble piped output
+        print("\nrequest failed for URL:\n\t" + url_str + "\n", file=sys.stderr)
+        print(e, file=sys.stderr)
+        return
 
-        return data
-    except urllib.request.HTTPError as e:
-        print("\nrequest failed for URL:\n\t" + url_str + "\n")
-        print(e)
+    if (result.status == 304) and (entry is not None):
+        body, digest = entry.body, entry.digest  # not modified: keep what we had
+        validators = {**entry.validators, **get_validators(result.headers)}
+    else:
+        body, digest = result.body, get_digest(result.body)
+        validators = get_validators(result.headers)
+
+    try:
+        data = parsed_cache.get_parsed(url_str, body, digest)
+    except ValueError as e:
+        print("\nbad json from URL:\n\t" + url_str + "\n", file=sys.stderr)
+        print(e, file=sys.stderr)
         return
 
+    if cache is not None:
+        cache.put(
+            url_str,
+            body,
+            ttl=get_cache_ttl(url_str, data),
+            digest=digest,
+            validators=validators,
+        )
+
+    return data
+
 
 def translate_gamepk2url(gamepk: int):
     """
@@ -234,6 +423,171 @@ def download_game_data(gamepk: int, debug=False):
     return data_game  # return the game data
 
 
+def download_game_linescore_data(gamepk: int):
+    """
+    get the (much lighter) schedule entry for a single game
+
+    the entry is hydrated with the linescore, decisions, teams, and venue, which
+    is everything a linescore needs; returns None if the game isn't found
+    """
+
+    url_str_linescore = _MLB_GAME_LINESCORE_FORMAT_STRING % str(gamepk)
+    data_sched = download_json_url(url_str_linescore)
+    if data_sched is None:
+        return None
+
+    for date in data_sched.get("dates", []):
+        for data_sched_game in date.get("games", []):
+            if data_sched_game.get("gamePk") == gamepk:
+                return data_sched_game
+
+    return None
+
+
+def download_schedule(start_date: str, end_date=None) -> dict:
+    """
+    get the schedule for exactly a date (or an inclusive date range)
+
+    dates as strings, e.g. '2023-01-01'
+    """
+
+    if end_date is None:
+        end_date = start_date
+
+    url_str_sched = _MLB_SCHEDULE_FORMAT_STRING % (start_date, end_date)
+    return download_json_url(url_str_sched)
+
+
+def download_schedule_season(season: int) -> dict:
+    """
+    get the schedule for a whole season
+
+    this is thousands of games: only use it when the whole season is needed
+    """
+
+    return download_schedule(f"{season}-01-01", f"{season}-12-31")
+
+
+def download_season_games(season: int, game_type="R") -> dict:
+    """
+    get every game of one type (default: regular season) in a season, league-wide
+    """
+
+    url_str_sched = _MLB_SEASON_GAMES_FORMAT_STRING % (season, game_type)
+    return download_json_url(url_str_sched)
+
+
+def download_schedule_linescores(start_date: str, end_date=None) -> dict:
+    """
+    get the schedule for a date (or date range), hydrated for linescores
+
+    every game entry carries its linescore, decisions, teams, and venue, so a
+    whole slate of linescores can be rendered from this one request
+    """
+
+    if end_date is None:
+        end_date = start_date
+
+    url_str_sched = _MLB_SCHEDULE_LINESCORE_FORMAT_STRING % (start_date, end_date)
+    return download_json_url(url_str_sched)
+
+
+def get_fetch_engine(engine=None):
+    """
+    get the engine to run async downloads on (the shared one, by default)
+
+    imported here so asyncio only loads once something downloads concurrently
+    """
+
+    from crackerjack.tools_fetch import get_default_engine
+
+    return engine if engine is not None else get_default_engine()
+
+
+async def download_json_url_async(
+    url_str: str, debug_file_loader=None, use_cache=True, engine=None
+):
+    """download_json_url, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(
+        download_json_url,
+        url_str,
+        debug_file_loader=debug_file_loader,
+        use_cache=use_cache,
+    )
+
+
+async def download_game_data_async(gamepk: int, debug=False, engine=None):
+    """download_game_data, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(download_game_data, gamepk, debug=debug)
+
+
+async def download_game_linescore_data_async(gamepk: int, engine=None):
+    """download_game_linescore_data, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(download_game_linescore_data, gamepk)
+
+
+async def download_schedule_async(start_date: str, end_date=None, engine=None):
+    """download_schedule, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(download_schedule, start_date, end_date)
+
+
+async def download_season_games_async(season: int, game_type="R", engine=None):
+    """download_season_games, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(download_season_games, season, game_type)
+
+
+async def download_schedule_linescores_async(
+    start_date: str, end_date=None, engine=None
+):
+    """download_schedule_linescores, run on the fetch engine"""
+    return await get_fetch_engine(engine).run(
+        download_schedule_linescores, start_date, end_date
+    )
+
+
+async def download_games_data_async(
+    gamepk_list: list[int], debug=False, engine=None
+) -> list:
+    """
+    get many games' json concurrently, in the order given
+
+    a game that fails or times out comes back as None
+    """
+
+    return await get_fetch_engine(engine).run_all(
+        [(download_game_data, gamepk, debug) for gamepk in gamepk_list]
+    )
+
+
+def download_games_data(gamepk_list: list[int], debug=False, engine=None) -> list:
+    """
+    get many games' json concurrently, in the order given, from blocking code
+
+    the total time is about that of the slowest few games rather than the sum
+    """
+
+    return get_fetch_engine(engine).run_all_sync(
+        [(download_game_data, gamepk, debug) for gamepk in gamepk_list]
+    )
+
+
+def has_linescore_schedule(data_sched_game: dict) -> bool:
+    """
+    check if a hydrated schedule entry has everything needed for a linescore
+    """
+
+    if "innings" not in data_sched_game.get("linescore", {}):
+        return False
+    if "name" not in data_sched_game.get("venue", {}):
+        return False
+    for key in ("away", "home"):
+        data_team = data_sched_game.get("teams", {}).get(key, {}).get("team", {})
+        for field in ("teamName", "franchiseName", "shortName", "abbreviation"):
+            if field not in data_team:
+                return False
+    return True
+
+
 def extract_venue_name(data_game: dict):
     """
     give a game data dict and get the venue name for printing
@@ -262,8 +616,17 @@ def extract_decisions(data_game: dict):
     if "decisions" not in data_liveData:
         return (wp, lp, sv)
 
-    # if they are, hold their data in a useful config
-    data_decisions = data_liveData["decisions"]
+    return build_decisions(data_liveData["decisions"])
+
+
+def build_decisions(data_decisions: dict) -> dict:
+    """
+    turn a decisions node (feed or schedule) into a pitching decision dict
+    """
+
+    wp = None
+    lp = None
+    sv = None
 
     # for each key, if it exists, extract player name into var
     # assume last token is last name
@@ -280,16 +643,41 @@ def extract_decisions(data_game: dict):
     return decision_dict
 
 
-def extract_linescore_data(data_game: dict) -> dict:
+def extract_venue_name_schedule(data_sched_game: dict):
+    """
+    give a hydrated schedule entry and get the venue name for printing
+    """
+
+    assert "venue" in data_sched_game
+    assert "name" in data_sched_game["venue"]
+
+    return data_sched_game["venue"]["name"]
+
+
+def extract_decisions_schedule(data_sched_game: dict):
+    """
+    give a hydrated schedule entry and get the pitching decision
+    """
+
+    # if no decisions are posted, dump all Nones
+    if "decisions" not in data_sched_game:
+        return (None, None, None)
+
+    return build_decisions(data_sched_game["decisions"])
+
+
+def extract_linescore_data(data_game: dict) -> MappingProxyType:
     """
     give a game data dict and get the linescore data
+
+    this is a read-only view into the game data, not a copy
     """
 
     assert "liveData" in data_game
     data_liveData = data_game["liveData"]
 
     assert "linescore" in data_liveData
-    linescore = copy.deepcopy(data_liveData["linescore"])
+    linescore = MappingProxyType(data_liveData["linescore"])
 
     return linescore
 
@@ -308,19 +696,41 @@ def extract_teams_data(data_game: dict) -> dict[str:Team]:
     teams = {}
     for key in ("away", "home"):
         assert key in data_teams
-        data_team = data_teams[key]
-        teamName = data_team["teamName"]
-        locationName = data_team["franchiseName"]  # not! data_team["locationName"]
-        shortName = data_team["shortName"]
-        abbreviation = data_team["abbreviation"]
-
-        teams[key] = Team(
-            locationName, teamName, shortName, abbreviation, key == "home"
-        )
+        teams[key] = build_team(data_teams[key], key == "home")
+
+    return teams
+
+
+def extract_teams_data_schedule(data_sched_game: dict) -> dict[str:Team]:
+    """
+    strip and store the basic data for a team from a hydrated schedule entry
+    """
+
+    assert "teams" in data_sched_game
+    data_teams = data_sched_game["teams"]
+
+    teams = {}
+    for key in ("away", "home"):
+        assert key in data_teams
+        assert "team" in data_teams[key]
+        teams[key] = build_team(data_teams[key]["team"], key == "home")
 
     return teams
 
 
+def build_team(data_team: dict, is_home: bool) -> Team:
+    """
+    turn a team node (feed or hydrated schedule) into a Team
+    """
+
+    teamName = data_team["teamName"]
+    locationName = data_team["franchiseName"]  # not! data_team["locationName"]
+    shortName = data_team["shortName"]
+    abbreviation = data_team["abbreviation"]
+
+    return Team(locationName, teamName, shortName, abbreviation, is_home)
+
+
 def extract_linescore_innings(data_game: dict):
     """
     get the processed innings data from some game_data
@@ -328,6 +738,24 @@ def extract_linescore_innings(data_game: dict):
 
     data_linescore = extract_linescore_data(data_game)  # get the linescore data
 
+    return build_linescore_innings(data_linescore)
+
+
+def extract_linescore_innings_schedule(data_sched_game: dict):
+    """
+    get the processed innings data from a hydrated schedule entry
+    """
+
+    assert "linescore" in data_sched_game
+
+    return build_linescore_innings(data_sched_game["linescore"])
+
+
+def build_linescore_innings(data_linescore: dict):
+    """
+    turn a linescore node (feed or schedule) into a list of LineScoreInning
+    """
+
     lsi_list = list()
 
     assert "innings" in data_linescore
@@ -0,0 +1,195 @@
+import os
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+
+from colorama import Fore
+
+# the colors renderers use, as escape codes or (for plain output) nothing
+Palette = namedtuple("Palette", ["CYAN", "GREEN", "RED", "WHITE", "RESET"])
+_PALETTE_COLOR = Palette(Fore.CYAN, Fore.GREEN, Fore.RED, Fore.WHITE, Fore.RESET)
+_PALETTE_PLAIN = Palette("", "", "", "", "")
+
+_use_color = None  # None: decide by where the output is going
+
+
+class OutputSink(object):
+    """
+    collect rendered output, and hand it off all at once on flush
+
+    renderers write lines (or raw text) to a sink instead of printing them, so
+    a whole screen goes out in one write, and where it goes (the terminal, a
+    file, a list in memory) is up to the caller
+    """
+
+    _chunks: list[str]
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, text: str):
+        """write raw text, with no newline added"""
+        self._chunks.append(text)
+
+    def write_line(self, line=""):
+        """write one line, like print(line)"""
+        self._chunks.append(str(line) + "\n")
+
+    def write_lines(self, lines):
+        """write many lines, like [print(line) for line in lines]"""
+        self._chunks.extend([str(line) + "\n" for line in lines])
+
+    def flush(self):
+        """send everything written so far on to its destination"""
+        if not self._chunks:
+            return
+        text = "".join(self._chunks)
+        self._chunks = []
+        self._emit(text)
+
+    def _emit(self, text: str):
+        raise NotImplementedError("OutputSink subclasses must say where text goes.")
+
+    def isatty(self) -> bool:
+        """flag for if output ends up on a terminal"""
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+
+class StdoutSink(OutputSink):
+    """
+    write to standard output (or another text stream), one write per flush
+    """
+
+    def __init__(self, stream=None):
+        super().__init__()
+        self._stream = stream
+
+    def _emit(self, text: str):
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def isatty(self) -> bool:
+        stream = self._stream if self._stream is not None else sys.stdout
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+
+class CollectorSink(OutputSink):
+    """
+    keep everything flushed in memory, e.g. to check a renderer's output
+    """
+
+    _collected: list[str]
+
+    def __init__(self):
+        super().__init__()
+        self._collected = []
+
+    def _emit(self, text: str):
+        self._collected.append(text)
+
+    def getvalue(self) -> str:
+        """get everything written so far, flushed or not"""
+        return "".join(self._collected) + "".join(self._chunks)
+
+    @property
+    def lines(self) -> list[str]:
+        """everything written so far, split into lines"""
+        return self.getvalue().splitlines()
+
+
+class FileSink(OutputSink):
+    """
+    write to a file, opened on the first flush and kept open until closed
+    """
+
+    def __init__(self, path, mode="w", encoding="utf-8"):
+        super().__init__()
+        self._path = path
+        self._mode = mode
+        self._encoding = encoding
+        self._file = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def _emit(self, text: str):
+        if self._file is None:
+            self._file = open(self._path, self._mode, encoding=self._encoding)
+        self._file.write(text)
+        self._file.flush()
+
+    def close(self):
+        """flush what's left and close the file"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def set_use_color(use_color=None):
+    """
+    turn colored output on (True) or off (False), or back to automatic (None)
+    """
+    global _use_color
+    _use_color = use_color
+
+
+def get_use_color(sink=None) -> bool:
+    """
+    decide if output should be colored
+
+    an explicit set_use_color wins; otherwise color is off if NO_COLOR is set,
+    and on only if the sink (or stdout, without one) is a terminal
+    """
+
+    if _use_color is not None:
+        return _use_color
+    if os.environ.get("NO_COLOR"):
+        return False
+    if sink is not None:
+        return sink.isatty()
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def get_palette(use_color=True) -> Palette:
+    """get the color codes to draw with, which are all empty without color"""
+    return _PALETTE_COLOR if use_color else _PALETTE_PLAIN
+
+
+@contextmanager
+def open_screen(sink=None):
+    """
+    get a sink to render one screen to
+
+    if the caller gave a sink, it's used as is and the caller decides when to
+    flush; otherwise a stdout sink is made and flushed once the screen is done
+    """
+
+    if sink is not None:
+        yield sink
+        return
+
+    sink = StdoutSink()
+    try:
+        yield sink
+    finally:
+        sink.flush()
@@ -0,0 +1,245 @@
+import http.client
+import random
+import threading
+import time
+import urllib.error
+
+_POLICY_MAX_RETRIES = 3  # tries after the first, for failures worth retrying
+_POLICY_BACKOFF_BASE = 0.5  # seconds; the backoff cap doubles every retry
+_POLICY_BACKOFF_MAX = 8.0  # seconds
+_POLICY_RATE = 10.0  # requests per second, sustained, across all threads
+_POLICY_BURST = 20  # requests that can go out at once after a quiet spell
+_BREAKER_FAILURE_THRESHOLD = 5  # failures in a row before we stop trying
+_BREAKER_RESET_TIMEOUT = 30.0  # seconds to wait before trying again
+
+# statuses that mean "try again later" rather than "that's wrong"
+_HTTP_STATUS_RETRYABLE = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(Exception):
+    """raised instead of making a request while the API is marked as down"""
+
+
+class TokenBucket(object):
+    """
+    limit the rate of requests, shared between threads
+
+    the bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second; every request takes one token, waiting for it if the bucket's empty
+    """
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _time_last: float
+
+    def __init__(self, rate=_POLICY_RATE, burst=_POLICY_BURST):
+        assert rate > 0
+        assert burst >= 1
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._time_last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def burst(self):
+        return self._burst
+
+    def acquire(self):
+        """take a token, waiting until there is one"""
+        while True:
+            with self._lock:
+                time_now = time.monotonic()
+                self._tokens = min(
+                    self._burst,
+                    self._tokens + (time_now - self._time_last) * self._rate,
+                )
+                self._time_last = time_now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time_wait = (1 - self._tokens) / self._rate
+            time.sleep(time_wait)  # sleep without holding up other threads
+
+
+class CircuitBreaker(object):
+    """
+    stop making requests for a while once too many fail in a row
+
+    closed: requests go out as usual. open: after `failure_threshold`
+    failures in a row, requests fail fast until `reset_timeout` has passed.
+    half-open: then one trial request goes out, and its result closes the
+    breaker again or re-opens it.
+    """
+
+    _failure_threshold: int
+    _reset_timeout: float
+    _failure_count: int
+    _time_opened: float
+
+    def __init__(
+        self,
+        failure_threshold=_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=_BREAKER_RESET_TIMEOUT,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failure_count = 0
+        self._time_opened = None
+        self._trial_out = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open', or 'half-open'"""
+        with self._lock:
+            return self._get_state()
+
+    def _get_state(self) -> str:
+        if self._time_opened is None:
+            return "closed"
+        if time.monotonic() - self._time_opened < self._reset_timeout:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        """check if a request may go out now"""
+        with self._lock:
+            state = self._get_state()
+            if state == "closed":
+                return True
+            if (state == "half-open") and not self._trial_out:
+                self._trial_out = True  # let exactly one trial request through
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failure_count = 0
+            self._time_opened = None
+            self._trial_out = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failure_count += 1
+            if self._trial_out or (self._failure_count >= self._failure_threshold):
+                self._time_opened = time.monotonic()
+            self._trial_out = False
+
+    def record_interrupted(self):
+        """let another trial through: an interrupted request says nothing"""
+        with self._lock:
+            self._trial_out = False
+
+
+def is_retryable(e: Exception) -> bool:
+    """check if a failed request is worth trying again"""
+    if isinstance(e, urllib.error.HTTPError):
+        return e.code in _HTTP_STATUS_RETRYABLE
+    return isinstance(e, (OSError, http.client.HTTPException))  # timeouts, resets
+
+
+def get_retry_after(e: Exception):
+    """get how long (seconds) the server asked us to wait, if it said"""
+    if not isinstance(e, urllib.error.HTTPError) or (e.headers is None):
+        return None
+    headers = {k.lower(): v for k, v in dict(e.headers).items()}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None  # missing, or an HTTP date, which we don't bother with
+
+
+class RequestPolicy(object):
+    """
+    make requests politely: rate limited, retried, and behind a circuit breaker
+
+    failures worth retrying (timeouts, dropped connections, 429 and 5xx
+    statuses) are retried with exponential backoff and full jitter, honoring
+    the server's Retry-After; anything else is raised right away
+    """
+
+    _max_retries: int
+    _backoff_base: float
+    _backoff_max: float
+    _bucket: TokenBucket
+    _breaker: CircuitBreaker
+
+    def __init__(
+        self,
+        max_retries=_POLICY_MAX_RETRIES,
+        backoff_base=_POLICY_BACKOFF_BASE,
+        backoff_max=_POLICY_BACKOFF_MAX,
+        bucket=None,
+        breaker=None,
+    ):
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._bucket = bucket if bucket is not None else TokenBucket()
+        self._breaker = breaker if breaker is not None else CircuitBreaker()
+
+    @property
+    def bucket(self):
+        return self._bucket
+
+    @property
+    def breaker(self):
+        return self._breaker
+
+    def get_backoff(self, idx_retry: int) -> float:
+        """get a (jittered) time to wait before a retry"""
+        cap = min(self._backoff_max, self._backoff_base * 2**idx_retry)
+        return random.uniform(0, cap)
+
+    def call(self, func, *args, **kwargs):
+        """
+        make a request through the policy, returning what `func` returns
+
+        raises CircuitOpenError if the API is marked as down, or the last
+        error if every try failed
+        """
+
+        for idx_retry in range(self._max_retries + 1):
+            if not self._breaker.allow():
+                raise CircuitOpenError("the API looks down; not trying for a bit")
+            try:
+                self._bucket.acquire()
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    self._breaker.record_success()  # the API answered, just "no"
+                    raise
+                self._breaker.record_failure()
+                if idx_retry == self._max_retries:
+                    raise
+                time_wait = self.get_backoff(idx_retry)
+                retry_after = get_retry_after(e)
+                if retry_after is not None:
+                    time_wait = max(time_wait, min(retry_after, self._backoff_max))
+                time.sleep(time_wait)
+                continue
+            except BaseException:
+                self._breaker.record_interrupted()  # e.g. KeyboardInterrupt
+                raise
+
+            self._breaker.record_success()
+            return result
+
+
+_default_policy = None
+_default_policy_lock = threading.Lock()
+
+
+def get_default_policy() -> RequestPolicy:
+    """get the request policy shared by the whole package"""
+    global _default_policy
+    with _default_policy_lock:
+        if _default_policy is None:
+            _default_policy = RequestPolicy()
+        return _default_policy
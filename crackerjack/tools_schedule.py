@@ -0,0 +1,201 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+import crackerjack.team_lookup
+
+# the buckets games get sorted into, and the coded game states that go in each
+_SCHEDULE_BUCKETS = (
+    "scheduled",
+    "imminent",
+    "cancelled",
+    "postponed",
+    "inprogress",
+    "completed",
+)
+_CODEDGAMESTATE_TO_BUCKET = {
+    "F": "completed",  # final
+    "O": "completed",  # over (e.g. called early)
+    "C": "cancelled",
+    "D": "postponed",
+    "P": "imminent",  # pre-game
+    "S": "scheduled",
+    "I": "inprogress",
+    "U": "inprogress",  # suspended
+}
+_CODEDGAMESTATE_TO_BUCKET_INDEX = {
+    k: _SCHEDULE_BUCKETS.index(v) for k, v in _CODEDGAMESTATE_TO_BUCKET.items()
+}
+_BUCKET_NONE = -1  # no coded game state given
+
+
+def get_bucket_index(codedGameState) -> int:
+    """get the index in _SCHEDULE_BUCKETS for a coded game state"""
+    if codedGameState is None:
+        return _BUCKET_NONE
+    if codedGameState not in _CODEDGAMESTATE_TO_BUCKET_INDEX:
+        raise NotImplementedError(f"codedGameState: {codedGameState} not yet handled.")
+    return _CODEDGAMESTATE_TO_BUCKET_INDEX[codedGameState]
+
+
+def is_completed(codedGameState) -> bool:
+    """check if a coded game state means the game is over"""
+    return _CODEDGAMESTATE_TO_BUCKET.get(codedGameState) == "completed"
+
+
+def get_team_abbrev(team_id: int) -> str:
+    """get the three letter code for a team id, or XXX if we don't know it"""
+    if team_id in crackerjack.team_lookup.team_list:
+        return crackerjack.team_lookup.team_list[team_id].get("abbreviation")
+    return "XXX"  # DEBUG!!!!!
+
+
+class Schedule(object):
+    """
+    store a parsed schedule, indexed by date
+
+    the schedule payload is walked once: games are kept in flat arrays (game pk,
+    team ids, bucket index) grouped by date, and dates are kept sorted as
+    ordinals so a date or a date range is found by bisection.
+    """
+
+    _start_date: str
+    _end_date: str
+    _date_strs: list[str]
+    _date_ordinals: list[int]
+    _date_offsets: array  # game index where each date starts, plus the end
+    _gamePk: array
+    _teamID_away: array
+    _teamID_home: array
+    _bucket: array
+
+    def __init__(self, sched_data: dict, start_date=None, end_date=None):
+        self._start_date = start_date
+        self._end_date = end_date
+        self._date_strs = []
+        self._date_ordinals = []
+        self._date_offsets = array("l", [0])
+        self._gamePk = array("q")
+        self._teamID_away = array("l")
+        self._teamID_home = array("l")
+        self._bucket = array("b")
+
+        for date_data in sorted(sched_data["dates"], key=lambda v: v["date"]):
+            date_of_games = date_data["date"]
+            self._date_strs.append(date_of_games)
+            self._date_ordinals.append(date.fromisoformat(date_of_games).toordinal())
+
+            for game in date_data["games"]:
+                status = game.get("status")
+                codedGameState = (
+                    status.get("codedGameState") if status is not None else None
+                )
+                self._gamePk.append(game.get("gamePk"))
+                self._teamID_away.append(int(game["teams"]["away"]["team"]["id"]))
+                self._teamID_home.append(int(game["teams"]["home"]["team"]["id"]))
+                self._bucket.append(get_bucket_index(codedGameState))
+
+            self._date_offsets.append(len(self._gamePk))
+
+        # if we weren't told what span was asked for, assume just what's here
+        if (self._start_date is None) and self._date_strs:
+            self._start_date = self._date_strs[0]
+        if (self._end_date is None) and self._date_strs:
+            self._end_date = self._date_strs[-1]
+
+    @property
+    def dates(self) -> list[str]:
+        """the dates in the schedule, sorted, as '2023-01-01' strings"""
+        return list(self._date_strs)
+
+    def _find_date(self, date_str: str) -> int:
+        """get the index of a date, or -1 if it's not in the schedule"""
+        ordinal = date.fromisoformat(date_str).toordinal()
+        idx_date = bisect_left(self._date_ordinals, ordinal)
+        if (idx_date < len(self._date_ordinals)) and (
+            self._date_ordinals[idx_date] == ordinal
+        ):
+            return idx_date
+        return -1
+
+    def get_dates_between(self, start_date: str, end_date: str) -> list[str]:
+        """get the schedule's dates within an inclusive date range"""
+        idx_start = bisect_left(
+            self._date_ordinals, date.fromisoformat(start_date).toordinal()
+        )
+        idx_end = bisect_right(
+            self._date_ordinals, date.fromisoformat(end_date).toordinal()
+        )
+        return self._date_strs[idx_start:idx_end]
+
+    def covers(self, start_date: str, end_date: str) -> bool:
+        """check if this schedule was fetched for a span holding a date range"""
+        if (self._start_date is None) or (self._end_date is None):
+            return False
+        return (
+            date.fromisoformat(self._start_date) <= date.fromisoformat(start_date)
+        ) and (date.fromisoformat(end_date) <= date.fromisoformat(self._end_date))
+
+    def get_gamecount(self, date_str: str) -> dict[str:int]:
+        """get the total number of games on a date, and how many in each bucket"""
+        gamecount = {"total": 0}
+        gamecount.update({bucket: 0 for bucket in _SCHEDULE_BUCKETS})
+        idx_date = self._find_date(date_str)
+        if idx_date < 0:
+            return gamecount
+        for idx_game in range(
+            self._date_offsets[idx_date], self._date_offsets[idx_date + 1]
+        ):
+            gamecount["total"] += 1
+            if self._bucket[idx_game] != _BUCKET_NONE:
+                gamecount[_SCHEDULE_BUCKETS[self._bucket[idx_game]]] += 1
+        return gamecount
+
+    def get_games(self, date_str: str, with_summary=False):
+        """
+        get the games on a date, sorted into buckets by game state
+
+        games are given as game pks, or as ("AWY @ HOM", game pk) tuples with
+        `with_summary`; returns None if the date isn't in the schedule
+        """
+
+        idx_date = self._find_date(date_str)
+        if idx_date < 0:
+            return None
+
+        games_thisday = {bucket: [] for bucket in _SCHEDULE_BUCKETS}
+        for idx_game in range(
+            self._date_offsets[idx_date], self._date_offsets[idx_date + 1]
+        ):
+            if self._bucket[idx_game] == _BUCKET_NONE:
+                continue
+            gamePk = self._gamePk[idx_game]
+            if with_summary:
+                game_summary_string = (
+                    f"{get_team_abbrev(self._teamID_away[idx_game])} @ "
+                    + f"{get_team_abbrev(self._teamID_home[idx_game])}"
+                )
+                gamePk = (game_summary_string, gamePk)
+            games_thisday[_SCHEDULE_BUCKETS[self._bucket[idx_game]]].append(gamePk)
+
+        return games_thisday
+
+    def get_games_completed(self, date_str: str, with_summary=False):
+        """get the games on a date if any are completed, otherwise None"""
+        games_thisday = self.get_games(date_str, with_summary=with_summary)
+        if (games_thisday is None) or (not games_thisday["completed"]):
+            return None
+        return games_thisday
+
+    def get_last_day_completed(self):
+        """get the latest date with a completed game, or None"""
+        idx_completed = _SCHEDULE_BUCKETS.index("completed")
+        for idx_date in range(len(self._date_strs) - 1, -1, -1):
+            if (
+                idx_completed
+                in self._bucket[
+                    self._date_offsets[idx_date] : self._date_offsets[idx_date + 1]
+                ]
+            ):
+                return self._date_strs[idx_date]
+        return None
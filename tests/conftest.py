@@ -0,0 +1,95 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import crackerjack.tools_cache as tools_cache
+import crackerjack.tools_http as tools_http
+import crackerjack.tools_policy as tools_policy
+
+
+class LocalServer(object):
+    """
+    serve canned responses from a local HTTP/1.1 server on a background thread
+
+    `routes` maps a path (query string included) to a function that takes the
+    request headers and returns (status, headers, body); every request's path
+    and headers are kept in `requests`
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        self._thread.start()
+
+    def url(self, path: str) -> str:
+        return "http://127.0.0.1:%d%s" % (self._server.server_address[1], path)
+
+    def count_requests(self, path: str) -> int:
+        with self._lock:
+            return sum(1 for path_request, _ in self.requests if path_request == path)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1  # send headers and body together
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append((self.path, dict(self.headers)))
+                respond = server.routes.get(self.path)
+                if respond is None:
+                    status, headers, body = 404, {}, b"not found"
+                else:
+                    status, headers, body = respond(self.headers)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                self.wfile.flush()
+
+        return Handler
+
+
+@pytest.fixture
+def local_server():
+    server = LocalServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def fresh_fetch_state(tmp_path, monkeypatch):
+    """give the fetch layer its own cache, client, and a quick-retrying policy"""
+    monkeypatch.setattr(
+        tools_cache, "_default_cache", tools_cache.ResponseCache(str(tmp_path))
+    )
+    monkeypatch.setattr(tools_cache, "_default_parsed_cache", tools_cache.ParsedCache())
+    monkeypatch.setattr(tools_http, "_default_client", tools_http.HTTPClient())
+    monkeypatch.setattr(
+        tools_policy,
+        "_default_policy",
+        tools_policy.RequestPolicy(
+            backoff_base=0.001,
+            bucket=tools_policy.TokenBucket(rate=1000, burst=1000),
+        ),
+    )
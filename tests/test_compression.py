@@ -0,0 +1,97 @@
+import gzip
+import http.client
+import json
+import os
+import zlib
+
+import pytest
+
+from crackerjack.tools_cache import ResponseCache
+from crackerjack.tools_http import HTTPClient
+from crackerjack.tools_mlbapi import download_json_url
+
+_BODY = json.dumps(
+    {"innings": [{"num": n, "runs": n % 3} for n in range(500)]}
+).encode()
+
+
+def compress_raw_deflate(body: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+_BODIES_ENCODED = {
+    "/gzip": ("gzip", gzip.compress(_BODY)),
+    "/deflate": ("deflate", zlib.compress(_BODY)),
+    "/deflate-raw": ("deflate", compress_raw_deflate(_BODY)),
+    "/gzip-broken": ("gzip", b"this isn't gzip"),
+}
+
+
+@pytest.fixture
+def encoding_server(local_server):
+    for path, (encoding, body) in _BODIES_ENCODED.items():
+        local_server.routes[path] = lambda headers, encoding=encoding, body=body: (
+            200,
+            {"Content-Encoding": encoding},
+            body,
+        )
+    local_server.routes["/plain"] = lambda headers: (200, {}, _BODY)
+    return local_server
+
+
+@pytest.mark.parametrize("path", ["/plain", "/gzip", "/deflate", "/deflate-raw"])
+def test_decodes_body(encoding_server, path):
+    client = HTTPClient()
+    result = client.get(encoding_server.url(path))
+    assert result.body == _BODY
+    _, headers = encoding_server.requests[-1]
+    assert "gzip" in headers["Accept-Encoding"]
+    client.close()
+
+
+def test_counts_bytes_on_the_wire(encoding_server):
+    client = HTTPClient()
+    client.get(encoding_server.url("/gzip"))
+    stats = client.stats
+    assert stats["bytes_body"] == len(_BODY)
+    assert stats["bytes_wire"] == len(_BODIES_ENCODED["/gzip"][1]) < len(_BODY)
+    client.close()
+
+
+def test_broken_body_raises_http_exception(encoding_server):
+    client = HTTPClient()
+    with pytest.raises(http.client.HTTPException):
+        client.get(encoding_server.url("/gzip-broken"))
+    client.close()
+
+
+def test_download_json_url_decodes(encoding_server, fresh_fetch_state):
+    assert download_json_url(encoding_server.url("/gzip")) == json.loads(_BODY)
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "lzma"])
+def test_cache_codec_round_trip(tmp_path, codec):
+    cache = ResponseCache(str(tmp_path), codec=codec)
+    cache.put("http://example/feed", _BODY, ttl=None)
+    assert cache.get("http://example/feed") == _BODY
+
+    size_entry = os.path.getsize(cache.get_entry_path("http://example/feed"))
+    if codec != "none":
+        assert size_entry < len(_BODY)
+
+
+def test_cache_reads_entries_written_with_another_codec(tmp_path):
+    ResponseCache(str(tmp_path), codec="lzma").put("http://example/feed", _BODY)
+    assert (
+        ResponseCache(str(tmp_path), codec="zlib").get("http://example/feed") == _BODY
+    )
+
+
+def test_cache_reads_entries_from_before_codecs(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    meta = {"url": "http://example/feed", "stored": 0.0, "ttl": None}
+    with open(cache.get_entry_path("http://example/feed"), "wb") as entry_file:
+        entry_file.write((json.dumps(meta) + "\n").encode("utf-8"))
+        entry_file.write(_BODY)
+    assert cache.get("http://example/feed") == _BODY
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crackerjack.tools_fetch import FetchEngine
+
+
+@pytest.fixture
+def make_engine():
+    engines = []
+
+    def make(**kwargs):
+        engines.append(FetchEngine(**kwargs))
+        return engines[-1]
+
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+def test_timeout_returns_none(make_engine, capsys):
+    engine = make_engine(timeout=0.1)
+
+    time_start = time.perf_counter()
+    assert engine.run_all_sync([(time.sleep, 1.0), (lambda: "ok",)]) == [None, "ok"]
+    assert time.perf_counter() - time_start < 0.5
+    assert "request timed out after 0.1 s: sleep(1.0,)" in capsys.readouterr().err
+
+
+def test_timed_out_calls_keep_their_slots(make_engine):
+    engine = make_engine(max_concurrency=2, timeout=0.2)
+
+    async def time_out_then_check():
+        assert await engine.run(time.sleep, 0.6) is None
+        semaphore = engine._get_semaphore()
+        assert not semaphore.locked()  # one of two slots is still held
+        assert await engine.run(time.sleep, 0.6) is None
+        assert semaphore.locked()
+        await asyncio.sleep(0.6)
+        assert not semaphore.locked()
+
+    asyncio.run(time_out_then_check())
+
+
+def test_timeout_starts_when_a_worker_picks_the_call_up(make_engine):
+    engine = make_engine(max_concurrency=2, timeout=0.2)
+
+    assert engine.run_all_sync([(time.sleep, 0.6), (time.sleep, 0.6)]) == [None, None]
+    # both workers are still asleep: this call has to queue for one of them
+    assert engine.run_all_sync([(lambda: "ok",)]) == ["ok"]
+
+
+def test_cancel_drops_calls_not_started(make_engine):
+    engine = make_engine(max_concurrency=1, timeout=5.0)
+    release = threading.Event()
+    ran = []
+
+    async def cancel_midway():
+        task = asyncio.ensure_future(
+            engine.run_all([(release.wait,), (ran.append, "second")])
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_midway())
+    release.set()
+    assert engine.run_all_sync([(lambda: "ok",)]) == ["ok"]  # runs after the first
+    assert ran == []
+
+
+def test_failed_call_comes_back_as_none(make_engine, capsys):
+    engine = make_engine()
+
+    def fail():
+        raise ValueError("boom")
+
+    assert engine.run_all_sync([(fail,), (lambda: "ok",)]) == [None, "ok"]
+    assert "request failed: ValueError('boom'): fail()" in capsys.readouterr().err
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# cold-start budget (microseconds, cumulative) for the crackerjack entry point;
+# it takes ~15 ms here, so this leaves plenty of room for slow machines
+_IMPORT_BUDGET_CLI_TOOL = 200_000
+
+# heavy dependencies that only load once the feature that needs them is used
+_IMPORTS_DEFERRED = ("numpy", "pandas", "inquirer")
+
+
+def get_import_times(module_name: str) -> dict:
+    """import a module in a fresh interpreter, get {module: cumulative us}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module_name],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, time_cumulative, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(time_cumulative)
+    return import_times
+
+
+def test_cli_tool_import_budget():
+    import_times = get_import_times("crackerjack.cli_tool")
+    assert import_times["crackerjack.cli_tool"] < _IMPORT_BUDGET_CLI_TOOL
+
+
+def test_cli_tool_defers_heavy_imports():
+    import_times = get_import_times("crackerjack.cli_tool")
+    for name in _IMPORTS_DEFERRED:
+        assert name not in import_times, "%s imported at startup" % name
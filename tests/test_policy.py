@@ -0,0 +1,84 @@
+import json
+import time
+
+import pytest
+
+import crackerjack.tools_policy as tools_policy
+from crackerjack.tools_mlbapi import download_json_url
+
+
+def respond_flaky(count_failures: int, retry_after=None):
+    """respond 503 (with a Retry-After, if given) a few times, then with json"""
+    state = {"count": 0}
+
+    def respond(headers):
+        state["count"] += 1
+        if state["count"] <= count_failures:
+            headers_response = {"Retry-After": retry_after} if retry_after else {}
+            return 503, headers_response, b"down"
+        return 200, {"Content-Type": "application/json"}, json.dumps({"ok": 1}).encode()
+
+    return respond
+
+
+def test_retries_503_then_succeeds(local_server, fresh_fetch_state):
+    local_server.routes["/flaky"] = respond_flaky(2)
+    data = download_json_url(local_server.url("/flaky"), use_cache=False)
+    assert data == {"ok": 1}
+    assert local_server.count_requests("/flaky") == 3
+
+
+def test_honors_retry_after(local_server, fresh_fetch_state):
+    local_server.routes["/flaky"] = respond_flaky(2, retry_after="0.2")
+    time_start = time.monotonic()
+    data = download_json_url(local_server.url("/flaky"), use_cache=False)
+    assert data == {"ok": 1}
+    assert time.monotonic() - time_start >= 0.4  # waited 0.2 s before each retry
+
+
+def test_gives_up_after_max_retries(local_server, fresh_fetch_state):
+    local_server.routes["/down"] = respond_flaky(100)
+    assert download_json_url(local_server.url("/down"), use_cache=False) is None
+    assert local_server.count_requests("/down") == 1 + tools_policy._POLICY_MAX_RETRIES
+
+
+def test_does_not_retry_404(local_server, fresh_fetch_state):
+    assert download_json_url(local_server.url("/missing"), use_cache=False) is None
+    assert local_server.count_requests("/missing") == 1
+
+
+def test_breaker_opens_and_fails_fast(local_server, fresh_fetch_state):
+    local_server.routes["/down"] = respond_flaky(100)
+    policy = tools_policy.get_default_policy()
+
+    download_json_url(local_server.url("/down"), use_cache=False)  # 4 failures
+    download_json_url(local_server.url("/down"), use_cache=False)  # 5th opens it
+    assert policy.breaker.state == "open"
+
+    count_before = local_server.count_requests("/down")
+    assert download_json_url(local_server.url("/down"), use_cache=False) is None
+    assert local_server.count_requests("/down") == count_before  # never sent
+
+
+def test_token_bucket_paces_requests():
+    bucket = tools_policy.TokenBucket(rate=100, burst=5)
+    time_start = time.monotonic()
+    for _ in range(25):
+        bucket.acquire()
+    assert time.monotonic() - time_start >= 0.19  # 20 tokens past the burst
+
+
+def test_interrupted_trial_frees_the_breaker():
+    breaker = tools_policy.CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    policy = tools_policy.RequestPolicy(breaker=breaker)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.state == "half-open"
+
+    def interrupt():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        policy.call(interrupt)
+    assert policy.call(lambda: "ok") == "ok"  # a new trial went out, and closed it
+    assert breaker.state == "closed"
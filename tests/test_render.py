@@ -0,0 +1,52 @@
+import os
+import re
+
+import pytest
+
+import crackerjack.boxscore as boxscore
+import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_output import CollectorSink, set_use_color
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# synthetic game feeds: a nine inning game and a twelve inning game
+_FIXTURE_GAMEPKS = (123456, 123457)
+
+# what the renderers printed for the fixtures before they were reworked, in color
+_RENDER_EXPECTED = os.path.join(_FIXTURES_DIR, "render_expected.txt")
+
+
+def strip_color(text: str) -> str:
+    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+
+
+@pytest.fixture
+def fixture_games(monkeypatch):
+    """have debug downloads load the fixture feeds"""
+    monkeypatch.setattr(tools_mlbapi, "_PKG_DIR", _FIXTURES_DIR)
+    yield
+    set_use_color(None)
+
+
+def render_fixture_games() -> str:
+    out = CollectorSink()
+    for gamePk in _FIXTURE_GAMEPKS:
+        for wide in (False, True):
+            boxscore.print_linescore(gamePk, debug=True, wide=wide, sink=out)
+            boxscore.do_box(gamePk, debug=True, wide=wide, sink=out)
+    return out.getvalue()
+
+
+def get_render_expected() -> str:
+    with open(_RENDER_EXPECTED, "r", encoding="utf-8", newline="") as expected_file:
+        return expected_file.read()
+
+
+def test_render_color(fixture_games):
+    set_use_color(True)
+    assert render_fixture_games() == get_render_expected()
+
+
+def test_render_plain(fixture_games):
+    set_use_color(False)
+    assert render_fixture_games() == strip_color(get_render_expected())
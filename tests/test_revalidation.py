@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_cache import get_default_cache, get_default_parsed_cache
+from crackerjack.tools_mlbapi import download_json_url
+
+_BODY = json.dumps({"records": list(range(100))}).encode()
+_ETAG = '"v1"'
+_LAST_MODIFIED = "Wed, 01 May 2024 00:00:00 GMT"
+
+
+def respond_etag(headers):
+    if headers.get("If-None-Match") == _ETAG:
+        return 304, {"ETag": _ETAG}, b""
+    return 200, {"ETag": _ETAG}, _BODY
+
+
+def respond_last_modified(headers):
+    if headers.get("If-Modified-Since") == _LAST_MODIFIED:
+        return 304, {}, b""
+    return 200, {"Last-Modified": _LAST_MODIFIED}, _BODY
+
+
+def respond_no_validators(headers):
+    return 200, {}, _BODY
+
+
+@pytest.fixture
+def always_stale(monkeypatch):
+    """every cached response expires right away, so each download revalidates"""
+    monkeypatch.setattr(tools_mlbapi, "get_cache_ttl", lambda url_str, data: 0)
+
+
+@pytest.mark.parametrize(
+    "respond, header_conditional",
+    [(respond_etag, "If-None-Match"), (respond_last_modified, "If-Modified-Since")],
+)
+def test_revalidates_with_304(
+    local_server, fresh_fetch_state, always_stale, respond, header_conditional
+):
+    local_server.routes["/feed"] = respond
+    url = local_server.url("/feed")
+
+    data_first = download_json_url(url)
+    data_second = download_json_url(url)
+
+    assert data_second is data_first  # the parsed object is reused
+    assert local_server.count_requests("/feed") == 2
+    _, headers_second = local_server.requests[-1]
+    assert header_conditional in headers_second
+    assert get_default_parsed_cache().stats == {"parsed": 1, "reused": 1}
+    assert get_default_cache().get_entry(url, allow_stale=True).body == _BODY
+
+
+def test_unchanged_body_is_not_parsed_again(
+    local_server, fresh_fetch_state, always_stale
+):
+    local_server.routes["/feed"] = respond_no_validators
+    url = local_server.url("/feed")
+
+    data_first = download_json_url(url)
+    data_second = download_json_url(url)
+
+    assert data_second is data_first
+    assert local_server.count_requests("/feed") == 2  # no validators: full body
+    assert get_default_parsed_cache().stats == {"parsed": 1, "reused": 1}
+
+
+def test_fresh_entry_is_not_requested_again(local_server, fresh_fetch_state):
+    local_server.routes["/feed"] = respond_etag
+    url = local_server.url("/feed")
+
+    download_json_url(url)
+    download_json_url(url)
+
+    assert local_server.count_requests("/feed") == 1
+    entry = get_default_cache().get_entry(url)
+    assert entry.validators == {"etag": _ETAG}
@@ -0,0 +1,49 @@
+import time
+
+import crackerjack.boxscore as boxscore
+import crackerjack.fetch_schedule as fetch_schedule
+import crackerjack.tools_mlbapi as tools_mlbapi
+
+
+def make_slate(gamePk_list, gamePk_hydrated) -> dict:
+    """a day's schedule of finished games, some with a linescore already in"""
+    games = []
+    for gamePk in gamePk_list:
+        game = {"gamePk": gamePk, "status": {"codedGameState": "F"}}
+        if gamePk in gamePk_hydrated:
+            game["linescore"] = "schedule %d" % gamePk
+        games.append(game)
+    games.append({"gamePk": 999, "status": {"codedGameState": "S"}})  # not played
+    return {"dates": [{"date": "2024-05-01", "games": games}]}
+
+
+def test_slate_fallbacks_download_together(monkeypatch):
+    gamePk_list = [101, 102, 103, 104, 105, 106]
+    sched_data = make_slate(gamePk_list, gamePk_hydrated={102, 105})
+
+    def download_linescore_parts(gamePk):
+        time.sleep(0.2)
+        return "download %d" % gamePk
+
+    monkeypatch.setattr(
+        tools_mlbapi, "download_schedule_linescores", lambda *args: sched_data
+    )
+    monkeypatch.setattr(
+        tools_mlbapi, "has_linescore_schedule", lambda game: "linescore" in game
+    )
+    monkeypatch.setattr(
+        boxscore, "extract_linescore_parts_schedule", lambda game: game["linescore"]
+    )
+    monkeypatch.setattr(boxscore, "download_linescore_parts", download_linescore_parts)
+
+    time_start = time.perf_counter()
+    slate = fetch_schedule.get_slate_linescore_parts("2024-05-01")
+    assert time.perf_counter() - time_start < 0.6  # not 4 x 0.2 s, one at a time
+    assert slate == [
+        (101, "download 101"),
+        (102, "schedule 102"),
+        (103, "download 103"),
+        (104, "download 104"),
+        (105, "schedule 105"),
+        (106, "download 106"),
+    ]
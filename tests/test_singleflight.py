@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_mlbapi import SingleFlight, download_json_url
+
+_COUNT_CALLERS = 10
+
+
+def respond_slowly(headers):
+    time.sleep(0.2)  # long enough for every caller to pile in
+    return 200, {"Content-Type": "application/json"}, b'{"ok": 1}'
+
+
+def test_concurrent_downloads_coalesce(local_server, fresh_fetch_state):
+    local_server.routes["/slow"] = respond_slowly
+    url = local_server.url("/slow")
+    stats_before = tools_mlbapi.get_singleflight_stats()
+
+    with ThreadPoolExecutor(_COUNT_CALLERS) as executor:
+        results = list(
+            executor.map(
+                lambda _: download_json_url(url, use_cache=False),
+                range(_COUNT_CALLERS),
+            )
+        )
+
+    stats_after = tools_mlbapi.get_singleflight_stats()
+    assert local_server.count_requests("/slow") == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == {"ok": 1}
+    assert stats_after["coalesced"] - stats_before["coalesced"] == _COUNT_CALLERS - 1
+    assert stats_after["in_flight"] == 0
+
+
+def test_sequential_downloads_do_not_coalesce(local_server, fresh_fetch_state):
+    local_server.routes["/slow"] = respond_slowly
+    for _ in range(2):
+        download_json_url(local_server.url("/slow"), use_cache=False)
+    assert local_server.count_requests("/slow") == 2
+
+
+def test_waiters_share_the_error():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as executor:
+        future_leader = executor.submit(flight.do, "key", fail)
+        started.wait()
+        future_waiter = executor.submit(flight.do, "key", fail)
+        for future in (future_leader, future_waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.stats == {"calls": 2, "coalesced": 1, "in_flight": 0}
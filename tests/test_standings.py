@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+import crackerjack.fetch_standings as fetch_standings
+import crackerjack.tools_mlbapi as tools_mlbapi
+from crackerjack.tools_output import CollectorSink
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# synthetic standings for both leagues, as one request returns them
+_STANDINGS_FIXTURE = os.path.join(_FIXTURES_DIR, "standings.json")
+
+# what the row-by-row renderers printed for the fixture: standings, then wildcard
+_STANDINGS_EXPECTED = os.path.join(_FIXTURES_DIR, "standings_expected.txt")
+
+
+@pytest.fixture
+def fixture_standings(monkeypatch):
+    """serve the fixture standings, starting from no snapshot"""
+    with open(_STANDINGS_FIXTURE, "r", encoding="utf-8") as standings_file:
+        standings_data = json.load(standings_file)
+    urls_requested = []
+
+    def download_json_url(url_str, **kwargs):
+        urls_requested.append(url_str)
+        return standings_data
+
+    monkeypatch.setattr(tools_mlbapi, "download_json_url", download_json_url)
+    monkeypatch.setattr(fetch_standings, "_standings_snapshot", None)
+    return urls_requested
+
+
+def get_standings_expected() -> str:
+    with open(_STANDINGS_EXPECTED, "r", encoding="utf-8", newline="") as expected_file:
+        return expected_file.read()
+
+
+def test_render_standings_and_wildcard(fixture_standings):
+    out = CollectorSink()
+    fetch_standings.run_standings(sink=out)
+    fetch_standings.run_wildcard(sink=out)
+    assert out.getvalue() == get_standings_expected()
+    assert len(fixture_standings) == 1  # both screens came from one snapshot
+
+
+def test_standings_unavailable(monkeypatch):
+    monkeypatch.setattr(tools_mlbapi, "download_json_url", lambda *a, **kw: None)
+    monkeypatch.setattr(fetch_standings, "_standings_snapshot", None)
+    out = CollectorSink()
+    fetch_standings.run_standings(sink=out)
+    assert "Standings aren't available right now" in out.getvalue()